@@ -19,15 +19,21 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from .artifact_uploader import *
 from .base_block_script import *
 from .base_point_azel import *
 from .base_script_test_case import *
+from .dry_run import *
+from .group_state import *
 from .mute_alarms import *
 from .pause_queue import *
 from .run_command import *
+from .script_benchmark import *
+from .script_progress import *
 from .set_summary_state import *
 from .sleep import *
 from .system_wide_shutdown import *
+from .topic_metadata import *
 from .utils import *
 
 try:
@@ -0,0 +1,212 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["ArtifactUploader"]
+
+import asyncio
+import io
+import logging
+import typing
+
+from lsst.ts import salobj
+
+from .utils import get_s3_bucket
+
+
+class ArtifactUploader:
+    """Upload artifacts to the Large File Annex in the background.
+
+    Artifacts, e.g. timing reports, resolved configurations or lists of
+    visits, are queued with `upload`, which never waits for the upload, and
+    uploaded one at a time by a background task. Failed uploads are retried
+    with exponential backoff.
+
+    Parameters
+    ----------
+    s3bucket : `salobj.AsyncS3Bucket`, optional
+        Bucket to upload artifacts to. If not given use `get_s3_bucket`.
+    log : `logging.Logger`, optional
+        Logger.
+    max_queue_size : `int`, optional
+        Maximum number of artifacts waiting to be uploaded. Artifacts
+        queued when the queue is full are dropped.
+    max_attempts : `int`, optional
+        Maximum number of attempts to upload an artifact.
+    backoff : `float`, optional
+        Time to wait before the first retry (sec). It doubles after every
+        failed attempt.
+
+    Attributes
+    ----------
+    uploaded : `list` [`str`]
+        Keys of the uploaded artifacts.
+    failed : `list` [`str`]
+        Keys of the artifacts that could not be uploaded.
+    n_dropped : `int`
+        Number of artifacts dropped because the queue was full.
+
+    Notes
+    -----
+    Payloads are uploaded with ``upload_fileobj``, which streams large
+    payloads in multipart chunks.
+    """
+
+    def __init__(
+        self,
+        s3bucket: typing.Optional[salobj.AsyncS3Bucket] = None,
+        log: typing.Optional[logging.Logger] = None,
+        max_queue_size: int = 10,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+    ) -> None:
+        self._s3bucket = s3bucket
+        self.log = (
+            logging.getLogger(type(self).__name__)
+            if log is None
+            else log.getChild(type(self).__name__)
+        )
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+
+        self.uploaded: typing.List[str] = []
+        self.failed: typing.List[str] = []
+        self.n_dropped = 0
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._upload_task: typing.Optional[asyncio.Task] = None
+
+    @property
+    def s3bucket(self) -> salobj.AsyncS3Bucket:
+        """Bucket to upload artifacts to."""
+        if self._s3bucket is None:
+            self._s3bucket = get_s3_bucket()
+        return self._s3bucket
+
+    @property
+    def n_pending(self) -> int:
+        """Number of artifacts waiting to be uploaded."""
+        return self._queue.qsize()
+
+    def upload(self, key: str, payload: typing.Union[bytes, str]) -> bool:
+        """Queue an artifact to be uploaded in the background.
+
+        Parameters
+        ----------
+        key : `str`
+            Key of the artifact in the bucket, e.g. from
+            `salobj.AsyncS3Bucket.make_key`.
+        payload : `bytes` or `str`
+            Artifact data. Strings are encoded as utf-8.
+
+        Returns
+        -------
+        queued : `bool`
+            True if the artifact was queued, False if it was dropped because
+            the queue is full.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        try:
+            self._queue.put_nowait((key, payload))
+        except asyncio.QueueFull:
+            self.n_dropped += 1
+            self.log.warning(
+                f"Upload queue full ({self._queue.maxsize} artifacts). "
+                f"Dropping {key}."
+            )
+            return False
+
+        if self._upload_task is None or self._upload_task.done():
+            self._upload_task = asyncio.create_task(self._upload_loop())
+        return True
+
+    async def drain(self, timeout: float) -> None:
+        """Wait for the queued artifacts to be uploaded and stop uploading.
+
+        Artifacts that are not uploaded within the timeout are abandoned.
+
+        Parameters
+        ----------
+        timeout : `float`
+            Maximum time to wait for the uploads (sec).
+        """
+        if self._upload_task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.log.warning(
+                f"Timed out after {timeout}s waiting for uploads; "
+                f"abandoning {self.n_pending} artifacts."
+            )
+        finally:
+            self._upload_task.cancel()
+            try:
+                await self._upload_task
+            except asyncio.CancelledError:
+                pass
+            self._upload_task = None
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self._queue.task_done()
+
+    async def _upload_loop(self) -> None:
+        """Upload queued artifacts until cancelled."""
+        while True:
+            key, payload = await self._queue.get()
+            try:
+                await self._upload_with_retries(key, payload)
+            finally:
+                self._queue.task_done()
+
+    async def _upload_with_retries(self, key: str, payload: bytes) -> None:
+        """Upload an artifact, retrying with exponential backoff.
+
+        Parameters
+        ----------
+        key : `str`
+            Key of the artifact in the bucket.
+        payload : `bytes`
+            Artifact data.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self.s3bucket.upload(fileobj=io.BytesIO(payload), key=key)
+            except Exception:
+                if attempt == self.max_attempts:
+                    self.log.exception(
+                        f"Failed to upload {key} after {attempt} attempts. Giving up."
+                    )
+                    self.failed.append(key)
+                    return
+                delay = self.backoff * 2 ** (attempt - 1)
+                self.log.warning(
+                    f"Failed to upload {key} (attempt {attempt} of "
+                    f"{self.max_attempts}). Retrying in {delay}s.",
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+            else:
+                self.log.debug(f"Uploaded {key} ({len(payload)} bytes).")
+                self.uploaded.append(key)
+                return
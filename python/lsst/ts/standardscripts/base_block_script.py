@@ -23,11 +23,15 @@ __all__ = ["BaseBlockScript"]
 
 import abc
 import contextlib
+import os
 import warnings
 
 import yaml
 from lsst.ts import salobj, utils
 
+from .artifact_uploader import ArtifactUploader
+from .script_progress import PROGRESS_DIR_ENV_VAR, ScriptProgress
+
 IMAGE_SERVER_URL = dict(
     tucson="http://comcam-mcm.tu.lsst.org",
     base="http://lsstcam-mcm.ls.lsst.org",
@@ -41,6 +45,21 @@ class BaseBlockScript(salobj.BaseScript, metaclass=abc.ABCMeta):
     This base class adds a default configuration with reason and program that
     can be provided when executing the script.
 
+    The class also keeps a progress record of the script execution. Subclasses
+    that execute in steps can call `save_progress` after each completed step
+    and check `is_step_completed` before executing one. When the script is
+    configured with ``resume: true``, steps completed in a previous,
+    interrupted, execution with the same program and configuration are
+    skipped. The record is only kept if the script is configured with
+    ``resume: true`` or the ``LSST_SCRIPT_PROGRESS_DIR`` environment variable
+    is set, so an execution that may need to be resumed must be configured
+    with ``resume: true`` from the start.
+
+    Subclasses can publish diagnostics to the Large File Annex with
+    `publish_artifact`, which uploads them in the background. Pending
+    uploads are drained in `cleanup`, for up to `artifact_upload_timeout`
+    seconds; subclasses that override `cleanup` must call it.
+
     Deprecated:
         This class is deprecated. BaseScript now supports block metadata
         directly.
@@ -71,6 +90,13 @@ class BaseBlockScript(salobj.BaseScript, metaclass=abc.ABCMeta):
 
         self.step_results = []
 
+        self.resume_from_progress = False
+        self.progress = None
+
+        self.artifact_uploader = ArtifactUploader(log=self.log)
+        # Maximum time to wait for artifact uploads in cleanup (sec).
+        self.artifact_upload_timeout = 10.0
+
     @classmethod
     def get_schema(cls):
         schema_yaml = """
@@ -91,6 +117,12 @@ class BaseBlockScript(salobj.BaseScript, metaclass=abc.ABCMeta):
             reason:
                 type: string
                 description: Reason for executing this script.
+            resume:
+                type: boolean
+                description: >-
+                    Resume a previous execution of this script with the same program and
+                    configuration, skipping the steps that were already completed?
+                default: false
             test_case:
                 type: object
                 description: Test case information.
@@ -145,6 +177,8 @@ class BaseBlockScript(salobj.BaseScript, metaclass=abc.ABCMeta):
             else None
         )
 
+        self.configure_progress(config)
+
         if self.program is not None:
             self.checkpoint_message = f"{type(self).__name__} {self.program} "
             self.obs_id = await self.get_obs_id()
@@ -153,6 +187,136 @@ class BaseBlockScript(salobj.BaseScript, metaclass=abc.ABCMeta):
             if self.reason is not None:
                 self.checkpoint_message += f" {self.reason}"
 
+    def configure_progress(self, config) -> None:
+        """Configure the progress record of the script execution.
+
+        If ``config.resume`` is `True`, load the progress of a previous
+        execution with the same program and configuration. The record of a
+        previous execution is only discarded when `run` starts, so
+        configuring a script that does not resume leaves it untouched.
+
+        The progress is not persisted, and ``self.progress`` is `None`, if
+        the script does not resume and the ``LSST_SCRIPT_PROGRESS_DIR``
+        environment variable is not set.
+
+        Parameters
+        ----------
+        config : `types.SimpleNamespace`
+            Script configuration, as defined by `schema`.
+        """
+        self.resume_from_progress = getattr(config, "resume", False)
+
+        if not self.resume_from_progress and PROGRESS_DIR_ENV_VAR not in os.environ:
+            self.progress = None
+            return
+
+        self.progress = ScriptProgress(
+            key=ScriptProgress.make_key(
+                script_name=type(self).__name__,
+                program=self.program,
+                config=vars(config),
+            ),
+            log=self.log,
+        )
+
+        if not self.resume_from_progress:
+            return
+
+        if self.progress.load():
+            self.log.info(
+                f"Resuming execution from {self.progress.path}; "
+                f"completed steps: {sorted(self.progress.completed_steps)}."
+            )
+        else:
+            self.log.warning(
+                "No progress record found for this configuration. "
+                "Starting from the beginning."
+            )
+
+    def is_step_completed(self, step: int) -> bool:
+        """Check if a step was completed in a previous execution.
+
+        Parameters
+        ----------
+        step : `int`
+            Step index.
+
+        Returns
+        -------
+        `bool`
+            `True` if the script is resuming and the step was completed.
+        """
+        return (
+            self.resume_from_progress
+            and self.progress is not None
+            and step in self.progress.completed_steps
+        )
+
+    def get_progress_state(self, name: str, default=None):
+        """Get a state value saved with the progress record.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the state value.
+        default : optional
+            Value to return if the state value is not available.
+        """
+        if self.progress is None:
+            return default
+        return self.progress.state.get(name, default)
+
+    def save_progress(self, step: int | None = None, **state) -> None:
+        """Save the progress of the script execution.
+
+        Failing to save the progress is logged but never interrupts the
+        script.
+
+        Parameters
+        ----------
+        step : `int`, optional
+            Step that was completed.
+        **state
+            State values required to resume the execution.
+        """
+        if self.progress is None:
+            return
+        try:
+            if not self.progress.group_id:
+                self.progress.group_id = self.group_id
+            self.progress.save(step, **state)
+        except Exception:
+            self.log.exception("Failed to save script progress. Ignoring.")
+
+    def publish_artifact(
+        self, generator: str, payload: bytes | str, suffix: str = ".json"
+    ) -> str:
+        """Upload an artifact to the Large File Annex in the background.
+
+        Parameters
+        ----------
+        generator : `str`
+            Artifact type, e.g. "focus_sweep_visits".
+        payload : `bytes` or `str`
+            Artifact data.
+        suffix : `str`, optional
+            Key suffix.
+
+        Returns
+        -------
+        key : `str`
+            Key of the artifact in the bucket.
+        """
+        key = salobj.AsyncS3Bucket.make_key(
+            salname=self.salinfo.name,
+            salindexname=self.salinfo.index,
+            generator=generator,
+            date=utils.astropy_time_from_tai_unix(utils.current_tai()),
+            suffix=suffix,
+        )
+        self.artifact_uploader.upload(key=key, payload=payload)
+        return key
+
     async def get_obs_id(self) -> str | None:
         """Get obs id from camera obs id server.
 
@@ -222,9 +386,21 @@ class BaseBlockScript(salobj.BaseScript, metaclass=abc.ABCMeta):
         """Override base script run to encapsulate execution with appropriate
         checkpoints.
         """
+        # Starting from scratch, discard the record of a previous execution.
+        if self.progress is not None and not self.resume_from_progress:
+            self.progress.reset()
+
         async with self.program_reason():
             await self.run_block()
 
+        # Execution completed, nothing to resume from.
+        if self.progress is not None:
+            self.progress.reset()
+
     @abc.abstractmethod
     async def run_block(self):
         raise NotImplementedError()
+
+    async def cleanup(self):
+        """Wait for the artifact uploads to finish."""
+        await self.artifact_uploader.drain(timeout=self.artifact_upload_timeout)
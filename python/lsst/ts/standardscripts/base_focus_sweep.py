@@ -238,54 +238,50 @@ class BaseFocusSweep(BaseBlockScript):
         )
 
     async def focus_sweep(self) -> None:
-        """Perform the focus sweep operation."""
+        """Perform the focus sweep operation.
 
-        axis = self.config.axis
-
-        start_position = self.config.focus_step_sequence[0]
-
-        offset_display_value = (
-            f"{start_position:+0.2} um"
-            if axis in "xyz"
-            else f"{start_position*60.*60.:+0.2} arcsec"
-        )
+        If resuming a previous execution, the steps that were already
+        completed are skipped and the hexapod is moved directly to the
+        position of the first step that was not completed.
+        """
 
-        await self.checkpoint(
-            f"Step 1/{self.config.n_steps} {axis=} starting position: {offset_display_value}."
-        )
-        self.log.info("Offset hexapod to starting position.")
-        await self.move_hexapod(axis, start_position)
-        self.total_focus_offset += start_position
-        self.iterations_started = True
-
-        visit_ids = await self.camera.take_focus(
-            exptime=self.config.exp_time,
-            n=self.config.n_images_per_step,
-            group_id=self.group_id,
-            program=self.program,
-            reason=self.reason,
-            note=f"Focus Sweep Camera d{axis.upper()} {offset_display_value}",
-            **self.get_instrument_configuration(),
-        )
+        axis = self.config.axis
 
-        self.focus_visit_ids.extend(visit_ids)
+        self.total_focus_offset = self.get_progress_state("total_focus_offset", 0.0)
+        self.focus_visit_ids = list(self.get_progress_state("focus_visit_ids", []))
 
         try:
-            for self.iterations_executed in range(1, self.config.n_steps):
-                await self.checkpoint(
-                    f"Step {self.iterations_executed+1}/{self.config.n_steps} {axis=}."
-                )
-                hexapod_offset = (
-                    self.config.focus_step_sequence[self.iterations_executed]
-                    - self.config.focus_step_sequence[self.iterations_executed - 1]
-                )
-                await self.move_hexapod(axis, hexapod_offset)
-                self.total_focus_offset += hexapod_offset
+            for self.iterations_executed in range(self.config.n_steps):
+                if self.is_step_completed(self.iterations_executed):
+                    self.log.info(
+                        f"Step {self.iterations_executed+1}/{self.config.n_steps} "
+                        "completed in a previous execution. Skipping."
+                    )
+                    continue
+
+                target_position = self.config.focus_step_sequence[
+                    self.iterations_executed
+                ]
                 offset_display_value = (
-                    f"{self.total_focus_offset:+0.2} um"
+                    f"{target_position:+0.2} um"
                     if axis in "xyz"
-                    else f"{self.total_focus_offset*60.*60.:+0.2} arcsec"
+                    else f"{target_position*60.*60.:+0.2} arcsec"
                 )
+                if self.iterations_executed == 0:
+                    await self.checkpoint(
+                        f"Step 1/{self.config.n_steps} {axis=} "
+                        f"starting position: {offset_display_value}."
+                    )
+                    self.log.info("Offset hexapod to starting position.")
+                else:
+                    await self.checkpoint(
+                        f"Step {self.iterations_executed+1}/{self.config.n_steps} {axis=}."
+                    )
+                hexapod_offset = target_position - self.total_focus_offset
+                await self.move_hexapod(axis, hexapod_offset)
+                self.total_focus_offset += hexapod_offset
+                self.iterations_started = True
+
                 visit_ids = await self.camera.take_focus(
                     exptime=self.config.exp_time,
                     n=self.config.n_images_per_step,
@@ -297,8 +293,25 @@ class BaseFocusSweep(BaseBlockScript):
                 )
 
                 self.focus_visit_ids.extend(visit_ids)
+                self.save_progress(
+                    self.iterations_executed,
+                    total_focus_offset=self.total_focus_offset,
+                    focus_visit_ids=self.focus_visit_ids,
+                )
         finally:
 
+            if self.focus_visit_ids:
+                self.publish_artifact(
+                    "focus_sweep_visits",
+                    json.dumps(
+                        dict(
+                            axis=axis,
+                            focus_step_sequence=self.config.focus_step_sequence,
+                            visit_ids=self.focus_visit_ids,
+                        )
+                    ),
+                )
+
             if len(self.focus_visit_ids) > 2:
 
                 instrument = self.get_instrument_name()
@@ -369,7 +382,12 @@ class BaseFocusSweep(BaseBlockScript):
                     f"{self.total_focus_offset} back along axis {self.config.axis}."
                 )
                 await self.move_hexapod(self.config.axis, -self.total_focus_offset)
+                self.total_focus_offset = 0.0
+                if self.progress is not None and self.progress.exists:
+                    self.save_progress(total_focus_offset=self.total_focus_offset)
         except Exception:
             self.log.exception(
                 "Error while trying to return hexapod to its original position."
             )
+
+        await super().cleanup()
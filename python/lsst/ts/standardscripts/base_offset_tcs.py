@@ -22,7 +22,9 @@
 __all__ = ["BaseOffsetTCS"]
 
 import abc
+import math
 
+import numpy as np
 import yaml
 from lsst.ts import salobj
 
@@ -39,11 +41,22 @@ class BaseOffsetTCS(salobj.BaseScript, metaclass=abc.ABCMeta):
     -----
 
     This class requires one of the following properties ["offset_azel",
-    "offset_radec", "offset_xy", "offset_rot", "reset_offsets"] to be provided
-    in the yaml in order to be configured. Providing more than one of the above
-    properties will result in a Validation Error and the script will fail in
-    the Configuration State.
+    "offset_radec", "offset_xy", "offset_rot", "reset_offsets",
+    "offset_sequence"] to be provided in the yaml in order to be configured.
+    Providing more than one of the above properties will result in a
+    Validation Error and the script will fail in the Configuration State.
 
+    With ``offset_sequence`` the script applies an ordered list of offsets
+    (e.g. a dither pattern) one after another. The positions are relative to
+    the pointing at the start of the script, the script keeps track of the
+    cumulative offset and, by default, returns to the initial pointing with a
+    single offset in `cleanup`. Subclasses can override `execute_at_offset` to
+    take data at each position. Sequence offsets are always relative and
+    never absorbed, so ``relative`` and ``absorb`` do not apply to them.
+
+    **Checkpoints**
+
+    * Offset sequence {n}/{m}: before applying the n-th offset of a sequence.
     """
 
     def __init__(self, index, descr):
@@ -51,6 +64,11 @@ class BaseOffsetTCS(salobj.BaseScript, metaclass=abc.ABCMeta):
 
         self.config = None
 
+        self.offset_sequence = None
+        self.offset_sequence_frame = None
+        self.offset_sequence_positions = []
+        self.cumulative_offset = [0.0, 0.0]
+
     @property
     @abc.abstractmethod
     def tcs(self):
@@ -131,14 +149,75 @@ class BaseOffsetTCS(salobj.BaseScript, metaclass=abc.ABCMeta):
                         description: Reset non-absorbed offset? If unsure, set True
                         type: boolean
                 required: ["reset_absorbed","reset_non_absorbed"]
+              offset_sequence:
+                type: object
+                description: >-
+                    Sequence of offsets to apply one after another. Positions are
+                    relative to the pointing at the start of the script and can be
+                    given as an explicit list or generated from a pattern.
+                properties:
+                    frame:
+                        description: Coordinate frame of the offsets.
+                        type: string
+                        enum: ["azel", "radec", "xy"]
+                        default: xy
+                    offsets:
+                        description: >-
+                            Ordered list of [a, b] positions (arcsec) in the selected
+                            frame, e.g. [[0, 0], [10, 0], [10, 10]].
+                        type: array
+                        minItems: 1
+                        items:
+                            type: array
+                            minItems: 2
+                            maxItems: 2
+                            items:
+                                type: number
+                    pattern:
+                        description: Generate the positions from a dither pattern.
+                        type: object
+                        properties:
+                            type:
+                                description: >-
+                                    Pattern type; "grid" is a serpentine square grid,
+                                    "spiral" a square spiral starting at the origin and
+                                    "random" uniformly distributed points inside a
+                                    circle of radius "step".
+                                type: string
+                                enum: ["grid", "spiral", "random"]
+                            n_points:
+                                description: Number of positions in the pattern.
+                                type: integer
+                                minimum: 1
+                            step:
+                                description: Pattern spacing (arcsec).
+                                type: number
+                                exclusiveMinimum: 0
+                            seed:
+                                description: Seed for the random pattern.
+                                type: integer
+                                default: 42
+                        required: ["type", "n_points", "step"]
+                        additionalProperties: false
+                    return_to_origin:
+                        description: >-
+                            Return to the initial pointing after the sequence is
+                            completed (or interrupted)?
+                        type: boolean
+                        default: True
+                oneOf:
+                    - required: ["offsets"]
+                    - required: ["pattern"]
+                additionalProperties: false
               relative:
                 description: If `True` (default) offset is applied relative to the current
                     position, if `False` offset replaces any existing offsets.
+                    Ignored by offset_sequence, whose offsets are always relative.
                 type: boolean
                 default: True
               absorb:
                 description: If `True`, offset should be absorbed and persisted between
-                    slews.
+                    slews. Ignored by offset_sequence, whose offsets are never absorbed.
                 type: boolean
                 default: False
             additionalProperties: false
@@ -148,6 +227,7 @@ class BaseOffsetTCS(salobj.BaseScript, metaclass=abc.ABCMeta):
                 - required: ["offset_xy"]
                 - required: ["offset_rot"]
                 - required: ["reset_offsets"]
+                - required: ["offset_sequence"]
         """
         return yaml.safe_load(schema_yaml)
 
@@ -166,12 +246,99 @@ class BaseOffsetTCS(salobj.BaseScript, metaclass=abc.ABCMeta):
         self.offset_rot = getattr(config, "offset_rot", None)
         self.offset_pa = getattr(config, "offset_pa", None)
         self.reset_offsets = getattr(config, "reset_offsets", None)
+        self.offset_sequence = getattr(config, "offset_sequence", None)
 
         self.relative = config.relative
         self.absorb = config.absorb
 
+        self.cumulative_offset = [0.0, 0.0]
+
+        if self.offset_sequence is not None:
+            self.offset_sequence_frame = self.offset_sequence.get("frame", "xy")
+            if "offsets" in self.offset_sequence:
+                self.offset_sequence_positions = [
+                    (float(a), float(b)) for a, b in self.offset_sequence["offsets"]
+                ]
+            else:
+                pattern = self.offset_sequence["pattern"]
+                self.offset_sequence_positions = self.make_offset_pattern(
+                    pattern_type=pattern["type"],
+                    n_points=pattern["n_points"],
+                    step=pattern["step"],
+                    seed=pattern.get("seed", 42),
+                )
+        else:
+            self.offset_sequence_frame = None
+            self.offset_sequence_positions = []
+
     def set_metadata(self, metadata):
-        metadata.duration = 10
+        metadata.duration = 10 * max(1, len(self.offset_sequence_positions))
+
+    @staticmethod
+    def make_offset_pattern(
+        pattern_type: str, n_points: int, step: float, seed: int = 42
+    ) -> list[tuple[float, float]]:
+        """Generate the positions of a dither pattern.
+
+        Parameters
+        ----------
+        pattern_type : `str`
+            One of "grid", "spiral" or "random".
+        n_points : `int`
+            Number of positions.
+        step : `float`
+            Pattern spacing (arcsec). For the random pattern this is the
+            radius of the circle the positions are drawn from.
+        seed : `int`, optional
+            Seed for the random pattern.
+
+        Returns
+        -------
+        `list` [`tuple` [`float`, `float`]]
+            Positions relative to the origin (arcsec).
+
+        Raises
+        ------
+        RuntimeError
+            If ``pattern_type`` is not valid.
+        """
+        if pattern_type == "grid":
+            # Serpentine square grid centered on the origin, so consecutive
+            # positions are always one step apart.
+            size = math.ceil(math.sqrt(n_points))
+            center = (size - 1) / 2.0
+            positions = []
+            for row in range(size):
+                columns = range(size) if row % 2 == 0 else reversed(range(size))
+                for column in columns:
+                    positions.append(((column - center) * step, (row - center) * step))
+            return positions[:n_points]
+        elif pattern_type == "spiral":
+            positions = [(0.0, 0.0)]
+            x, y = 0, 0
+            dx, dy = 1, 0
+            leg_length = 1
+            while len(positions) < n_points:
+                for _ in range(2):
+                    for _ in range(leg_length):
+                        x, y = x + dx, y + dy
+                        positions.append((x * step, y * step))
+                    dx, dy = -dy, dx
+                leg_length += 1
+            return positions[:n_points]
+        elif pattern_type == "random":
+            rng = np.random.default_rng(seed)
+            radius = step * np.sqrt(rng.uniform(size=n_points))
+            angle = rng.uniform(0.0, 2.0 * np.pi, size=n_points)
+            return [
+                (float(r * np.cos(theta)), float(r * np.sin(theta)))
+                for r, theta in zip(radius, angle)
+            ]
+        else:
+            raise RuntimeError(
+                f"Invalid offset pattern {pattern_type!r}. "
+                "Must be one of 'grid', 'spiral' or 'random'."
+            )
 
     async def assert_feasibility(self) -> None:
         """Verify that the telescope is in a feasible state to
@@ -224,3 +391,76 @@ class BaseOffsetTCS(salobj.BaseScript, metaclass=abc.ABCMeta):
                 absorbed=self.reset_offsets["reset_absorbed"],
                 non_absorbed=self.reset_offsets["reset_non_absorbed"],
             )
+
+        if self.offset_sequence is not None:
+            await self.run_offset_sequence()
+
+    async def run_offset_sequence(self) -> None:
+        """Apply the offsets in the sequence one after another."""
+        n_positions = len(self.offset_sequence_positions)
+        for i, position in enumerate(self.offset_sequence_positions):
+            await self.checkpoint(
+                f"Offset sequence {i+1}/{n_positions} "
+                f"{self.offset_sequence_frame}: {position}"
+            )
+            await self.apply_sequence_offset(
+                position[0] - self.cumulative_offset[0],
+                position[1] - self.cumulative_offset[1],
+            )
+            await self.execute_at_offset(index=i, position=position)
+
+    async def apply_sequence_offset(self, a: float, b: float) -> None:
+        """Apply a relative offset in the offset sequence frame and update the
+        cumulative offset.
+
+        Parameters
+        ----------
+        a : `float`
+            Offset along the first axis of the frame (arcsec).
+        b : `float`
+            Offset along the second axis of the frame (arcsec).
+        """
+        if self.offset_sequence_frame == "azel":
+            await self.tcs.offset_azel(az=a, el=b, relative=True, absorb=False)
+        elif self.offset_sequence_frame == "radec":
+            await self.tcs.offset_radec(ra=a, dec=b)
+        else:
+            await self.tcs.offset_xy(x=a, y=b, relative=True, absorb=False)
+
+        self.cumulative_offset[0] += a
+        self.cumulative_offset[1] += b
+
+    async def execute_at_offset(self, index: int, position: tuple[float, float]):
+        """Hook called after each offset of the sequence is applied.
+
+        By default this does nothing. Subclasses may override it to, for
+        instance, take exposures at each position.
+
+        Parameters
+        ----------
+        index : `int`
+            Index of the position in the sequence.
+        position : `tuple` [`float`, `float`]
+            Position relative to the initial pointing (arcsec).
+        """
+        return None
+
+    async def cleanup(self):
+        if (
+            self.offset_sequence is not None
+            and self.offset_sequence.get("return_to_origin", True)
+            and any(value != 0.0 for value in self.cumulative_offset)
+        ):
+            try:
+                self.log.info(
+                    f"Returning to original pointing by offsetting "
+                    f"{self.offset_sequence_frame} by "
+                    f"{[-value for value in self.cumulative_offset]}."
+                )
+                await self.apply_sequence_offset(
+                    -self.cumulative_offset[0], -self.cumulative_offset[1]
+                )
+            except Exception:
+                self.log.exception(
+                    "Error while trying to return to the original pointing."
+                )
@@ -246,3 +246,5 @@ class BasePointAzEl(BaseBlockScript, metaclass=abc.ABCMeta):
                 )
             except Exception:
                 self.log.exception("Unexpected exception while stopping telescope.")
+
+        await super().cleanup()
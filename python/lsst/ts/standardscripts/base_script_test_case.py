@@ -23,12 +23,17 @@ __all__ = ["BaseScriptTestCase"]
 
 import abc
 import asyncio
+import collections
 import contextlib
 import logging
 import os
 import pathlib
+import statistics
+import tempfile
 import time
 import types
+import typing
+import unittest.mock
 
 import astropy.time
 import yaml
@@ -37,8 +42,74 @@ from confluent_kafka.schema_registry import SchemaRegistryClient
 from lsst.ts import salobj, utils
 from lsst.ts.xml.enums import Script
 
+from .dry_run import VirtualClock
+from .script_progress import PROGRESS_DIR_ENV_VAR
+
 MAKE_TIMEOUT = 90  # Default time for make_script (seconds)
 
+# Real time the virtual clock used by `BaseScriptTestCase.run_script` waits
+# for I/O (e.g. writing SAL messages) before jumping to the next timer
+# (seconds).
+VIRTUAL_TIME_IO_WAIT = 0.1
+
+# Largest script index handed out by `BaseScriptTestCase.next_index`. Tests
+# add multiples of 100000 to select the script queue, so indices must stay
+# below it.
+MAX_TEST_INDEX = 99999
+
+
+def get_test_worker() -> typing.Tuple[int, int]:
+    """Get the number of this test worker and the number of workers.
+
+    Workers are the processes started by pytest-xdist; without it there is
+    a single worker.
+
+    Returns
+    -------
+    worker : `int`
+        Number of this worker, starting at 0.
+    n_workers : `int`
+        Number of workers.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "")
+    worker = int(worker_id[2:]) if worker_id.startswith("gw") else 0
+    n_workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+    return worker, max(n_workers, worker + 1)
+
+
+def make_test_index_generator() -> typing.Iterator[int]:
+    """Make a generator of script indices for this test worker.
+
+    Each worker gets a disjoint range of indices, so that tests running
+    in parallel do not create scripts with the same index.
+
+    Returns
+    -------
+    index_generator : `typing.Iterator` [`int`]
+        Generator of script indices.
+    """
+    worker, n_workers = get_test_worker()
+    range_size = MAX_TEST_INDEX // n_workers
+    imin = 1 + worker * range_size
+    return utils.index_generator(imin=imin, imax=imin + range_size - 1)
+
+
+def set_worker_topic_subname() -> None:
+    """Make the topic subname unique to this test worker.
+
+    Append the worker number to ``LSST_TOPIC_SUBNAME`` when running with
+    pytest-xdist, so workers do not read each other's messages and each
+    one only deletes its own topics on teardown. The number is zero padded
+    so no worker's subname contains another's.
+    """
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        return
+    worker, _ = get_test_worker()
+    suffix = f"_w{worker:03d}"
+    topic_subname = os.environ.get("LSST_TOPIC_SUBNAME", "test")
+    if not topic_subname.endswith(suffix):
+        os.environ["LSST_TOPIC_SUBNAME"] = topic_subname + suffix
+
 
 class BaseScriptTestCase(metaclass=abc.ABCMeta):
     """Base class for Script tests.
@@ -61,7 +132,7 @@ class BaseScriptTestCase(metaclass=abc.ABCMeta):
                 # ... test the results of running the script
     """
 
-    _index_iter = utils.index_generator()
+    _index_iter: typing.Optional[typing.Iterator[int]] = None
 
     _broker_configuration = None
     _schema_registry_url = None
@@ -77,23 +148,36 @@ class BaseScriptTestCase(metaclass=abc.ABCMeta):
                 self._broker_configuration = salinfo.get_broker_client_configuration()
                 self._schema_registry_url = salinfo.schema_registry_url
 
-        def assert_topic_has_no_consumers(
-            admin_client: AdminClient, topic: str
-        ) -> None:
-            """Check if any consumer group has an assignment
-            that includes the given topic.
+        def get_topic_consumer_groups(
+            admin_client: AdminClient,
+        ) -> dict[str, set[str]]:
+            """Map each topic to the consumer groups with a member assigned
+            to it.
+
+            All groups are described in a single batched call.
             """
             groups = admin_client.list_consumer_groups().result()
-            for group in groups.valid:
-                group_id = group.group_id
-                group_descs = admin_client.describe_consumer_groups([group_id])
-                for desc in group_descs.values():
-                    for member in desc.result().members:
-                        topics = [tp.topic for tp in member.assignment.topic_partitions]
-                        assert (
-                            topic not in topics
-                        ), f"Found consumer in group '{group_id}' assigned to topic '{topic}'."
+            group_ids = [group.group_id for group in groups.valid]
+            topic_consumer_groups = collections.defaultdict(set)
+            if not group_ids:
+                return topic_consumer_groups
+            group_descs = admin_client.describe_consumer_groups(group_ids)
+            for group_id, desc in group_descs.items():
+                for member in desc.result().members:
+                    for tp in member.assignment.topic_partitions:
+                        topic_consumer_groups[tp.topic].add(group_id)
+            return topic_consumer_groups
+
+        def delete_subject(
+            schema_registry_client: SchemaRegistryClient, subject: str
+        ) -> None:
+            try:
+                schema_registry_client.delete_subject(subject, permanent=True)
+                print(f"{subject=} removed.")
+            except Exception as e:
+                print(f"Failed to delete {subject=}: {e}")
 
+        teardown_start = time.monotonic()
         topic_subname = os.environ["LSST_TOPIC_SUBNAME"]
         if self._broker_configuration is not None:
             print(f"Deleting topics for {topic_subname=}.")
@@ -103,10 +187,11 @@ class BaseScriptTestCase(metaclass=abc.ABCMeta):
                 topic for topic in topics_list.topics if topic_subname in topic
             ]
             if topics_to_delete:
+                topic_consumer_groups = get_topic_consumer_groups(admin_client)
                 for topic in topics_to_delete:
-                    assert_topic_has_no_consumers(
-                        admin_client=admin_client, topic=topic
-                    )
+                    assert (
+                        topic not in topic_consumer_groups
+                    ), f"Found consumer in groups {topic_consumer_groups[topic]} assigned to topic '{topic}'."
                 delete_futures = admin_client.delete_topics(
                     topics_to_delete, operation_timeout=60
                 )
@@ -124,12 +209,17 @@ class BaseScriptTestCase(metaclass=abc.ABCMeta):
             )
             subjects = schema_registry_client.get_subjects()
             schemas_do_delete = [topic for topic in subjects if topic_subname in topic]
-            for subject in schemas_do_delete:
-                try:
-                    schema_registry_client.delete_subject(subject, permanent=True)
-                    print(f"{subject=} removed.")
-                except Exception as e:
-                    print(f"Failed to delete {subject=}: {e}")
+            await asyncio.gather(
+                *[
+                    asyncio.to_thread(delete_subject, schema_registry_client, subject)
+                    for subject in schemas_do_delete
+                ]
+            )
+
+        print(
+            f"Kafka teardown for {topic_subname=} took "
+            f"{time.monotonic() - teardown_start:0.2f}s."
+        )
 
         await super().asyncTearDown()  # type: ignore
 
@@ -163,6 +253,28 @@ class BaseScriptTestCase(metaclass=abc.ABCMeta):
         """Optional cleanup before closing the scripts and etc."""
         pass
 
+    def use_temporary_progress_dir(self) -> pathlib.Path:
+        """Store the progress records of the scripts made by this test in a
+        temporary directory, removed when the test is done.
+
+        Call it from ``setUp``. It sets the ``LSST_SCRIPT_PROGRESS_DIR``
+        environment variable, so `BaseBlockScript` keeps a progress record
+        even if not configured to resume.
+
+        Returns
+        -------
+        progress_dir : `pathlib.Path`
+            Directory with the progress records.
+        """
+        progress_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(progress_dir.cleanup)  # type: ignore
+        env_patcher = unittest.mock.patch.dict(
+            os.environ, {PROGRESS_DIR_ENV_VAR: progress_dir.name}
+        )
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)  # type: ignore
+        return pathlib.Path(progress_dir.name)
+
     async def check_executable(self, script_path):
         """Check that an executable script can be launched.
 
@@ -176,6 +288,7 @@ class BaseScriptTestCase(metaclass=abc.ABCMeta):
         # released.
         if hasattr(salobj, "set_test_topic_subname"):
             salobj.set_test_topic_subname()
+            set_worker_topic_subname()
         else:
             salobj.set_random_lsst_dds_partition_prefix()
 
@@ -275,6 +388,7 @@ class BaseScriptTestCase(metaclass=abc.ABCMeta):
         # released.
         if hasattr(salobj, "set_test_topic_subname"):
             salobj.set_test_topic_subname(randomize=randomize_topic_subname)
+            set_worker_topic_subname()
         else:
             salobj.set_random_lsst_dds_partition_prefix()
 
@@ -314,19 +428,122 @@ class BaseScriptTestCase(metaclass=abc.ABCMeta):
             )
 
     def next_index(self):
-        return next(self._index_iter)
-
-    async def run_script(self, expected_final_state=Script.ScriptState.DONE):
+        # Create the generator on first use, so the pytest-xdist worker
+        # environment is in place.
+        if BaseScriptTestCase._index_iter is None:
+            BaseScriptTestCase._index_iter = make_test_index_generator()
+        return next(BaseScriptTestCase._index_iter)
+
+    async def run_script(
+        self, expected_final_state=Script.ScriptState.DONE, virtual_time=False
+    ):
         """Run the script.
 
         Requires that the script be configured and the group ID set
         (if using ts_salobj 4.5 or later).
+
+        Parameters
+        ----------
+        expected_final_state : `Script.ScriptState`, optional
+            Expected state of the script when it finishes.
+        virtual_time : `bool`, optional
+            Run the script on a `VirtualClock`? If True, sleeps and timeouts
+            finish instantly, while keeping their relative order, and
+            ``self.virtual_clock`` is set to the clock, so tests can check
+            how long the script took (in virtual time) with
+            ``self.virtual_clock.elapsed``. Only use this with scripts that
+            talk to mocks; see `VirtualClock` for details. Before each jump
+            to the next timer the clock waits up to `VIRTUAL_TIME_IO_WAIT`
+            (0.1 s) of real time for I/O, so the real duration grows with
+            the number of timers the script waits on, not with their length.
         """
         run_data = self.script.cmd_run.DataType()
-        await self.script.do_run(run_data)
-        await self.script.done_task
+        if virtual_time:
+            self.virtual_clock = VirtualClock(io_wait=VIRTUAL_TIME_IO_WAIT)
+            with self.virtual_clock.patch_loop():
+                await self.script.do_run(run_data)
+                await self.script.done_task
+        else:
+            await self.script.do_run(run_data)
+            await self.script.done_task
         assert self.script.state.state == expected_final_state
 
+    async def run_lifecycle_benchmark(
+        self, config, n_runs=1, expected_final_state=Script.ScriptState.DONE
+    ):
+        """Measure the overhead of each phase of the script lifecycle.
+
+        Each run makes a new script with `make_script`, configures it with
+        `configure_script` and runs it with `run_script`. Use mocks that
+        answer instantly for the resources the script commands, so the
+        durations are dominated by the overhead of the script itself.
+
+        Parameters
+        ----------
+        config : `dict`
+            Script configuration.
+        n_runs : `int`, optional
+            Number of runs.
+        expected_final_state : `Script.ScriptState`, optional
+            Expected state of the script when it finishes.
+
+        Returns
+        -------
+        benchmark : `types.SimpleNamespace`
+            Struct with the median duration (sec) over all runs of each
+            phase:
+
+            * ``configure``: handling the configure command, including
+              schema validation, ``configure`` and ``set_metadata``.
+            * ``set_metadata``: a call to ``set_metadata``.
+            * ``checkpoint``: all the checkpoints of a run.
+            * ``run``: the rest of the run command, up to the script
+              finishing.
+
+            and ``n_checkpoints``, the number of checkpoints of a run.
+        """
+        durations = collections.defaultdict(list)
+        n_checkpoints = 0
+
+        for _ in range(n_runs):
+            async with self.make_script():
+                checkpoint = self.script.checkpoint
+                checkpoint_durations = []
+
+                async def timed_checkpoint(name=""):
+                    t0 = time.perf_counter()
+                    try:
+                        await checkpoint(name)
+                    finally:
+                        checkpoint_durations.append(time.perf_counter() - t0)
+
+                self.script.checkpoint = timed_checkpoint
+
+                t0 = time.perf_counter()
+                await self.configure_script(**config)
+                durations["configure"].append(time.perf_counter() - t0)
+
+                metadata = self.script.evt_metadata.DataType()
+                t0 = time.perf_counter()
+                self.script.set_metadata(metadata)
+                durations["set_metadata"].append(time.perf_counter() - t0)
+
+                t0 = time.perf_counter()
+                await self.run_script(expected_final_state=expected_final_state)
+                run_duration = time.perf_counter() - t0
+
+                durations["checkpoint"].append(sum(checkpoint_durations))
+                durations["run"].append(run_duration - sum(checkpoint_durations))
+                n_checkpoints = len(checkpoint_durations)
+
+        return types.SimpleNamespace(
+            **{
+                phase: statistics.median(phase_durations)
+                for phase, phase_durations in durations.items()
+            },
+            n_checkpoints=n_checkpoints,
+        )
+
     async def wait_for(self, coro, timeout, description, verbose):
         """A wrapper around asyncio.wait_for that prints timing information.
 
@@ -166,6 +166,12 @@ class BaseTakeAOSSequence(BaseBlockScript):
                 type: array
                 items:
                     type: string
+              resume:
+                description: >-
+                    Resume a previous execution with the same configuration,
+                    skipping the sequences that were already completed?
+                type: boolean
+                default: false
             additionalProperties: false
         """
         return yaml.safe_load(schema_yaml)
@@ -203,6 +209,8 @@ class BaseTakeAOSSequence(BaseBlockScript):
         self.reason = config.reason
         self.note = config.note
 
+        self.configure_progress(config)
+
     def set_metadata(self, metadata: salobj.type_hints.BaseMsgType) -> None:
         """Sets script metadata.
 
@@ -240,6 +248,21 @@ class BaseTakeAOSSequence(BaseBlockScript):
     def get_instrument_name(self) -> str:
         raise NotImplementedError()
 
+    async def move_camera_hexapod_z(self, z_position: float) -> None:
+        """Move the camera hexapod to a z position, relative to focus, and
+        save it with the progress record, so a resumed execution knows where
+        the hexapod was left.
+
+        Parameters
+        ----------
+        z_position : `float`
+            Target z position (microns).
+        """
+        z_offset = z_position - self.current_z_position
+        await self.mtcs.offset_camera_hexapod(x=0, y=0, z=z_offset, u=0, v=0)
+        self.current_z_position = z_position
+        self.save_progress(current_z_position=self.current_z_position)
+
     async def take_aos_sequence(self) -> None:
         """Take out-of-focus sequence images."""
         supplemented_group_id = self.next_supplemented_group_id()
@@ -252,9 +275,7 @@ class BaseTakeAOSSequence(BaseBlockScript):
             self.log.debug("Moving to intra-focal position")
 
             # Move the hexapod to the target z position
-            z_offset = -self.dz - self.current_z_position
-            await self.mtcs.offset_camera_hexapod(x=0, y=0, z=z_offset, u=0, v=0)
-            self.current_z_position = -self.dz
+            await self.move_camera_hexapod_z(-self.dz)
 
             self.log.info("Taking in-focus image")
             self.oods.evt_imageInOODS.flush()
@@ -276,9 +297,7 @@ class BaseTakeAOSSequence(BaseBlockScript):
             self.log.debug("Moving to extra-focal position")
 
             # Move the hexapod to the target z position
-            z_offset = self.dz - self.current_z_position
-            await self.mtcs.offset_camera_hexapod(x=0, y=0, z=z_offset, u=0, v=0)
-            self.current_z_position = self.dz
+            await self.move_camera_hexapod_z(self.dz)
 
             self.log.info("Taking extra-focal image")
 
@@ -336,9 +355,7 @@ class BaseTakeAOSSequence(BaseBlockScript):
         self.log.debug("Moving to in-focus position")
 
         # Move the hexapod to the target z position
-        z_offset = -self.current_z_position
-        await self.mtcs.offset_camera_hexapod(x=0, y=0, z=z_offset, u=0, v=0)
-        self.current_z_position = 0
+        await self.move_camera_hexapod_z(0)
 
         if self.mode != Mode.PAIR:
             self.log.info("Taking in-focus image")
@@ -363,8 +380,19 @@ class BaseTakeAOSSequence(BaseBlockScript):
         """Execute script operations."""
         await self.assert_feasibility()
 
+        self.current_z_position = self.get_progress_state("current_z_position", 0)
+
         for i in range(self.n_sequences):
+            if self.is_step_completed(i):
+                self.log.info(
+                    f"Aos sequence {i+1} of {self.n_sequences} completed in a "
+                    "previous execution. Skipping."
+                )
+                continue
+
             self.log.info(f"Starting aos sequence {i+1} of {self.n_sequences}")
             await self.checkpoint(f"out-of-focus sequence {i+1} of {self.n_sequences}")
 
             await self.take_aos_sequence()
+
+            self.save_progress(i)
@@ -22,6 +22,8 @@
 __all__ = ["BaseTakeStuttered"]
 
 import abc
+import asyncio
+import time
 
 import yaml
 from lsst.ts import salobj
@@ -39,7 +41,14 @@ class BaseTakeStuttered(salobj.BaseScript, metaclass=abc.ABCMeta):
     -----
     **Checkpoints**
 
-    * exposure {n} of {m}: before sending the ``takeImages`` command
+    * setup instrument: before setting up the instrument.
+    * Take stuttered chunk {n} of {m}: before taking each chunk of images.
+
+    **Details**
+
+    The images are taken in chunks of ``chunk_size`` images, by default a
+    single chunk. If the script is stopped while a chunk is being taken, the
+    chunk is completed before the script stops.
     """
 
     def __init__(self, index, descr):
@@ -49,6 +58,11 @@ class BaseTakeStuttered(salobj.BaseScript, metaclass=abc.ABCMeta):
 
         self.instrument_setup_time = 0.0
 
+        # Time to transfer a single row during a shift (sec).
+        self.row_transfer_time = 2.0e-5
+
+        self.chunks = []
+
     @property
     @abc.abstractmethod
     def camera(self):
@@ -102,6 +116,13 @@ class BaseTakeStuttered(salobj.BaseScript, metaclass=abc.ABCMeta):
               note:
                 description: A descriptive note about the image being taken.
                 type: string
+              chunk_size:
+                description: >-
+                    Number of images to take in each chunk. Each chunk has its own
+                    checkpoint, and the script can only stop in between chunks.
+                    If omitted, all images are taken in a single chunk.
+                minimum: 1
+                type: integer
             required: [exp_time]
             additionalProperties: false
         """
@@ -117,12 +138,39 @@ class BaseTakeStuttered(salobj.BaseScript, metaclass=abc.ABCMeta):
         """
         self.config = config
 
-    def set_metadata(self, metadata):
-        metadata.duration = self.instrument_setup_time + (
+        chunk_size = getattr(config, "chunk_size", max(config.n_images, 1))
+        n_full_chunks, n_remaining = divmod(config.n_images, chunk_size)
+        self.chunks = [chunk_size] * n_full_chunks
+        if n_remaining > 0:
+            self.chunks.append(n_remaining)
+
+    def get_stuttered_image_duration(self) -> float:
+        """Get the estimated time it takes to take a single stuttered image.
+
+        Each of the ``n_shift`` shift-expose sequences exposes for
+        ``exp_time`` and shifts ``row_shift`` rows. The shutter is opened
+        and closed once, if the camera reports a shutter time, and the image
+        is read out at the end.
+
+        Returns
+        -------
+        `float`
+            Estimated duration (sec).
+        """
+        shutter_time = (
+            2.0 * self.camera.shutter_time if self.camera.shutter_time else 0.0
+        )
+        return (
             self.config.n_shift
-            * self.config.row_shift
-            * self.config.n_images
-            * self.config.exp_time
+            * (self.config.exp_time + self.config.row_shift * self.row_transfer_time)
+            + shutter_time
+            + self.camera.read_out_time
+        )
+
+    def set_metadata(self, metadata):
+        metadata.duration = (
+            self.instrument_setup_time
+            + self.config.n_images * self.get_stuttered_image_duration()
         )
 
     async def run(self):
@@ -133,14 +181,39 @@ class BaseTakeStuttered(salobj.BaseScript, metaclass=abc.ABCMeta):
         await self.checkpoint("setup instrument")
         await self.camera.setup_instrument(**self.get_instrument_configuration())
 
-        await self.checkpoint("Take stuttered")
-        await self.camera.take_stuttered(
-            exptime=self.config.exp_time,
-            n_shift=self.config.n_shift,
-            row_shift=self.config.row_shift,
-            n=self.config.n_images,
-            reason=reason,
-            program=program,
-            group_id=self.group_id,
-            note=note,
-        )
+        n_chunks = len(self.chunks)
+        n_images_taken = 0
+        for i, n_images in enumerate(self.chunks):
+            await self.checkpoint(
+                f"Take stuttered chunk {i+1} of {n_chunks}: images "
+                f"{n_images_taken+1}-{n_images_taken+n_images} of {self.config.n_images}"
+            )
+            start_time = time.monotonic()
+            chunk_task = asyncio.create_task(
+                self.camera.take_stuttered(
+                    exptime=self.config.exp_time,
+                    n_shift=self.config.n_shift,
+                    row_shift=self.config.row_shift,
+                    n=n_images,
+                    reason=reason,
+                    program=program,
+                    group_id=self.group_id,
+                    note=note,
+                )
+            )
+            try:
+                await asyncio.shield(chunk_task)
+            except asyncio.CancelledError:
+                if not chunk_task.done():
+                    self.log.warning(
+                        "Script stopped while taking data, "
+                        f"finishing chunk {i+1} of {n_chunks} before stopping."
+                    )
+                    await chunk_task
+                raise
+            n_images_taken += n_images
+            self.log.info(
+                f"Chunk {i+1} of {n_chunks} with {n_images} image(s) took "
+                f"{time.monotonic() - start_time:0.1f}s; "
+                f"estimated {n_images * self.get_stuttered_image_duration():0.1f}s."
+            )
@@ -551,3 +551,5 @@ class BaseTrackTarget(BaseBlockScript, metaclass=abc.ABCMeta):
                     )
                 except Exception:
                     self.log.exception("Unexpected exception in stop_tracking.")
+
+        await super().cleanup()
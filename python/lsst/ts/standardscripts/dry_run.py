@@ -0,0 +1,405 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["VirtualClock", "TimingModelGroup", "dry_run"]
+
+import asyncio
+import contextlib
+import logging
+import types
+import typing
+from unittest import mock
+
+from lsst.ts import salobj
+
+
+class VirtualClock:
+    """Virtual clock for an asyncio event loop.
+
+    While the clock is patched into a loop, the loop time is virtual. Every
+    time the loop would block waiting for the next scheduled callback (e.g.
+    an `asyncio.sleep` or the timeout of an `asyncio.wait_for`), the virtual
+    time jumps forward to it instead. Relative ordering of the callbacks is
+    preserved, but sleeps finish instantly.
+
+    Notes
+    -----
+    Any I/O ready when the loop polls is still processed, but the loop only
+    waits ``io_wait`` seconds (real time) for I/O that is not ready yet while
+    there are timers scheduled. With the default ``io_wait=0`` this is only
+    suitable for code whose waits are all timer-based, e.g. code that talks
+    to mocks or to timing-model stand-ins. A small ``io_wait`` lets fast
+    I/O, e.g. writing SAL messages, complete before the clock jumps.
+
+    When the clock is unpatched, the callbacks still scheduled are moved
+    back to the real clock, keeping the time left until they are due, so
+    e.g. a heartbeat scheduled in virtual time does not wait for the real
+    time to catch up with the virtual time.
+
+    The implementation patches the ``time`` method and the selector of the
+    loop, and shifts the deadlines of the scheduled callbacks, which relies
+    on the internals of the standard library event loops.
+
+    Parameters
+    ----------
+    io_wait : `float`, optional
+        Real time to wait for I/O before advancing the virtual time (sec).
+    """
+
+    def __init__(self, io_wait: float = 0.0) -> None:
+        self.io_wait = io_wait
+        self._virtual_time = 0.0
+        self._start_time = 0.0
+        self._patched = False
+
+    def time(self) -> float:
+        """Get the current virtual time (sec).
+
+        The time is frozen once the clock is no longer patched into a loop.
+        """
+        return self._virtual_time
+
+    @property
+    def elapsed(self) -> float:
+        """Virtual time elapsed since the clock was patched in (sec)."""
+        return self.time() - self._start_time
+
+    def advance(self, dt: float) -> None:
+        """Advance the virtual time.
+
+        Parameters
+        ----------
+        dt : `float`
+            Time to advance the clock by (sec).
+        """
+        if not self._patched:
+            raise RuntimeError("Virtual clock is not patched into a loop.")
+        self._virtual_time += dt
+
+    @contextlib.contextmanager
+    def patch_loop(
+        self, loop: asyncio.AbstractEventLoop | None = None
+    ) -> typing.Iterator["VirtualClock"]:
+        """Run the loop on the virtual clock within the context.
+
+        Parameters
+        ----------
+        loop : `asyncio.AbstractEventLoop`, optional
+            Loop to patch. If not given, use the running loop.
+        """
+        if loop is None:
+            loop = asyncio.get_running_loop()
+
+        # Start at the real loop time, so callbacks scheduled before
+        # patching the loop keep their order.
+        self._virtual_time = loop.time()
+        self._start_time = self._virtual_time
+        self._patched = True
+
+        selector = loop._selector  # type: ignore[attr-defined]
+        real_select = selector.select
+
+        def virtual_select(timeout: float | None = None) -> list:
+            if timeout is None:
+                # Nothing scheduled, wait for I/O (e.g. executor threads).
+                return real_select(None)
+            events = real_select(min(self.io_wait, timeout))
+            if not events and timeout > 0:
+                self.advance(timeout)
+            return events
+
+        try:
+            with mock.patch.object(loop, "time", self.time), mock.patch.object(
+                selector, "select", virtual_select
+            ):
+                yield self
+        finally:
+            self._patched = False
+            # Shifting all deadlines by the same amount keeps the heap of
+            # scheduled callbacks ordered.
+            offset = self._virtual_time - loop.time()
+            for handle in loop._scheduled:  # type: ignore[attr-defined]
+                handle._when -= offset
+
+
+class TimingModelGroup:
+    """Stand-in for an observatory control group, e.g. a TCS or a camera,
+    that emulates how long each operation takes without commanding anything.
+
+    Any coroutine method can be called on the stand-in. The call sleeps for
+    a duration given by a simple timing model, based on the name of the
+    operation:
+
+    * ``take_*``: ``n * (exptime + read_out_time + shutter_time)``. Returns
+      a list of fake visit ids.
+    * ``*slew*``, ``*track_target*``, ``point_azel``: ``slew_time``.
+    * ``*offset*``: ``offset_time``.
+    * ``setup_*``, ``*filter*``: ``setup_time``.
+    * anything else: ``default_time``.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the stand-in, used in the log and the list of calls.
+    read_out_time : `float`, optional
+        Camera read out time (sec).
+    shutter_time : `float`, optional
+        Camera shutter time (sec).
+    slew_time : `float`, optional
+        Time for a slew (sec).
+    offset_time : `float`, optional
+        Time for an offset (sec).
+    setup_time : `float`, optional
+        Time for an instrument setup (sec).
+    default_time : `float`, optional
+        Time for any other operation (sec).
+    """
+
+    sync_methods = frozenset(["disable_checks_for_components", "reset_checks", "flush"])
+
+    def __init__(
+        self,
+        name: str,
+        read_out_time: float = 2.0,
+        shutter_time: float = 1.0,
+        slew_time: float = 60.0,
+        offset_time: float = 5.0,
+        setup_time: float = 0.0,
+        default_time: float = 0.0,
+    ) -> None:
+        self.name = name
+        self.read_out_time = read_out_time
+        self.shutter_time = shutter_time
+        self.slew_time = slew_time
+        self.offset_time = offset_time
+        self.setup_time = setup_time
+        self.default_time = default_time
+
+        self.fast_timeout = 5.0
+        self.long_timeout = 30.0
+        self.long_long_timeout = 120.0
+
+        self.calls: list[tuple[str, float]] = []
+        self._next_visit_id = 1
+
+    def get_duration(self, operation: str, args: tuple, kwargs: dict) -> float:
+        """Get the duration of an operation according to the timing model.
+
+        Parameters
+        ----------
+        operation : `str`
+            Name of the operation.
+        args : `tuple`
+            Positional arguments of the call.
+        kwargs : `dict`
+            Keyword arguments of the call.
+
+        Returns
+        -------
+        `float`
+            Duration (sec).
+        """
+        if operation.startswith("take_"):
+            exptime, n = self._get_exposure_parameters(operation, args, kwargs)
+            return n * (exptime + self.read_out_time + self.shutter_time)
+        elif (
+            "slew" in operation
+            or "track_target" in operation
+            or operation == "point_azel"
+        ):
+            return self.slew_time
+        elif "offset" in operation:
+            return self.offset_time
+        elif operation.startswith("setup_") or "filter" in operation:
+            return self.setup_time
+        return self.default_time
+
+    @staticmethod
+    def _get_exposure_parameters(
+        operation: str, args: tuple, kwargs: dict
+    ) -> tuple[float, int]:
+        """Get exposure time and number of exposures of a ``take_*`` call."""
+        if operation == "take_imgtype":
+            # take_imgtype(imgtype, exptime, n, ...)
+            exptime = kwargs.get("exptime", args[1] if len(args) > 1 else 0.0)
+            n = kwargs.get("n", args[2] if len(args) > 2 else 1)
+        else:
+            exptime = kwargs.get("exptime", args[0] if args else 0.0)
+            n = kwargs.get("n", 1)
+        return exptime, n
+
+    def __getattr__(self, operation: str) -> typing.Callable:
+        if operation.startswith("_"):
+            raise AttributeError(operation)
+
+        if operation in self.sync_methods:
+            return lambda *args, **kwargs: None
+
+        async def timed_operation(
+            *args: typing.Any, **kwargs: typing.Any
+        ) -> typing.Any:
+            duration = self.get_duration(operation, args, kwargs)
+            self.calls.append((operation, duration))
+            await asyncio.sleep(duration)
+            if operation.startswith("take_"):
+                _, n = self._get_exposure_parameters(operation, args, kwargs)
+                visit_ids = list(range(self._next_visit_id, self._next_visit_id + n))
+                self._next_visit_id += n
+                return visit_ids
+            return None
+
+        return timed_operation
+
+
+async def dry_run(
+    script: salobj.BaseScript,
+    config: dict[str, typing.Any],
+    stand_ins: dict[str, typing.Any] | None = None,
+    log: logging.Logger | None = None,
+) -> types.SimpleNamespace:
+    """Emulate the execution of a script and return its timeline.
+
+    The script is configured with ``config``, the observatory groups it uses
+    (by default ``tcs`` and ``camera``) are replaced by `TimingModelGroup`
+    stand-ins and the script runs on a `VirtualClock`, so sleeps and
+    exposures finish instantly.
+
+    The dry run does not talk to anything but the stand-ins: the
+    ``configure_*`` methods of the groups and ``get_obs_id`` are replaced by
+    no-ops, the progress record of a `BaseBlockScript` is neither read
+    nor written, so the full execution is emulated, and its artifacts are
+    recorded instead of uploaded.
+
+    Parameters
+    ----------
+    script : `salobj.BaseScript`
+        Script to emulate. It is configured and run directly, without going
+        through the SAL commands, so its state is not changed.
+    config : `dict`
+        Script configuration.
+    stand_ins : `dict`, optional
+        Attributes of the script to replace, e.g. ``tcs`` or ``camera``, and
+        the objects to replace them with. Defaults to `TimingModelGroup`
+        stand-ins for ``tcs``, ``camera`` and ``ocps``.
+    log : `logging.Logger`, optional
+        Logger.
+
+    Returns
+    -------
+    result : `types.SimpleNamespace`
+        Struct with the following attributes:
+
+        * ``timeline``: list of phases, each a `dict` with the ``name`` of
+          the checkpoint that started the phase, its ``start`` and
+          ``duration`` relative to the start of the script (sec).
+        * ``duration``: total emulated duration (sec).
+        * ``estimated_duration``: duration estimated by the script in
+          ``set_metadata`` (sec).
+        * ``artifacts``: keys of the artifacts the script published, which
+          were not uploaded.
+    """
+    if log is None:
+        log = script.log
+
+    if stand_ins is None:
+        stand_ins = dict(
+            tcs=TimingModelGroup("tcs"),
+            camera=TimingModelGroup("camera"),
+            ocps=TimingModelGroup("ocps"),
+        )
+
+    async def no_op(*args: typing.Any, **kwargs: typing.Any) -> None:
+        return None
+
+    clock = VirtualClock()
+    checkpoints: list[tuple[str, float]] = []
+
+    async def record_checkpoint(name: str = "") -> None:
+        checkpoints.append((name, clock.elapsed))
+
+    artifacts: list[str] = []
+
+    def record_artifact(key: str, payload: bytes | str) -> bool:
+        artifacts.append(key)
+        return True
+
+    with contextlib.ExitStack() as stack:
+        for name, stand_in in stand_ins.items():
+            if isinstance(getattr(type(script), name, None), property):
+                stack.enter_context(
+                    mock.patch.object(
+                        type(script), name, property(lambda self, obj=stand_in: obj)
+                    )
+                )
+            else:
+                stack.enter_context(mock.patch.object(script, name, stand_in))
+        for name in (
+            "configure_tcs",
+            "configure_camera",
+            "configure_ocps",
+            "get_obs_id",
+        ):
+            if hasattr(script, name):
+                stack.enter_context(mock.patch.object(script, name, no_op))
+        stack.enter_context(mock.patch.object(script, "checkpoint", record_checkpoint))
+        artifact_uploader = getattr(script, "artifact_uploader", None)
+        if artifact_uploader is not None:
+            stack.enter_context(
+                mock.patch.object(artifact_uploader, "upload", record_artifact)
+            )
+
+        full_config = (
+            dict(config)
+            if script.config_validator is None
+            else script.config_validator.validate(config)
+        )
+        await script.configure(types.SimpleNamespace(**full_config))
+        if getattr(script, "progress", None) is not None:
+            stack.enter_context(mock.patch.object(script, "progress", None))
+
+        metadata = types.SimpleNamespace(duration=0.0)
+        script.set_metadata(metadata)
+
+        with clock.patch_loop():
+            checkpoints.append(("start", 0.0))
+            try:
+                await script.run()
+            finally:
+                checkpoints.append(("cleanup", clock.elapsed))
+                await script.cleanup()
+                end_time = clock.elapsed
+
+    timeline = []
+    for (name, start), (_, end) in zip(checkpoints, checkpoints[1:] + [("", end_time)]):
+        timeline.append(dict(name=name, start=start, duration=end - start))
+        log.debug(f"{start:10.1f}s {end - start:10.1f}s {name}")
+
+    log.info(
+        f"Emulated duration: {end_time:0.1f}s; "
+        f"estimated duration: {metadata.duration:0.1f}s."
+    )
+
+    return types.SimpleNamespace(
+        timeline=timeline,
+        duration=end_time,
+        estimated_duration=metadata.duration,
+        artifacts=artifacts,
+    )
@@ -25,6 +25,8 @@ import abc
 
 from lsst.ts import salobj
 
+from .group_state import GroupStateTransition
+
 
 class EnableGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
     """Base Script for enabling groups of CSCs.
@@ -75,11 +77,13 @@ class EnableGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
 
     **Checkpoints**
 
-    None
+    * The result of each component, e.g. "atmcs done in 3.2s (1 attempt(s))",
+      after each attempt.
 
     **Details**
 
-    All CSCs will be enabled concurrently.
+    All CSCs will be enabled concurrently. CSCs that fail are retried, up to
+    ``max_attempts`` times, see `GroupStateTransition`.
 
     """
 
@@ -88,6 +92,11 @@ class EnableGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
 
         self.config = None
 
+        # maximum number of attempts to transition each component;
+        # only the components that failed are retried
+        self.max_attempts = 2
+        self.group_state_transition = None
+
     @property
     @abc.abstractmethod
     def group(self):
@@ -120,8 +129,15 @@ class EnableGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
         if hasattr(config, "ignore"):
             self.group.disable_checks_for_components(components=config.ignore)
 
+        self.group_state_transition = GroupStateTransition(
+            group=self.group,
+            state=salobj.State.ENABLED,
+            max_attempts=self.max_attempts,
+            log=self.log,
+        )
+
     def set_metadata(self, metadata):
-        metadata.duration = 60.0
+        metadata.duration = self.group_state_transition.estimate_duration()
 
     async def run(self):
         overrides = (
@@ -129,4 +145,6 @@ class EnableGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
             if self.config is not None
             else None
         )
-        await self.group.enable(overrides=overrides)
+        await self.group_state_transition.run(
+            overrides=overrides, checkpoint=self.checkpoint
+        )
@@ -0,0 +1,292 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["ComponentTransition", "GroupStateTransition"]
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import pathlib
+import time
+import typing
+
+from lsst.ts import salobj
+
+# Environment variable with the directory where transition durations are
+# stored.
+TIMINGS_DIR_ENV_VAR = "LSST_GROUP_STATE_TIMINGS_DIR"
+
+
+@dataclasses.dataclass
+class ComponentTransition:
+    """Result of the transition of a component of a group.
+
+    Attributes
+    ----------
+    component : `str`
+        Name of the component, as in ``group.components_attr``.
+    attempts : `int`
+        Number of attempts.
+    duration : `float`
+        Duration of the last attempt (seconds).
+    error : `str`
+        Error of the last attempt, empty if it succeeded.
+    """
+
+    component: str
+    attempts: int = 0
+    duration: float = 0.0
+    error: str = ""
+
+    @property
+    def succeeded(self) -> bool:
+        """Did the component reach the desired state?"""
+        return self.attempts > 0 and not self.error
+
+    def __str__(self) -> str:
+        outcome = f"failed: {self.error}" if self.error else "done"
+        return (
+            f"{self.component} {outcome} in {self.duration:0.1f}s "
+            f"({self.attempts} attempt(s))"
+        )
+
+
+class GroupStateTransition:
+    """Put the components of a group in a summary state, timing each
+    component and retrying only the ones that fail.
+
+    If a directory to store them is given, the duration of each successful
+    transition is stored, so the next execution can estimate its duration,
+    see `estimate_duration`.
+
+    Parameters
+    ----------
+    group : `lsst.ts.observatory.control.RemoteGroup`
+        Group of CSCs, e.g. `ATCS` or `MTCS`.
+    state : `lsst.ts.salobj.State`
+        Desired summary state.
+    max_attempts : `int`, optional
+        Maximum number of attempts for each component.
+    default_duration : `float`, optional
+        Estimated duration of a transition, for components that were never
+        timed (seconds).
+    timings_dir : `str` or `pathlib.Path`, optional
+        Directory where the durations are stored. If not given, use the
+        ``LSST_GROUP_STATE_TIMINGS_DIR`` environment variable or, if not
+        set, do not store them.
+    log : `logging.Logger`, optional
+        Logger.
+    """
+
+    def __init__(
+        self,
+        group: typing.Any,
+        state: salobj.State,
+        max_attempts: int = 2,
+        default_duration: float = 60.0,
+        timings_dir: str | pathlib.Path | None = None,
+        log: logging.Logger | None = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts={max_attempts} must be at least 1.")
+
+        if timings_dir is None:
+            timings_dir = os.environ.get(TIMINGS_DIR_ENV_VAR)
+
+        self.group = group
+        self.state = state
+        self.max_attempts = max_attempts
+        self.default_duration = default_duration
+        self.path = (
+            None
+            if timings_dir is None
+            else pathlib.Path(timings_dir).expanduser()
+            / f"{type(group).__name__}_{state.name}.json"
+        )
+        self.log = (
+            logging.getLogger(type(self).__name__)
+            if log is None
+            else log.getChild(type(self).__name__)
+        )
+
+        self.results: dict[str, ComponentTransition] = dict()
+
+    @property
+    def components(self) -> list[str]:
+        """Components of the group that are not ignored."""
+        return [
+            component
+            for component in self.group.components_attr
+            if getattr(self.group.check, component)
+        ]
+
+    def load_timings(self) -> dict[str, float]:
+        """Load the stored transition durations.
+
+        Returns
+        -------
+        timings : `dict` [`str`, `float`]
+            Duration of the last successful transition of each component
+            (seconds). Empty if the durations are not stored.
+        """
+        if self.path is None or not self.path.exists():
+            return dict()
+        try:
+            return json.loads(self.path.read_text())
+        except Exception:
+            self.log.exception(f"Failed to read transition durations {self.path}.")
+            return dict()
+
+    def save_timings(self) -> None:
+        """Store the durations of the successful transitions, if a
+        directory to store them was given.
+        """
+        if self.path is None:
+            return
+
+        timings = self.load_timings()
+        timings.update(
+            {
+                component: result.duration
+                for component, result in self.results.items()
+                if result.succeeded
+            }
+        )
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(timings))
+            os.replace(tmp_path, self.path)
+        except Exception:
+            self.log.exception(f"Failed to write transition durations {self.path}.")
+
+    def estimate_duration(self) -> float:
+        """Estimate the duration of the transition of the group.
+
+        Components transition concurrently, so this is the longest
+        stored duration of the components.
+
+        Returns
+        -------
+        duration : `float`
+            Estimated duration (seconds).
+        """
+        timings = self.load_timings()
+        return max(
+            (
+                timings.get(component, self.default_duration)
+                for component in self.components
+            ),
+            default=0.0,
+        )
+
+    async def run(
+        self,
+        overrides: dict[str, str] | None = None,
+        checkpoint: typing.Callable[[str], typing.Awaitable[None]] | None = None,
+    ) -> dict[str, ComponentTransition]:
+        """Put the components in the desired state.
+
+        All components transition concurrently. Components that fail are
+        retried, up to ``max_attempts`` times.
+
+        Parameters
+        ----------
+        overrides : `dict` [`str`, `str`], optional
+            Configuration overrides for each component.
+        checkpoint : coroutine function, optional
+            Called with the result of each component after each attempt,
+            e.g. the ``checkpoint`` method of the script.
+
+        Returns
+        -------
+        results : `dict` [`str`, `ComponentTransition`]
+            Result of each component.
+
+        Raises
+        ------
+        RuntimeError
+            If any component fails to transition after ``max_attempts``.
+        """
+        self.results = {
+            component: ComponentTransition(component=component)
+            for component in self.components
+        }
+        pending = list(self.results)
+
+        for attempt in range(1, self.max_attempts + 1):
+            if attempt > 1:
+                self.log.warning(
+                    f"Retrying {len(pending)} failed component(s): {pending}."
+                )
+            await asyncio.gather(
+                *[
+                    self.transition(self.results[component], overrides)
+                    for component in pending
+                ]
+            )
+            if checkpoint is not None:
+                for component in pending:
+                    await checkpoint(str(self.results[component]))
+            pending = [
+                component for component in pending if self.results[component].error
+            ]
+            if not pending:
+                break
+
+        self.save_timings()
+
+        results_table = "\n".join(str(result) for result in self.results.values())
+        self.log.info(f"Set {self.state.name} results:\n{results_table}")
+
+        if pending:
+            raise RuntimeError(
+                f"Failed to set {pending} to {self.state.name} "
+                f"after {self.max_attempts} attempt(s)."
+            )
+
+        return self.results
+
+    async def transition(
+        self, result: ComponentTransition, overrides: dict[str, str] | None
+    ) -> None:
+        """Put one component in the desired state and record the result.
+
+        Parameters
+        ----------
+        result : `ComponentTransition`
+            Result of the component, updated in place.
+        overrides : `dict` [`str`, `str`] or `None`
+            Configuration overrides for each component.
+        """
+        result.attempts += 1
+        start_time = time.monotonic()
+        try:
+            await self.group.set_state(
+                self.state, overrides=overrides, components=[result.component]
+            )
+            result.error = ""
+        except Exception as e:
+            result.error = str(e) or repr(e)
+        finally:
+            result.duration = time.monotonic() - start_time
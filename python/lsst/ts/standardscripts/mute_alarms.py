@@ -21,6 +21,9 @@
 
 __all__ = ["MuteAlarms"]
 
+import asyncio
+import time
+
 import yaml
 from lsst.ts import salobj
 from lsst.ts.xml.enums.Watcher import AlarmSeverity
@@ -34,6 +37,12 @@ class MuteAlarms(salobj.BaseScript):
     ----------
     index : `int`
         Index of Script SAL component.
+
+    Notes
+    -----
+    Several sets of alarms can be muted at once using ``alarms``.
+    The mute commands are sent concurrently and the script fails,
+    after all of them are done, if any of them failed.
     """
 
     def __init__(self, index):
@@ -57,6 +66,35 @@ class MuteAlarms(salobj.BaseScript):
                         Name of alarm or alarms to mute.
                         Specify a regular expression for multiple alarms.
                     type: string
+                alarms:
+                    description: >-
+                        Alarms to mute, in addition to name. Each entry
+                        uses the top level duration and severity unless
+                        it specifies its own.
+                    type: array
+                    minItems: 1
+                    items:
+                        type: object
+                        properties:
+                            name:
+                                description: >-
+                                    Name of alarm or alarms to mute.
+                                    Specify a regular expression for
+                                    multiple alarms.
+                                type: string
+                            duration:
+                                description: Duration of the mute command in seconds.
+                                type: number
+                                minimum: 0
+                            severity:
+                                description: >-
+                                    Severity level being muted.
+                                    An AlarmSeverity enum.
+                                type: string
+                                enum: {[e.name for e in AlarmSeverity]}
+                        additionalProperties: false
+                        required:
+                            - name
                 mutedBy:
                     description: User who muted the alarm(s).
                     type: string
@@ -73,8 +111,12 @@ class MuteAlarms(salobj.BaseScript):
                     enum: {[e.name for e in AlarmSeverity]}
                     default: "None"
             additionalProperties: false
+            anyOf:
+                - required:
+                    - name
+                - required:
+                    - alarms
             required:
-                - name
                 - mutedBy
                 - duration
                 - severity
@@ -89,11 +131,27 @@ class MuteAlarms(salobj.BaseScript):
         config : `types.SimpleNamespace`
             Configuration
         """
-        self.name = config.name
         self.mutedBy = config.mutedBy
         self.duration = config.duration
         self.severity = AlarmSeverity[config.severity]
 
+        # List of (name, duration, severity) of the alarms to mute.
+        self.alarms = []
+        if hasattr(config, "name"):
+            self.alarms.append((config.name, self.duration, self.severity))
+        for alarm in getattr(config, "alarms", []):
+            self.alarms.append(
+                (
+                    alarm["name"],
+                    alarm.get("duration", self.duration),
+                    (
+                        AlarmSeverity[alarm["severity"]]
+                        if "severity" in alarm
+                        else self.severity
+                    ),
+                )
+            )
+
         # Create the Watcher remote
         if self.watcher is None:
             self.watcher = salobj.Remote(
@@ -103,15 +161,57 @@ class MuteAlarms(salobj.BaseScript):
             await self.watcher.start_task
 
     def set_metadata(self, metadata):
-        metadata.duration = self.duration
+        metadata.duration = max(duration for _, duration, _ in self.alarms)
 
-    async def run(self):
-        """Run the script."""
-        self.log.info(f"Muting alarm(s) {self.name} for {self.duration} seconds.")
+    async def mute(self, name, duration, severity):
+        """Mute alarms.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of alarm or alarms to mute.
+        duration : `float`
+            Duration of the mute command in seconds.
+        severity : `AlarmSeverity`
+            Severity level being muted.
+
+        Returns
+        -------
+        elapsed : `float`
+            Time it took the Watcher to acknowledge the command (seconds).
+        """
+        self.log.info(f"Muting alarm(s) {name} for {duration} seconds.")
+        start_time = time.monotonic()
         await self.watcher.cmd_mute.set_start(
-            name=self.name,
-            duration=self.duration,
-            severity=self.severity,
+            name=name,
+            duration=duration,
+            severity=severity,
             mutedBy=self.mutedBy,
             timeout=self.std_timeout,
         )
+        return time.monotonic() - start_time
+
+    async def run(self):
+        """Run the script."""
+        start_time = time.monotonic()
+        results = await asyncio.gather(
+            *[self.mute(*alarm) for alarm in self.alarms], return_exceptions=True
+        )
+        elapsed = time.monotonic() - start_time
+
+        summary = []
+        failed = []
+        for (name, _, _), result in zip(self.alarms, results):
+            if isinstance(result, Exception):
+                summary.append(f"{name}: failed with {result!r}")
+                failed.append(name)
+            else:
+                summary.append(f"{name}: acknowledged in {result:0.2f}s")
+        summary_str = "\n".join(summary)
+        self.log.info(
+            f"Sent {len(self.alarms)} mute command(s) in {elapsed:0.2f}s; "
+            f"{len(failed)} failed:\n{summary_str}"
+        )
+
+        if failed:
+            raise RuntimeError(f"Failed to mute alarm(s): {', '.join(failed)}.")
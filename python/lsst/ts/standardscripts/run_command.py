@@ -21,9 +21,120 @@
 
 __all__ = ["RunCommand"]
 
+import asyncio
+import dataclasses
+import itertools
+import operator
+import time
+import typing
+
 import yaml
 from lsst.ts import salobj
 
+from .topic_metadata import get_component_metadata
+
+# Comparison operators for event conditions.
+CONDITION_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+@dataclasses.dataclass
+class CommandEntry:
+    """A command to run, and optionally an event to wait for, and its
+    results.
+
+    Attributes
+    ----------
+    name : `str`
+        Name of the CSC.
+    index : `int`
+        Index of the CSC.
+    cmd : `str`
+        Name of the command.
+    data : ``cmd.DataType``
+        Command message.
+    timeout : `float`
+        Timeout to wait for the command to complete (seconds).
+    event : `str` or `None`
+        Name of the event to wait for after the command.
+    flush : `bool`
+        Flush the event before sending the command?
+    event_timeout : `float`
+        Timeout to wait for the event (seconds).
+    event_condition : `list` [`tuple`]
+        Conditions the event must satisfy, as (field, operator, value);
+        if empty, any sample of the event will do.
+    stage : `int`
+        Stage of the command.
+    cmd_latency : `float` or `None`
+        Time it took the command to complete (seconds).
+    event_latency : `float` or `None`
+        Time it took the event to arrive after the command (seconds).
+    event_data : ``evt.DataType`` or `None`
+        Event sample that satisfied the event condition.
+    error : `str`
+        Error, empty if the command and event succeeded.
+    """
+
+    name: str
+    index: int
+    cmd: str
+    data: typing.Any
+    timeout: float
+    event: str | None = None
+    flush: bool = False
+    event_timeout: float = 30.0
+    event_condition: list[tuple[str, str, typing.Any]] = dataclasses.field(
+        default_factory=list
+    )
+    stage: int = 0
+    cmd_latency: float | None = None
+    event_latency: float | None = None
+    event_data: typing.Any = None
+    error: str = ""
+
+    @property
+    def event_condition_str(self) -> str:
+        """The event condition in a readable format."""
+        return " and ".join(
+            f"{field} {op} {value!r}" for field, op, value in self.event_condition
+        )
+
+    def matches(self, data: typing.Any) -> bool:
+        """Does an event sample satisfy the event condition?
+
+        Parameters
+        ----------
+        data : ``evt.DataType``
+            Event sample.
+
+        Returns
+        -------
+        `bool`
+            `True` if the sample satisfies all the conditions.
+        """
+        return all(
+            CONDITION_OPERATORS[op](getattr(data, field), value)
+            for field, op, value in self.event_condition
+        )
+
+    def __str__(self) -> str:
+        description = f"{self.name}:{self.index}:{self.cmd}"
+        if self.error:
+            return f"{description} failed: {self.error}"
+        elif self.cmd_latency is None:
+            return f"{description} not run"
+        result = f"{description} done in {self.cmd_latency:0.3f}s"
+        if self.event_latency is not None:
+            result += f", {self.event} after {self.event_latency:0.3f}s"
+        return result
+
 
 class RunCommand(salobj.BaseScript):
     """Run a command from a CSC and, optionally, wait for an event once the
@@ -41,6 +152,15 @@ class RunCommand(salobj.BaseScript):
     **Details**
 
     * Dynamically loads IDL files as needed.
+    * With ``event_condition``, each sample of the event is checked as it
+      arrives, until one satisfies all the conditions or ``event_timeout``
+      expires. The event is only flushed before sending the command.
+    * Several commands can be run with ``commands``. Commands in the same
+      stage run concurrently, up to ``max_concurrency`` at a time, and
+      stages run in increasing order. Each CSC remote is created only once.
+      If any command of a stage fails, the following stages are not run.
+      Commands of the same stage cannot wait for the same event of the same
+      CSC.
     """
 
     def __init__(self, index):
@@ -49,6 +169,9 @@ class RunCommand(salobj.BaseScript):
         # approximate time to construct a Remote for a CSC (sec)
         self.create_remote_time = 15
 
+        self.entries = []
+        self.remotes = dict()
+
     @classmethod
     def get_schema(cls):
         schema_yaml = """
@@ -77,6 +200,30 @@ class RunCommand(salobj.BaseScript):
                 description: Timeout (seconds) to wait for the event to arrive.
                 type: number
                 default: 30
+              event_condition:
+                description: >-
+                    Conditions on the fields of the event. Wait for a sample that
+                    satisfies all of them, instead of the first sample.
+                type: array
+                minItems: 1
+                items:
+                  type: object
+                  properties:
+                    field:
+                      description: Name of the event field.
+                      type: string
+                    op:
+                      description: Comparison operator.
+                      type: string
+                      enum: ["==", "!=", "<", "<=", ">", ">="]
+                      default: "=="
+                    value:
+                      description: >-
+                          Value to compare the field with. Integer fields that hold
+                          an enumeration, e.g. summaryState, also accept the name of
+                          the value, e.g. ENABLED or State.ENABLED.
+                  required: [field, value]
+                  additionalProperties: false
               parameters:
                 description: Parameters for the command.
                 type: object
@@ -86,7 +233,81 @@ class RunCommand(salobj.BaseScript):
                     type: number
                     default: 30
                 additionalProperties: true
-            required: [component, cmd]
+              commands:
+                description: >-
+                    Commands to run, instead of component and cmd. Each
+                    command uses the top level flush and event_timeout
+                    unless it specifies its own.
+                type: array
+                minItems: 1
+                items:
+                  type: object
+                  properties:
+                    component:
+                      description: Name of the CSC to run command, format is
+                          CSC_name[:index]; the default index is 0.
+                      type: string
+                    cmd:
+                      description: Name of the command to run.
+                      type: string
+                    event:
+                      description: >-
+                          Name of the event to wait after the command is sent.
+                      type: string
+                    flush:
+                      description: Flush event before sending command?
+                      type: boolean
+                    event_timeout:
+                      description: Timeout (seconds) to wait for the event to arrive.
+                      type: number
+                    event_condition:
+                      description: >-
+                          Conditions on the fields of the event. Wait for a sample that
+                          satisfies all of them, instead of the first sample.
+                      type: array
+                      minItems: 1
+                      items:
+                        type: object
+                        properties:
+                          field:
+                            description: Name of the event field.
+                            type: string
+                          op:
+                            description: Comparison operator.
+                            type: string
+                            enum: ["==", "!=", "<", "<=", ">", ">="]
+                            default: "=="
+                          value:
+                            description: Value to compare the field with.
+                        required: [field, value]
+                        additionalProperties: false
+                    parameters:
+                      description: Parameters for the command.
+                      type: object
+                      properties:
+                        timeout:
+                          description: >-
+                              Timeout (seconds) to wait for the command to
+                              complete.
+                          type: number
+                          default: 30
+                      additionalProperties: true
+                    stage:
+                      description: >-
+                          Stage of the command. Commands in the same stage
+                          run concurrently; stages run in increasing order.
+                      type: integer
+                      default: 0
+                  required: [component, cmd]
+                  additionalProperties: false
+              max_concurrency:
+                description: Maximum number of commands to run at the same time.
+                type: integer
+                minimum: 1
+                default: 10
+            oneOf:
+              - required: [component, cmd]
+              - required: [commands]
             additionalProperties: false
         """
         return yaml.safe_load(schema_yaml)
@@ -105,40 +326,149 @@ class RunCommand(salobj.BaseScript):
         Raises
         ------
         RuntimeError:
-            If `config.command` is not a valid command from the CSC.
+            If `config.command` is not a valid command from the CSC,
+            `config.event` is not a valid event, a parameter is not a
+            valid field of the command, or two commands of the same stage
+            wait for the same event of the same CSC.
 
         """
         self.log.info("Configure started")
 
         self.config = config
 
-        self.name, self.index = salobj.name_to_name_index(config.component)
-        self.event = config.event if hasattr(config, "event") else None
-
-        self.remote = salobj.Remote(
-            domain=self.domain,
-            name=self.name,
-            index=self.index,
-            include=[self.event] if self.event is not None else [],
-        )
-
-        if config.cmd in self.remote.salinfo.command_names:
-            self.cmd = config.cmd
+        if hasattr(config, "commands"):
+            command_configs = config.commands
         else:
-            raise RuntimeError(
-                f"Command {config.cmd} not a valid command for {self.name}."
+            command_configs = [
+                dict(
+                    component=config.component,
+                    cmd=config.cmd,
+                    event=getattr(config, "event", None),
+                    event_condition=getattr(config, "event_condition", []),
+                    parameters=getattr(config, "parameters", dict(timeout=30)),
+                )
+            ]
+
+        # Validate all commands, events and parameters with the cached
+        # component metadata, before constructing any remote.
+        name_indices = []
+        event_conditions = []
+        events = dict()
+        stage_events = set()
+        for command_config in command_configs:
+            name_index = salobj.name_to_name_index(command_config["component"])
+            parameters = dict(command_config.get("parameters", dict()))
+            parameters.pop("timeout", None)
+            event = command_config.get("event")
+
+            metadata = get_component_metadata(name_index[0])
+            if command_config.get("event_condition") and event is None:
+                raise RuntimeError(
+                    f"event_condition for {command_config['component']} "
+                    f"command {command_config['cmd']} requires event."
+                )
+            event_condition = [
+                (
+                    condition["field"],
+                    condition.get("op", "=="),
+                    metadata.resolve_enum_value(
+                        event, condition["field"], condition["value"]
+                    ),
+                )
+                for condition in command_config.get("event_condition", [])
+            ]
+
+            metadata.validate_command(command_config["cmd"], parameters)
+            if event is not None:
+                metadata.validate_event(
+                    event,
+                    values=[(field, value) for field, _, value in event_condition],
+                )
+
+            if event is not None:
+                # Concurrent waits on the same topic would share (and flush)
+                # the same event queue, so each would not get its own sample.
+                stage_event = (name_index, command_config.get("stage", 0), event)
+                if stage_event in stage_events:
+                    raise RuntimeError(
+                        f"More than one command of stage {stage_event[1]} "
+                        f"waits for {command_config['component']} event {event}; "
+                        "put them in different stages."
+                    )
+                stage_events.add(stage_event)
+
+            name_indices.append(name_index)
+            event_conditions.append(event_condition)
+            events.setdefault(name_index, set())
+            if event is not None:
+                events[name_index].add(event)
+
+        # Create each remote once, with all the events it needs.
+        self.remotes = {
+            (name, index): salobj.Remote(
+                domain=self.domain,
+                name=name,
+                index=index,
+                include=sorted(events[(name, index)]),
             )
-
-        getattr(self.remote, f"cmd_{self.cmd}").set(
-            **dict(
-                [(k, config.parameters[k]) for k in config.parameters if k != "timeout"]
+            for name, index in events
+        }
+
+        self.entries = []
+        for (name, index), command_config, event_condition in zip(
+            name_indices, command_configs, event_conditions
+        ):
+            remote = self.remotes[(name, index)]
+            cmd = command_config["cmd"]
+            event = command_config.get("event")
+
+            parameters = dict(command_config.get("parameters", dict()))
+            timeout = parameters.pop("timeout", 30)
+            command = getattr(remote, f"cmd_{cmd}")
+            command.data = command.DataType()
+            command.set(**parameters)
+
+            self.entries.append(
+                CommandEntry(
+                    name=name,
+                    index=index,
+                    cmd=cmd,
+                    data=command.data,
+                    timeout=timeout,
+                    event=event,
+                    flush=(
+                        command_config.get("flush", config.flush)
+                        if event is not None
+                        else False
+                    ),
+                    event_timeout=command_config.get(
+                        "event_timeout", config.event_timeout
+                    ),
+                    event_condition=event_condition,
+                    stage=command_config.get("stage", 0),
+                )
             )
-        )
 
-        self.flush = config.flush if self.event is not None else False
-
-        if self.event is not None and self.event not in self.remote.salinfo.event_names:
-            raise RuntimeError(f"Event {self.event} not a valid event for {self.name}.")
+        self.max_concurrency = config.max_concurrency
+
+        if not hasattr(config, "commands"):
+            entry = self.entries[0]
+            self.name, self.index = entry.name, entry.index
+            self.cmd = entry.cmd
+            self.event = entry.event
+            self.flush = entry.flush
+            self.remote = self.remotes[(self.name, self.index)]
+
+    @property
+    def stages(self):
+        """Commands grouped by stage, in increasing stage order."""
+        entries = sorted(self.entries, key=lambda entry: entry.stage)
+        return [
+            list(stage_entries)
+            for _, stage_entries in itertools.groupby(
+                entries, key=lambda entry: entry.stage
+            )
+        ]
 
     def set_metadata(self, metadata):
         """Compute estimated duration.
@@ -149,33 +479,137 @@ class RunCommand(salobj.BaseScript):
 
         """
         # a crude estimate using command and event timeouts.
-        metadata.duration = (
-            self.config.parameters["timeout"] + self.config.event_timeout
-            if self.flush
-            else 0.0
-        )
+        duration = 0.0
+        for stage_entries in self.stages:
+            n_batches = -(-len(stage_entries) // self.max_concurrency)
+            duration += n_batches * max(
+                entry.timeout + (entry.event_timeout if entry.event else 0.0)
+                for entry in stage_entries
+            )
+        metadata.duration = duration
 
     async def run(self):
         """Run script."""
 
-        if not self.remote.start_task.done():
-            self.log.debug("Waiting for remote start_task to complete.")
-            await self.remote.start_task
+        tasks = [
+            remote.start_task
+            for remote in self.remotes.values()
+            if not remote.start_task.done()
+        ]
+        if tasks:
+            self.log.debug(f"Waiting for {len(tasks)} remote start_task to complete.")
+            await asyncio.gather(*tasks)
+
+        # Commands run concurrently but share the script checkpoints.
+        self.checkpoint_lock = asyncio.Lock()
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        failed = []
+        for stage_entries in self.stages:
+            await asyncio.gather(*[self.run_entry(entry) for entry in stage_entries])
+            failed = [entry for entry in stage_entries if entry.error]
+            if failed:
+                break
+
+        if len(self.entries) > 1:
+            results_table = "\n".join(str(entry) for entry in self.entries)
+            self.log.info(f"Results:\n{results_table}")
+
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} command(s) failed: "
+                + "; ".join(str(entry) for entry in failed)
+            )
 
-        if self.flush:
-            getattr(self.remote, f"evt_{self.event}").flush()
+    async def run_entry(self, entry):
+        """Run one command and wait for its event, if any.
 
-        await self.checkpoint(f"run {self.name}:{self.index}:{self.cmd}")
+        Errors are recorded in ``entry.error``, except for the ones that
+        stop the script.
 
-        await getattr(self.remote, f"cmd_{self.cmd}").start(
-            timeout=self.config.parameters["timeout"]
-        )
+        Parameters
+        ----------
+        entry : `CommandEntry`
+            Command to run; its results are updated in place.
+        """
+        remote = self.remotes[(entry.name, entry.index)]
+        async with self.semaphore:
+            if entry.flush:
+                getattr(remote, f"evt_{entry.event}").flush()
+
+            async with self.checkpoint_lock:
+                await self.checkpoint(f"run {entry.name}:{entry.index}:{entry.cmd}")
+
+            try:
+                start_time = time.monotonic()
+                await getattr(remote, f"cmd_{entry.cmd}").start(
+                    data=entry.data, timeout=entry.timeout
+                )
+                entry.cmd_latency = time.monotonic() - start_time
+            except Exception as e:
+                entry.error = str(e) or repr(e)
+                return
+
+            if entry.event is None:
+                return
+
+            async with self.checkpoint_lock:
+                await self.checkpoint(f"wait {entry.name}:{entry.index}:{entry.event}")
+
+            try:
+                evt = await self.wait_event(entry)
+            except Exception as e:
+                entry.error = str(e) or repr(e)
+                return
+
+            self.log.info(evt)
 
-        if self.event is not None:
-            await self.checkpoint(f"wait {self.name}:{self.index}:{self.event}")
+    async def wait_event(self, entry):
+        """Wait for the event of a command.
 
-            evt = await getattr(self.remote, f"evt_{self.event}").next(
-                flush=False, timeout=self.config.event_timeout
-            )
+        If the command has an event condition, check each sample as it
+        arrives, until one satisfies the condition.
 
-            self.log.info(evt)
+        Parameters
+        ----------
+        entry : `CommandEntry`
+            Command whose event to wait for; ``event_latency`` and
+            ``event_data`` are updated in place.
+
+        Returns
+        -------
+        evt : ``evt.DataType``
+            The first event sample that satisfies the condition.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If no sample satisfies the condition within ``event_timeout``.
+        """
+        topic = getattr(self.remotes[(entry.name, entry.index)], f"evt_{entry.event}")
+        start_time = time.monotonic()
+        n_samples = 0
+        while True:
+            remaining_time = entry.event_timeout - (time.monotonic() - start_time)
+            try:
+                evt = await topic.next(flush=False, timeout=max(remaining_time, 0.0))
+            except asyncio.TimeoutError:
+                if not entry.event_condition:
+                    raise
+                raise asyncio.TimeoutError(
+                    f"No {entry.event} sample with {entry.event_condition_str} "
+                    f"in {entry.event_timeout}s; checked {n_samples} sample(s)."
+                )
+            n_samples += 1
+            if entry.matches(evt):
+                break
+
+        entry.event_latency = time.monotonic() - start_time
+        entry.event_data = evt
+        if entry.event_condition:
+            self.log.info(
+                f"{entry.name}:{entry.index} {entry.event} matched "
+                f"{entry.event_condition_str} in {entry.event_latency:0.3f}s, "
+                f"after {n_samples} sample(s)."
+            )
+        return evt
@@ -19,19 +19,27 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-__all__ = ["AddBlock"]
+__all__ = ["AddBlock", "validate_blocks", "add_blocks", "assert_blocks_added"]
 
-import math
+import logging
+import time
 import types
+import typing
 
 import yaml
 from lsst.ts import salobj
 from lsst.ts.xml.enums.Scheduler import SalIndex
 
+from .utils import assert_scheduler_queue
+
 
 class AddBlock(salobj.BaseScript):
     """A base script that implements loading BLOCKS to the Scheduler.
 
+    The script accepts either a single BLOCK (``id`` and ``override``) or a
+    list of them (``blocks``), which are all validated before any is sent
+    to the Scheduler and are then added in the order given.
+
     Parameters
     ----------
     index : `int`
@@ -57,7 +65,7 @@ class AddBlock(salobj.BaseScript):
         schema_yaml = """
             $schema: http://json-schema.org/draft-07/schema#
             $id: https://github.com/lsst-ts/ts_standardscripts/scheduler/base_load_snapshot.py
-            title: BaseAddBlock v1
+            title: BaseAddBlock v2
             description: Configuration for adding BLOCK to scheduler.
             type: object
             properties:
@@ -71,7 +79,33 @@ class AddBlock(salobj.BaseScript):
                         provided in YAML format. This feature is not yet implemented in the
                         Scheduler CSC.
                     additionalProperties: true
-            required: [id]
+                blocks:
+                    type: array
+                    description: >-
+                        List of BLOCKs to load, in order. Use this instead of id/override
+                        to load several BLOCKs with one script.
+                    minItems: 1
+                    items:
+                        type: object
+                        properties:
+                            id:
+                                type: string
+                                description: id of BLOCK to load.
+                            override:
+                                type: object
+                                description: Configuration overrides to pass to the BLOCK.
+                                additionalProperties: true
+                        required: [id]
+                        additionalProperties: false
+            oneOf:
+                - required: [id]
+                  not:
+                    required: [blocks]
+                - required: [blocks]
+                  not:
+                    anyOf:
+                      - required: [id]
+                      - required: [override]
             additionalProperties: false
             """
         return yaml.safe_load(schema_yaml)
@@ -85,10 +119,19 @@ class AddBlock(salobj.BaseScript):
             Configuration.
         """
 
-        self.id = config.id
-        self.override = getattr(config, "override", None)
+        if hasattr(config, "blocks"):
+            blocks = [
+                (block["id"], block.get("override", None)) for block in config.blocks
+            ]
+        else:
+            blocks = [(config.id, getattr(config, "override", None))]
+
+        self.blocks = validate_blocks(blocks)
+
         self.timeout_start = 30.0
 
+        self.block_results: typing.List[types.SimpleNamespace] = []
+
     def set_metadata(self, metadata: salobj.type_hints.BaseDdsDataType) -> None:
         """Set metadata fields in the provided struct, given the
         current configuration.
@@ -104,21 +147,191 @@ class AddBlock(salobj.BaseScript):
         This method is called after `configure` by `do_configure`.
         The script state will be `ScriptState.UNCONFIGURED`.
         """
-        metadata.duration = self.timeout_start
+        metadata.duration = self.timeout_start * len(self.blocks)
 
     async def run(self) -> None:
         # Prevent script from running on different queues
-        script_queue_index = math.floor(self.salinfo.index / 100000)
-        if script_queue_index != self.scheduler_remote.salinfo.index.value:
-            raise RuntimeError(
-                f"Script with index {self.salinfo.index} cannot run in"
-                f" {self.scheduler_remote.salinfo.index.name} queue."
-            )
+        assert_scheduler_queue(self.salinfo.index, self.scheduler_remote)
 
-        await self.checkpoint(f"Loading {self.id} into scheduler")
-        await self.scheduler_remote.cmd_addBlock.set_start(
-            id=self.id,
-            override=yaml.safe_dump(self.override),
+        self.block_results = await add_blocks(
+            scheduler_remote=self.scheduler_remote,
+            blocks=self.blocks,
             timeout=self.timeout_start,
+            log=self.log,
+            checkpoint=self.checkpoint,
         )
+        if len(self.block_results) == 1 and not self.block_results[0].success:
+            # A single BLOCK fails with the error from the Scheduler.
+            raise self.block_results[0].error
+        assert_blocks_added(self.block_results)
+
         await self.checkpoint("BLOCK successfully loaded")
+
+
+def dump_block_override(block_id: str, override: typing.Any) -> str:
+    """Validate a BLOCK id and override and dump the override to YAML.
+
+    Parameters
+    ----------
+    block_id : `str`
+        BLOCK id.
+    override : `dict` or `None`
+        BLOCK configuration override.
+
+    Returns
+    -------
+    override_yaml : `str`
+        Override in YAML format, as sent to the Scheduler.
+
+    Raises
+    ------
+    ValueError
+        If the id is blank or the override cannot be round-tripped
+        through YAML.
+
+    Notes
+    -----
+    The override is not validated against the configuration schema of the
+    BLOCK, which is only known to the Scheduler; the Scheduler rejects
+    invalid overrides when the BLOCK is added.
+    """
+    if not block_id.strip():
+        raise ValueError("BLOCK id must not be blank.")
+
+    try:
+        override_yaml = yaml.safe_dump(override)
+        round_trip_override = yaml.safe_load(override_yaml)
+    except yaml.YAMLError as e:
+        raise ValueError(f"{block_id}: override cannot be dumped to YAML: {e}")
+
+    if round_trip_override != override:
+        raise ValueError(f"{block_id}: override does not round-trip through YAML.")
+
+    return override_yaml
+
+
+def validate_blocks(
+    blocks: typing.List[typing.Tuple[str, typing.Any]],
+) -> typing.List[typing.Tuple[str, str]]:
+    """Validate BLOCKs before sending them to the Scheduler.
+
+    Parameters
+    ----------
+    blocks : `list` [`tuple` [`str`, `dict` or `None`]]
+        BLOCK ids and configuration overrides.
+
+    Returns
+    -------
+    validated_blocks : `list` [`tuple` [`str`, `str`]]
+        BLOCK ids and overrides in YAML format.
+
+    Raises
+    ------
+    ValueError
+        If any BLOCK is invalid. The message lists all invalid BLOCKs.
+    """
+    errors = []
+    validated_blocks = []
+    for block_id, override in blocks:
+        try:
+            validated_blocks.append((block_id, dump_block_override(block_id, override)))
+        except ValueError as e:
+            errors.append(str(e))
+
+    if errors:
+        raise ValueError(
+            f"{len(errors)} of {len(blocks)} BLOCKs failed validation: "
+            + "; ".join(errors)
+        )
+
+    return validated_blocks
+
+
+async def add_blocks(
+    scheduler_remote: salobj.Remote,
+    blocks: typing.List[typing.Tuple[str, str]],
+    timeout: float,
+    log: logging.Logger,
+    checkpoint: typing.Optional[
+        typing.Callable[[str], typing.Coroutine[typing.Any, typing.Any, None]]
+    ] = None,
+) -> typing.List[types.SimpleNamespace]:
+    """Add BLOCKs to the Scheduler, in order.
+
+    A rejected BLOCK does not prevent the following ones from being sent.
+
+    Parameters
+    ----------
+    scheduler_remote : `salobj.Remote`
+        Scheduler remote.
+    blocks : `list` [`tuple` [`str`, `str`]]
+        BLOCK ids and overrides, as returned by `validate_blocks`.
+    timeout : `float`
+        Timeout for each addBlock command (sec).
+    log : `logging.Logger`
+        Logger.
+    checkpoint : `coroutine`, optional
+        Script checkpoint, awaited before sending each BLOCK. When there
+        are several BLOCKs, the name includes the position of the BLOCK.
+
+    Returns
+    -------
+    block_results : `list` [`types.SimpleNamespace`]
+        For each BLOCK, its ``id``, ``success``, ``duration`` (sec) and
+        ``error``.
+    """
+    block_results = []
+    for i, (block_id, override_yaml) in enumerate(blocks):
+        if checkpoint is not None:
+            block_count = f" [{i+1}/{len(blocks)}]" if len(blocks) > 1 else ""
+            await checkpoint(f"Loading {block_id} into scheduler{block_count}")
+        start_time = time.monotonic()
+        try:
+            await scheduler_remote.cmd_addBlock.set_start(
+                id=block_id,
+                override=override_yaml,
+                timeout=timeout,
+            )
+            error = None
+        except salobj.AckError as e:
+            error = e
+        block_results.append(
+            types.SimpleNamespace(
+                id=block_id,
+                success=error is None,
+                duration=time.monotonic() - start_time,
+                error=error,
+            )
+        )
+
+    results_summary = "\n".join(
+        [
+            f"{result.id}: {'loaded' if result.success else 'failed'} "
+            f"in {result.duration:0.2f}s."
+            for result in block_results
+        ]
+    )
+    log.info(f"Add BLOCK results:\n{results_summary}")
+
+    return block_results
+
+
+def assert_blocks_added(block_results: typing.List[types.SimpleNamespace]) -> None:
+    """Assert that all BLOCKs were added to the Scheduler.
+
+    Parameters
+    ----------
+    block_results : `list` [`types.SimpleNamespace`]
+        Results returned by `add_blocks`.
+
+    Raises
+    ------
+    RuntimeError
+        If any BLOCK was rejected.
+    """
+    failed_blocks = [result for result in block_results if not result.success]
+    if failed_blocks:
+        raise RuntimeError(
+            f"Failed to load {len(failed_blocks)} of {len(block_results)} BLOCKs: "
+            + "; ".join([f"{result.id}: {result.error}" for result in failed_blocks])
+        )
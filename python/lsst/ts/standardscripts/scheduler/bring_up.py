@@ -0,0 +1,329 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["BringUp"]
+
+import time
+import types
+import typing
+
+import yaml
+from lsst.ts import salobj
+from lsst.ts.xml.enums.Scheduler import SalIndex
+
+from .add_block import add_blocks, assert_blocks_added, validate_blocks
+from .set_desired_state import SetDesiredState
+from .snapshot_index import SnapshotIndex
+from .utils import assert_scheduler_queue
+
+STEP_DESIRED_STATES = dict(
+    standby=salobj.State.STANDBY,
+    enable=salobj.State.ENABLED,
+)
+
+
+class BringUp(SetDesiredState):
+    """A base script that brings up the Scheduler running a list of steps
+    with a single script.
+
+    Each step is equivalent to one of the ``standby``, ``enable``,
+    ``load_snapshot``, ``add_block`` and ``resume`` scheduler scripts, but
+    all steps share the same Scheduler remote. State transition steps are
+    skipped if the Scheduler is already in the target state; to reload the
+    configuration of an enabled Scheduler add a ``standby`` step before
+    ``enable``.
+
+    Parameters
+    ----------
+    index : `int`
+        Index of Script SAL component.
+    scheduler_index : `int`
+        Index of the Scheduler to bring up.
+    """
+
+    def __init__(self, index: int, scheduler_index: SalIndex) -> None:
+        super().__init__(
+            index=index,
+            descr=f"Bring up {scheduler_index.name} Scheduler",
+            scheduler_index=scheduler_index,
+            desired_state=salobj.State.ENABLED,
+            include=["largeFileObjectAvailable"],
+        )
+
+        self.steps: typing.List[types.SimpleNamespace] = []
+        self.snapshot_index: typing.Optional[SnapshotIndex] = None
+
+        # Name, whether it was skipped and duration (sec) of each step run.
+        self.step_timings: typing.List[types.SimpleNamespace] = []
+        self.block_results: typing.List[types.SimpleNamespace] = []
+
+    @classmethod
+    def get_schema(cls) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        return yaml.safe_load(
+            """
+$schema: http://json-schema.org/draft-07/schema#
+$id: https://github.com/lsst-ts/ts_standardscripts/scheduler/bring_up.py
+title: BringUp v1
+description: Configuration for bringing up the scheduler.
+type: object
+properties:
+    steps:
+        description: >-
+            Steps to run, in order. Each step has a type and the
+            configuration of the equivalent scheduler script; "config" for
+            enable, "snapshot" for load_snapshot and either "id" and
+            "override" or "blocks" for add_block.
+        type: array
+        minItems: 1
+        items:
+            type: object
+            properties:
+                type:
+                    type: string
+                    enum: [standby, enable, load_snapshot, add_block, resume]
+                config:
+                    description: Scheduler configuration.
+                    type: string
+                snapshot:
+                    description: >-
+                        Snapshot to load. Either a valid uri, "latest" or a
+                        time selector.
+                    oneOf:
+                        - type: string
+                        - type: object
+                          properties:
+                            latest_before:
+                                description: >-
+                                    Load the last snapshot published before
+                                    this time (ISO format, UTC).
+                                type: string
+                          required:
+                            - latest_before
+                          additionalProperties: false
+                id:
+                    description: id of BLOCK to load.
+                    type: string
+                override:
+                    description: Configuration overrides to pass to the BLOCK.
+                    type: object
+                    additionalProperties: true
+                blocks:
+                    description: List of BLOCKs to load, in order.
+                    type: array
+                    minItems: 1
+                    items:
+                        type: object
+                        properties:
+                            id:
+                                type: string
+                            override:
+                                type: object
+                                additionalProperties: true
+                        required: [id]
+                        additionalProperties: false
+            required:
+                - type
+            additionalProperties: false
+required:
+    - steps
+additionalProperties: false
+        """
+        )
+
+    async def configure(self, config: types.SimpleNamespace) -> None:
+        """Configure the script.
+
+        Parameters
+        ----------
+        config : `types.SimpleNamespace`
+            Configuration.
+        """
+        self.steps = []
+        for step_config in config.steps:
+            self.steps.append(await self.configure_step(step_config))
+
+        self.log.info(
+            f"Bring up steps: {', '.join([step.type for step in self.steps])}."
+        )
+
+    async def configure_step(
+        self, step_config: typing.Dict[str, typing.Any]
+    ) -> types.SimpleNamespace:
+        """Validate the configuration of one step.
+
+        Parameters
+        ----------
+        step_config : `dict`
+            Step configuration.
+
+        Returns
+        -------
+        step : `types.SimpleNamespace`
+            Step ``type`` and its parameters.
+
+        Raises
+        ------
+        ValueError
+            If the step is missing or has unused parameters.
+        """
+        step_type = step_config["type"]
+        required_keys = dict(
+            standby=set(),
+            enable={"config"},
+            load_snapshot={"snapshot"},
+            add_block={"id"} if "id" in step_config else {"blocks"},
+            resume=set(),
+        )[step_type]
+        optional_keys = {"override"} if step_type == "add_block" else set()
+        keys = set(step_config) - {"type"}
+        if not required_keys <= keys or not keys <= required_keys | optional_keys:
+            raise ValueError(
+                f"Step {step_type} requires {sorted(required_keys)} "
+                f"and accepts {sorted(optional_keys)}; got {sorted(keys)}."
+            )
+
+        step = types.SimpleNamespace(type=step_type)
+        if step_type == "enable":
+            step.config = step_config["config"]
+        elif step_type == "load_snapshot":
+            snapshot_index = await self.get_snapshot_index()
+            step.snapshot_uri = snapshot_index.resolve(step_config["snapshot"])
+        elif step_type == "add_block":
+            blocks = (
+                [
+                    (block["id"], block.get("override"))
+                    for block in step_config["blocks"]
+                ]
+                if "blocks" in step_config
+                else [(step_config["id"], step_config.get("override"))]
+            )
+            step.blocks = validate_blocks(blocks)
+
+        return step
+
+    async def get_snapshot_index(self) -> SnapshotIndex:
+        """Get the snapshot index, creating and refreshing it if needed.
+
+        Returns
+        -------
+        snapshot_index : `SnapshotIndex`
+            Snapshot index.
+        """
+        if self.snapshot_index is None:
+            self.snapshot_index = SnapshotIndex(
+                scheduler_index=self.scheduler_remote.salinfo.index,
+                log=self.log,
+            )
+            await self.snapshot_index.refresh(self.scheduler_remote)
+
+        return self.snapshot_index
+
+    def set_metadata(self, metadata: salobj.type_hints.BaseDdsDataType) -> None:
+        """Set metadata fields in the provided struct, given the
+        current configuration.
+
+        Parameters
+        ----------
+        metadata : ``self.evt_metadata.DataType()``
+            Metadata to update. Set those fields for which
+            you have useful information.
+
+        Notes
+        -----
+        This method is called after `configure` by `do_configure`.
+        The script state will be `ScriptState.UNCONFIGURED`.
+        """
+        metadata.duration = self.timeout_start * sum(
+            [len(getattr(step, "blocks", [None])) for step in self.steps]
+        )
+
+    async def run(self) -> None:
+        # Prevent script from running on different queues
+        assert_scheduler_queue(self.salinfo.index, self.scheduler_remote)
+
+        self.step_timings = []
+        self.block_results = []
+        try:
+            for i, step in enumerate(self.steps):
+                await self.checkpoint(f"Step {i+1}/{len(self.steps)}: {step.type}")
+                start_time = time.monotonic()
+                skipped = not await self.run_step(step)
+                self.step_timings.append(
+                    types.SimpleNamespace(
+                        type=step.type,
+                        skipped=skipped,
+                        duration=time.monotonic() - start_time,
+                    )
+                )
+        finally:
+            timings_summary = "\n".join(
+                [
+                    f"{timing.type}: "
+                    f"{'skipped' if timing.skipped else 'done'} "
+                    f"in {timing.duration:0.2f}s."
+                    for timing in self.step_timings
+                ]
+            )
+            self.log.info(f"Bring up step timings:\n{timings_summary}")
+
+        await self.checkpoint("Scheduler brought up")
+
+    async def run_step(self, step: types.SimpleNamespace) -> bool:
+        """Run one step.
+
+        Parameters
+        ----------
+        step : `types.SimpleNamespace`
+            Step, as returned by `configure_step`.
+
+        Returns
+        -------
+        ran : `bool`
+            `False` if the step was skipped because its target state was
+            already reached, `True` otherwise.
+        """
+        if step.type in STEP_DESIRED_STATES:
+            desired_state = STEP_DESIRED_STATES[step.type]
+            if self.get_summary_state() == desired_state:
+                self.log.info(f"Scheduler already in {desired_state!r}. Skipping.")
+                return False
+            self.desired_state = desired_state
+            self.configuration = getattr(step, "config", "")
+            await self.set_scheduler_state()
+        elif step.type == "load_snapshot":
+            snapshot_index = await self.get_snapshot_index()
+            await snapshot_index.assert_exists(step.snapshot_uri)
+            await self.scheduler_remote.cmd_load.set_start(
+                uri=step.snapshot_uri, timeout=self.timeout_start
+            )
+        elif step.type == "add_block":
+            block_results = await add_blocks(
+                scheduler_remote=self.scheduler_remote,
+                blocks=step.blocks,
+                timeout=self.timeout_start,
+                log=self.log,
+                checkpoint=self.checkpoint,
+            )
+            self.block_results += block_results
+            assert_blocks_added(block_results)
+        elif step.type == "resume":
+            await self.scheduler_remote.cmd_resume.set_start(timeout=self.timeout_start)
+        return True
@@ -21,7 +21,6 @@
 
 __all__ = ["Enable"]
 
-import math
 import types
 import typing
 
@@ -30,6 +29,7 @@ from lsst.ts import salobj
 from lsst.ts.xml.enums.Scheduler import SalIndex
 
 from .set_desired_state import SetDesiredState
+from .utils import assert_scheduler_queue
 
 
 class Enable(SetDesiredState):
@@ -85,10 +85,5 @@ additionalProperties: false
 
     async def run(self) -> None:
         # Prevent script from running on different queues
-        script_queue_index = math.floor(self.salinfo.index / 100000)
-        if script_queue_index != self.scheduler_remote.salinfo.index.value:
-            raise RuntimeError(
-                f"Script with index {self.salinfo.index} cannot run in"
-                f" {self.scheduler_remote.salinfo.index.name} queue."
-            )
+        assert_scheduler_queue(self.salinfo.index, self.scheduler_remote)
         await super().run()
@@ -21,7 +21,6 @@
 
 __all__ = ["LoadSnapshot"]
 
-import math
 import types
 import typing
 
@@ -29,6 +28,9 @@ import yaml
 from lsst.ts import salobj
 from lsst.ts.xml.enums.Scheduler import SalIndex
 
+from .snapshot_index import SnapshotIndex
+from .utils import assert_scheduler_queue
+
 
 class LoadSnapshot(salobj.BaseScript):
     """A base script that implements loading snapshots for the Scheduler.
@@ -62,22 +64,35 @@ class LoadSnapshot(salobj.BaseScript):
 
         self.snapshot_uri: typing.Optional[str] = None
 
+        self.snapshot_index: typing.Optional[SnapshotIndex] = None
+
     @classmethod
     def get_schema(cls) -> typing.Optional[typing.Dict[str, typing.Any]]:
         return yaml.safe_load(
             """
 $schema: http://json-schema.org/draft-07/schema#
 $id: https://github.com/lsst-ts/ts_standardscripts/scheduler/base_load_snapshot.py
-title: BaseLoadSnapshot v2
+title: BaseLoadSnapshot v3
 description: Configuration for loading scheduler snapshot.
 type: object
 properties:
     snapshot:
         description: >-
-            Snapshot to load. This must be either a valid uri or the
+            Snapshot to load. This must be either a valid uri, the
             keyword "latest", which will cause it to load the last published
-            snapshot.
-        type: string
+            snapshot, or a time selector.
+        oneOf:
+            - type: string
+            - type: object
+              properties:
+                latest_before:
+                    description: >-
+                        Load the last snapshot published before this time
+                        (ISO format, UTC), e.g. "2024-03-01T12:00:00".
+                    type: string
+              required:
+                - latest_before
+              additionalProperties: false
 required:
     - snapshot
 additionalProperties: false
@@ -95,25 +110,37 @@ additionalProperties: false
 
         self.log.info(f"Snapshot: {config.snapshot}.")
 
-        if config.snapshot == "latest":
-            self.log.debug("Loading latest snapshot.")
-            latest_snapshot = (
-                await self.scheduler_remote.evt_largeFileObjectAvailable.aget(
-                    timeout=self.timeout_start
-                )
-            )
-            if latest_snapshot is None:
-                raise RuntimeError(
-                    "No snapshot information from the Scheduler. "
-                    "In order to load a snapshot with the 'latest' option, the "
-                    "Scheduler must have published at least one snapshot."
-                )
-            else:
-                self.log.info(f"Latest snapshot uri: {latest_snapshot.url}")
-            self.snapshot_uri = latest_snapshot.url
+        if config.snapshot == "latest" or isinstance(config.snapshot, dict):
+            self.log.debug("Resolving snapshot from the snapshot index.")
+            snapshot_index = await self.get_snapshot_index(refresh=True)
+            self.snapshot_uri = snapshot_index.resolve(config.snapshot)
         else:
             self.snapshot_uri = config.snapshot
 
+    async def get_snapshot_index(self, refresh: bool = False) -> SnapshotIndex:
+        """Get the snapshot index, creating it if needed.
+
+        Parameters
+        ----------
+        refresh : `bool`, optional
+            Add the snapshots published since the index was last refreshed?
+
+        Returns
+        -------
+        snapshot_index : `SnapshotIndex`
+            Snapshot index.
+        """
+        if self.snapshot_index is None:
+            self.snapshot_index = SnapshotIndex(
+                scheduler_index=self.scheduler_remote.salinfo.index,
+                log=self.log,
+            )
+
+        if refresh:
+            await self.snapshot_index.refresh(self.scheduler_remote)
+
+        return self.snapshot_index
+
     def set_metadata(self, metadata: salobj.type_hints.BaseDdsDataType) -> None:
         """Set metadata fields in the provided struct, given the
         current configuration.
@@ -133,12 +160,10 @@ additionalProperties: false
 
     async def run(self) -> None:
         # Prevent script from running on different queues
-        script_queue_index = math.floor(self.salinfo.index / 100000)
-        if script_queue_index != self.scheduler_remote.salinfo.index.value:
-            raise RuntimeError(
-                f"Script with index {self.salinfo.index} cannot run in"
-                f" {self.scheduler_remote.salinfo.index.name} queue."
-            )
+        assert_scheduler_queue(self.salinfo.index, self.scheduler_remote)
+
+        snapshot_index = await self.get_snapshot_index()
+        await snapshot_index.assert_exists(self.snapshot_uri)
 
         await self.checkpoint("Loading snapshot")
         await self.scheduler_remote.cmd_load.set_start(
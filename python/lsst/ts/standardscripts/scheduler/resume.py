@@ -21,13 +21,14 @@
 
 __all__ = ["Resume"]
 
-import math
 import types
 import typing
 
 from lsst.ts import salobj
 from lsst.ts.xml.enums.Scheduler import SalIndex
 
+from .utils import assert_scheduler_queue
+
 
 class Resume(salobj.BaseScript):
     """A base script that implements resuming the Scheduler.
@@ -88,11 +89,6 @@ class Resume(salobj.BaseScript):
 
     async def run(self) -> None:
         # Prevent script from running on different queues
-        script_queue_index = math.floor(self.salinfo.index / 100000)
-        if script_queue_index != self.scheduler_remote.salinfo.index.value:
-            raise RuntimeError(
-                f"Script with index {self.salinfo.index} cannot run in"
-                f" {self.scheduler_remote.salinfo.index.name} queue."
-            )
+        assert_scheduler_queue(self.salinfo.index, self.scheduler_remote)
 
         await self.scheduler_remote.cmd_resume.set_start(timeout=self.timeout_start)
@@ -22,13 +22,18 @@
 __all__ = ["SetDesiredState"]
 
 import asyncio
-import math
+import time
 import types
 import typing
 
 from lsst.ts import salobj
 from lsst.ts.xml.enums.Scheduler import SalIndex
 
+from ..utils import get_recent_heartbeat
+from .utils import assert_scheduler_queue
+
+STATE_TRANSITIONS = salobj.make_state_transition_dict()
+
 
 class SetDesiredState(salobj.BaseScript):
     """A base script that implements setting the desired state for the
@@ -42,6 +47,10 @@ class SetDesiredState(salobj.BaseScript):
         Script description.
     scheduler_index : `int`
         Index of the Scheduler to enable.
+    desired_state : `salobj.State`
+        State to send the Scheduler to.
+    include : `list` [`str`], optional
+        Scheduler topics to read, in addition to summaryState and heartbeat.
     """
 
     def __init__(
@@ -50,6 +59,7 @@ class SetDesiredState(salobj.BaseScript):
         descr: str,
         scheduler_index: SalIndex,
         desired_state: salobj.State,
+        include: typing.Optional[typing.List[str]] = None,
     ) -> None:
         super().__init__(index=index, descr=descr)
 
@@ -57,15 +67,26 @@ class SetDesiredState(salobj.BaseScript):
             domain=self.domain,
             name="Scheduler",
             index=scheduler_index,
-            include=["summaryState", "heartbeat"],
+            include=["summaryState", "heartbeat"] + (include or []),
         )
 
         self.desired_state = desired_state
 
         self.timeout_start = 30.0
 
+        # How long to wait for a late summaryState when there is no summary
+        # state information cached (sec). The wait only happens when the
+        # Scheduler is alive but no summary state was received, e.g. it has
+        # just started, and ends as soon as the summary state arrives, so the
+        # Scheduler is sent straight to the desired state instead of going
+        # through the trial transitions.
+        self.timeout_summary_state = 2.0
+
         self.configuration = ""
 
+        # Name and duration (sec) of the state transition commands sent.
+        self.state_transition_times: list[tuple[str, float]] = []
+
         self._state_transition_methods_to_try = (
             self._handle_csc_in_standby,
             self._handle_csc_in_disabled_or_fault,
@@ -100,8 +121,9 @@ class SetDesiredState(salobj.BaseScript):
         """Assert that the Scheduler is alive."""
 
         try:
-            await self.scheduler_remote.evt_heartbeat.next(
-                flush=True,
+            await get_recent_heartbeat(
+                self.scheduler_remote.evt_heartbeat,
+                max_age=salobj.base_script.HEARTBEAT_INTERVAL,
                 timeout=salobj.base_script.HEARTBEAT_INTERVAL,
             )
         except asyncio.TimeoutError:
@@ -124,16 +146,81 @@ class SetDesiredState(salobj.BaseScript):
         """Handle condition where no information about Scheduler summary state
         is available.
 
-        Start by assuming Scheduler is in STANDBY, if this fails, assume it is
-        in DISABLED and finally in ENABLED.
+        Start by waiting briefly for a late summary state. If one arrives,
+        follow the shortest path to the desired state. Otherwise, assume
+        Scheduler is in STANDBY, if this fails, assume it is in DISABLED and
+        finally in ENABLED.
         """
 
+        try:
+            summary_state = await self.scheduler_remote.evt_summaryState.aget(
+                timeout=self.timeout_summary_state
+            )
+        except asyncio.TimeoutError:
+            summary_state = None
+
+        if summary_state is not None:
+            current_summary_state = salobj.State(summary_state.summaryState)
+            self.log.info(f"Scheduler summary state: {current_summary_state!r}.")
+            await self.transition_from(current_summary_state)
+            return
+
+        self.log.warning(
+            f"No summary state from the Scheduler after {self.timeout_summary_state}s. "
+            "Trying state transitions."
+        )
         for coro in self._state_transition_methods_to_try:
-            if await coro():
+            start_time = time.monotonic()
+            succeeded = await coro()
+            self.log.debug(
+                f"{coro.__name__} took {time.monotonic() - start_time:0.2f}s."
+            )
+            if succeeded:
                 return
 
         raise RuntimeError(f"Failed to transition CSC to {self.desired_state!r}.")
 
+    async def transition_from(self, current_summary_state: salobj.State) -> None:
+        """Send the Scheduler from its current state to the desired state
+        following the shortest path, timing each step.
+
+        As in `run`, a Scheduler in DISABLED or ENABLED is sent to STANDBY
+        first, unless the desired state is STANDBY, so the configuration is
+        reloaded.
+
+        Parameters
+        ----------
+        current_summary_state : `salobj.State`
+            Current summary state of the Scheduler.
+        """
+        if (
+            current_summary_state in {salobj.State.ENABLED, salobj.State.DISABLED}
+            and self.desired_state != salobj.State.STANDBY
+        ):
+            transitions = (
+                STATE_TRANSITIONS[(current_summary_state, salobj.State.STANDBY)]
+                + STATE_TRANSITIONS[(salobj.State.STANDBY, self.desired_state)]
+            )
+        else:
+            transitions = STATE_TRANSITIONS[(current_summary_state, self.desired_state)]
+
+        for command, resulting_state in transitions:
+            start_time = time.monotonic()
+            if command == "start":
+                await self.scheduler_remote.cmd_start.set_start(
+                    configurationOverride=self.configuration,
+                    timeout=self.timeout_start,
+                )
+            else:
+                await getattr(self.scheduler_remote, f"cmd_{command}").start(
+                    timeout=self.timeout_start
+                )
+            duration = time.monotonic() - start_time
+            self.state_transition_times.append((command, duration))
+            self.log.info(
+                f"{command}: Scheduler in {resulting_state!r} after {duration:0.2f}s."
+            )
+
     async def _handle_csc_in_standby(self) -> bool:
         """Handle condition where CSC is in STANDBY."""
 
@@ -214,12 +301,12 @@ class SetDesiredState(salobj.BaseScript):
         """Enable the Scheduler and exit."""
 
         # Prevent script from running on different queues
-        script_queue_index = math.floor(self.salinfo.index / 100000)
-        if script_queue_index != self.scheduler_remote.salinfo.index.value:
-            raise RuntimeError(
-                f"Script with index {self.salinfo.index} cannot run in"
-                f" {self.scheduler_remote.salinfo.index.name} queue."
-            )
+        assert_scheduler_queue(self.salinfo.index, self.scheduler_remote)
+
+        await self.set_scheduler_state()
+
+    async def set_scheduler_state(self) -> None:
+        """Send the Scheduler to the desired state."""
 
         await self.checkpoint("Assert liveliness")
         await self.assert_liveliness()
@@ -0,0 +1,455 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["SnapshotEntry", "SnapshotIndex", "get_observing_days"]
+
+import asyncio
+import bisect
+import dataclasses
+import datetime
+import io
+import json
+import logging
+import os
+import time
+import typing
+import urllib.parse
+
+from astropy.time import Time
+from lsst.ts import salobj
+
+from ..utils import get_s3_bucket
+
+# Name of the object, under the key prefix of the Scheduler, where the
+# index is persisted.
+INDEX_FILENAME = "snapshot_index.json"
+
+
+@dataclasses.dataclass(frozen=True, order=True)
+class SnapshotEntry:
+    """A published Scheduler snapshot.
+
+    Entries sort by publication time.
+
+    Attributes
+    ----------
+    time : `float`
+        Publication time (UTC unix seconds).
+    url : `str`
+        Snapshot url.
+    size : `int` or `None`
+        Size of the snapshot (bytes), if known.
+    """
+
+    time: float
+    url: str
+    size: typing.Optional[int] = dataclasses.field(default=None, compare=False)
+
+
+class SnapshotIndex:
+    """An index of the snapshots published by a Scheduler.
+
+    The index is persisted as a small json object in the s3 bucket, next to
+    the snapshots. Refreshing it adds the snapshot reported by the Scheduler
+    in ``largeFileObjectAvailable`` and lists only the observing days since
+    the last refresh; the whole bucket prefix is only listed the first time,
+    when there is no persisted index. Once refreshed, selecting a snapshot
+    does not require any remote call.
+
+    Parameters
+    ----------
+    scheduler_index : `int`
+        Index of the Scheduler.
+    s3bucket : `salobj.AsyncS3Bucket`, optional
+        Bucket where snapshots are stored. If not given use
+        `get_s3_bucket`, which falls back to a mock bucket when not
+        running at a known site.
+    log : `logging.Logger`, optional
+        Logger.
+    """
+
+    def __init__(
+        self,
+        scheduler_index: int,
+        s3bucket: typing.Optional[salobj.AsyncS3Bucket] = None,
+        log: typing.Optional[logging.Logger] = None,
+    ) -> None:
+        self.scheduler_index = int(scheduler_index)
+        self.s3bucket = s3bucket if s3bucket is not None else get_s3_bucket()
+        self.log = (
+            logging.getLogger(type(self).__name__)
+            if log is None
+            else log.getChild(type(self).__name__)
+        )
+
+        self._entries: typing.List[SnapshotEntry] = []
+        # Time (UTC unix seconds) up to which the bucket has been listed;
+        # `None` if it never was.
+        self.listed_until: typing.Optional[float] = None
+
+    @property
+    def entries(self) -> typing.List[SnapshotEntry]:
+        """Indexed snapshots, sorted by publication time."""
+        return list(self._entries)
+
+    @property
+    def key_prefix(self) -> str:
+        """Prefix of the s3 keys of the snapshots from this Scheduler."""
+        return f"Scheduler:{self.scheduler_index}/"
+
+    @property
+    def index_key(self) -> str:
+        """S3 key of the persisted index."""
+        return f"{self.key_prefix}{INDEX_FILENAME}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, url: str, time: float, size: typing.Optional[int] = None) -> None:
+        """Add a snapshot to the index.
+
+        Snapshots already in the index are ignored.
+
+        Parameters
+        ----------
+        url : `str`
+            Snapshot url.
+        time : `float`
+            Publication time (UTC unix seconds).
+        size : `int`, optional
+            Size of the snapshot (bytes).
+        """
+        if any(entry.url == url for entry in self._entries):
+            return
+        bisect.insort(self._entries, SnapshotEntry(time=time, url=url, size=size))
+
+    def add_from_event(self, data: salobj.type_hints.BaseMsgType) -> None:
+        """Add a snapshot from a ``largeFileObjectAvailable`` sample.
+
+        Parameters
+        ----------
+        data : ``evt_largeFileObjectAvailable.DataType``
+            Event sample.
+        """
+        self.add(
+            url=data.url,
+            time=float(Time(data.private_sndStamp, format="unix_tai").unix),
+        )
+
+    async def refresh(
+        self, scheduler_remote: typing.Optional[salobj.Remote] = None
+    ) -> None:
+        """Add the snapshots published since the last refresh to the index,
+        and persist it.
+
+        Failing to read, list or write the bucket is logged and otherwise
+        ignored.
+
+        Parameters
+        ----------
+        scheduler_remote : `salobj.Remote`, optional
+            Scheduler remote. If given, also add the last snapshot it
+            published.
+        """
+        if scheduler_remote is not None:
+            latest_snapshot = scheduler_remote.evt_largeFileObjectAvailable.get()
+            if latest_snapshot is not None:
+                self.add_from_event(latest_snapshot)
+
+        try:
+            if self.listed_until is None:
+                await self.load()
+            await self._refresh_from_bucket()
+            await self.save()
+        except Exception:
+            self.log.warning(
+                "Failed to refresh the snapshot index from the s3 bucket.",
+                exc_info=True,
+            )
+
+    async def load(self) -> None:
+        """Add the snapshots of the persisted index, if any, to the index."""
+        if not await self.s3bucket.exists(self.index_key):
+            self.log.info(f"No snapshot index in {self.index_key}.")
+            return
+
+        fileobj = await self.s3bucket.download(self.index_key)
+        index_data = json.loads(fileobj.getvalue())
+        for entry_data in index_data["entries"]:
+            self.add(**entry_data)
+        self.listed_until = index_data["listed_until"]
+        self.log.debug(f"Loaded {len(self)} snapshots from {self.index_key}.")
+
+    async def save(self) -> None:
+        """Persist the index in the s3 bucket."""
+        index_data = dict(
+            listed_until=self.listed_until,
+            entries=[dataclasses.asdict(entry) for entry in self._entries],
+        )
+        await self.s3bucket.upload(
+            fileobj=io.BytesIO(json.dumps(index_data).encode()),
+            key=self.index_key,
+        )
+
+    async def _refresh_from_bucket(self) -> None:
+        """Add the snapshots stored in the s3 bucket since the last listing
+        to the index.
+        """
+        listing_time = time.time()
+        if self.listed_until is None:
+            objects = await self._list_objects(self.key_prefix)
+        else:
+            objects = []
+            for generator_prefix in await self._list_generator_prefixes():
+                for day in get_observing_days(self.listed_until, listing_time):
+                    objects += await self._list_objects(f"{generator_prefix}{day}/")
+
+        endpoint_url = self.s3bucket.service_resource.meta.client.meta.endpoint_url
+        for obj in objects:
+            if obj.key == self.index_key:
+                continue
+            self.add(
+                url=f"{endpoint_url}/{self.s3bucket.name}/{obj.key}",
+                time=obj.last_modified.timestamp(),
+                size=obj.size,
+            )
+        self.listed_until = listing_time
+        self.log.debug(f"Indexed {len(self)} snapshots.")
+
+    async def _list_objects(self, prefix: str) -> typing.List[typing.Any]:
+        """List the objects in the s3 bucket with a given key prefix.
+
+        Parameters
+        ----------
+        prefix : `str`
+            Key prefix.
+
+        Returns
+        -------
+        objects : `list` [``s3.ObjectSummary``]
+            Objects.
+        """
+
+        def list_objects() -> typing.List[typing.Any]:
+            return list(self.s3bucket.bucket.objects.filter(Prefix=prefix))
+
+        return await asyncio.get_running_loop().run_in_executor(None, list_objects)
+
+    async def _list_generator_prefixes(self) -> typing.List[str]:
+        """List the key prefixes of the snapshot generators, e.g.
+        "Scheduler:1/Scheduler:1/".
+
+        Keys made with `salobj.AsyncS3Bucket.make_key` have the format
+        ``{fullsalname}/{generator}/{yyyy}/{mm}/{dd}/...``, so this only
+        lists the first level of the key prefix, not the snapshots.
+
+        Returns
+        -------
+        prefixes : `list` [`str`]
+            Key prefixes, ending with "/".
+        """
+
+        def list_prefixes() -> typing.List[str]:
+            paginator = self.s3bucket.service_resource.meta.client.get_paginator(
+                "list_objects_v2"
+            )
+            return [
+                common_prefix["Prefix"]
+                for page in paginator.paginate(
+                    Bucket=self.s3bucket.name, Prefix=self.key_prefix, Delimiter="/"
+                )
+                for common_prefix in page.get("CommonPrefixes", [])
+            ]
+
+        return await asyncio.get_running_loop().run_in_executor(None, list_prefixes)
+
+    def latest(self) -> typing.Optional[SnapshotEntry]:
+        """Return the most recent snapshot, or `None` if there is none."""
+        return self._entries[-1] if self._entries else None
+
+    def latest_before(self, time: float) -> typing.Optional[SnapshotEntry]:
+        """Return the most recent snapshot published before a given time.
+
+        Parameters
+        ----------
+        time : `float`
+            Time (UTC unix seconds).
+
+        Returns
+        -------
+        entry : `SnapshotEntry` or `None`
+            Snapshot or `None` if there is none before ``time``.
+        """
+        index = bisect.bisect_left([entry.time for entry in self._entries], time)
+        return self._entries[index - 1] if index > 0 else None
+
+    def resolve(self, snapshot: typing.Union[str, typing.Dict[str, str]]) -> str:
+        """Resolve a snapshot selector into a snapshot url.
+
+        Parameters
+        ----------
+        snapshot : `str` or `dict`
+            Either a uri, which is returned unchanged, "latest" or a
+            dictionary with a "latest_before" time (ISO format, UTC).
+
+        Returns
+        -------
+        url : `str`
+            Snapshot url.
+
+        Raises
+        ------
+        RuntimeError
+            If no snapshot in the index matches the selector.
+        """
+        if isinstance(snapshot, dict):
+            latest_before = Time(snapshot["latest_before"], scale="utc")
+            entry = self.latest_before(float(latest_before.unix))
+            if entry is None:
+                raise RuntimeError(
+                    f"No snapshot published before {latest_before.isot}. "
+                    f"Found {len(self)} snapshots."
+                )
+            self.log.info(f"Latest snapshot before {latest_before.isot}: {entry.url}")
+            return entry.url
+        elif snapshot == "latest":
+            entry = self.latest()
+            if entry is None:
+                raise RuntimeError(
+                    "No snapshot information from the Scheduler. "
+                    "In order to load a snapshot with the 'latest' option, the "
+                    "Scheduler must have published at least one snapshot."
+                )
+            self.log.info(f"Latest snapshot uri: {entry.url}")
+            return entry.url
+        else:
+            return snapshot
+
+    def get_key(self, url: str) -> typing.Optional[str]:
+        """Return the s3 key of a snapshot url.
+
+        Parameters
+        ----------
+        url : `str`
+            Snapshot url.
+
+        Returns
+        -------
+        key : `str` or `None`
+            The key or `None` if the url does not point to the bucket.
+        """
+        path = urllib.parse.urlparse(url).path
+        bucket_path = f"/{self.s3bucket.name}/"
+        if not path.startswith(bucket_path):
+            return None
+        return path[len(bucket_path) :]
+
+    async def exists(self, url: str) -> typing.Optional[bool]:
+        """Check that a snapshot url can be loaded.
+
+        Parameters
+        ----------
+        url : `str`
+            Snapshot url.
+
+        Returns
+        -------
+        exists : `bool` or `None`
+            Whether the snapshot exists. `None` if the url is in a
+            location that cannot be checked from here.
+
+        Raises
+        ------
+        ValueError
+            If ``url`` is not a valid uri.
+        """
+        parsed_url = urllib.parse.urlparse(url)
+        if not parsed_url.scheme:
+            raise ValueError(f"{url!r} is not a valid uri.")
+
+        if parsed_url.scheme == "file":
+            return os.path.exists(parsed_url.path)
+
+        if any(entry.url == url for entry in self._entries):
+            return True
+
+        key = self.get_key(url)
+        if key is None:
+            return None
+
+        return await self.s3bucket.exists(key)
+
+    async def assert_exists(self, url: str) -> None:
+        """Assert that a snapshot url can be loaded.
+
+        Urls in locations that cannot be checked are only logged.
+
+        Parameters
+        ----------
+        url : `str`
+            Snapshot url.
+
+        Raises
+        ------
+        ValueError
+            If ``url`` is not a valid uri.
+        RuntimeError
+            If the snapshot does not exist.
+        """
+        snapshot_exists = await self.exists(url)
+        if snapshot_exists is None:
+            self.log.warning(f"Cannot verify that {url} exists. Trying to load it.")
+        elif not snapshot_exists:
+            raise RuntimeError(f"Snapshot {url} does not exist.")
+
+
+def get_observing_days(start: float, end: float) -> typing.List[str]:
+    """Get the observing days, as used in s3 keys, between two times.
+
+    Parameters
+    ----------
+    start : `float`
+        Start time (UTC unix seconds).
+    end : `float`
+        End time (UTC unix seconds).
+
+    Returns
+    -------
+    days : `list` [`str`]
+        Observing days, formatted as "yyyy/mm/dd", in increasing order.
+
+    Notes
+    -----
+    The observing day of a time is the date of TAI - 12 hours. Start one
+    day earlier than the observing day of ``start``, to cover the TAI-UTC
+    offset and snapshots whose upload finished after their key was made.
+    """
+    half_day = 12 * 60 * 60
+    first_day = datetime.datetime.fromtimestamp(
+        start - half_day, tz=datetime.timezone.utc
+    ).date() - datetime.timedelta(days=1)
+    last_day = datetime.datetime.fromtimestamp(
+        end - half_day, tz=datetime.timezone.utc
+    ).date() + datetime.timedelta(days=1)
+    return [
+        (first_day + datetime.timedelta(days=n_days)).strftime("%Y/%m/%d")
+        for n_days in range((last_day - first_day).days + 1)
+    ]
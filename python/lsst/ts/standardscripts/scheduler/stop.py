@@ -21,7 +21,6 @@
 
 __all__ = ["Stop"]
 
-import math
 import types
 import typing
 
@@ -29,6 +28,8 @@ import yaml
 from lsst.ts import salobj
 from lsst.ts.xml.enums.Scheduler import SalIndex
 
+from .utils import assert_scheduler_queue
+
 
 class Stop(salobj.BaseScript):
     """A base script that implements resuming the Scheduler.
@@ -105,12 +106,7 @@ additionalProperties: false
 
     async def run(self) -> None:
         # Prevent script from running on different queues
-        script_queue_index = math.floor(self.salinfo.index / 100000)
-        if script_queue_index != self.scheduler_remote.salinfo.index.value:
-            raise RuntimeError(
-                f"Script with index {self.salinfo.index} cannot run in"
-                f" {self.scheduler_remote.salinfo.index.name} queue."
-            )
+        assert_scheduler_queue(self.salinfo.index, self.scheduler_remote)
 
         await self.checkpoint("Stopping scheduler")
         await self.scheduler_remote.cmd_stop.set_start(
@@ -22,10 +22,14 @@
 __all__ = ["BaseSchedulerTestCase"]
 
 import contextlib
+import logging
 import random
+import time
+import types
 import typing
 import unittest
 
+import numpy as np
 from lsst.ts import salobj
 from lsst.ts.xml.enums.Script import ScriptState
 
@@ -38,13 +42,20 @@ random.seed(47)  # for set_random_lsst_dds_partition_prefix
 class BaseSchedulerTestCase(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase):
     @contextlib.asynccontextmanager
     async def make_controller(
-        self, initial_state: salobj.State, publish_initial_state: bool
+        self,
+        initial_state: salobj.State,
+        publish_initial_state: bool,
+        **kwargs: typing.Any,
     ):
-        """Add a Test controller"""
+        """Add a Test controller
+
+        Additional keyword arguments are passed to `MockScheduler`.
+        """
         async with MockScheduler(
             index=1,
             initial_state=initial_state,
             publish_initial_state=publish_initial_state,
+            **kwargs,
         ) as self.controller:
             yield
 
@@ -89,3 +100,71 @@ class BaseSchedulerTestCase(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase
         assert len(self.controller.observing_blocks) == len(observing_blocks)
         for observing_block in observing_blocks:
             assert observing_block in self.controller.observing_blocks
+
+    async def run_benchmark(
+        self,
+        n_runs: int,
+        config: typing.Dict[str, typing.Any],
+        initial_state: salobj.State,
+        expected_script_state: ScriptState = ScriptState.DONE,
+        **controller_kwargs: typing.Any,
+    ) -> types.SimpleNamespace:
+        """Run the script repeatedly against `MockScheduler` and report
+        the end-to-end latency.
+
+        Each run creates a new script and controller, then configures and
+        runs the script; the latency is measured from configure until the
+        script finishes. A summary is logged at INFO level.
+
+        Parameters
+        ----------
+        n_runs : `int`
+            Number of runs.
+        config : `dict`
+            Script configuration.
+        initial_state : `salobj.State`
+            Initial state of the Scheduler.
+        expected_script_state : `ScriptState`, optional
+            Expected final state of the script.
+        **controller_kwargs
+            Additional arguments for `MockScheduler`, e.g. to inject
+            latency or errors.
+
+        Returns
+        -------
+        benchmark : `types.SimpleNamespace`
+            Latencies of each run (``durations``), their ``total``,
+            ``mean`` and the ``p50``, ``p90`` and ``p99`` percentiles (sec).
+        """
+        durations = []
+        for _ in range(n_runs):
+            async with self.make_script(
+                randomize_topic_subname=True
+            ), self.make_controller(
+                initial_state=initial_state,
+                publish_initial_state=True,
+                **controller_kwargs,
+            ):
+                start_time = time.monotonic()
+                await self.configure_script(**config)
+                await self.run_script(expected_final_state=expected_script_state)
+                durations.append(time.monotonic() - start_time)
+
+        p50, p90, p99 = np.percentile(durations, [50, 90, 99])
+        benchmark = types.SimpleNamespace(
+            durations=durations,
+            total=sum(durations),
+            mean=np.mean(durations),
+            p50=p50,
+            p90=p90,
+            p99=p99,
+        )
+
+        logging.getLogger(type(self).__name__).info(
+            f"{type(self.script).__name__}: n={n_runs} "
+            f"total={benchmark.total:0.2f}s mean={benchmark.mean:0.2f}s "
+            f"p50={benchmark.p50:0.2f}s p90={benchmark.p90:0.2f}s "
+            f"p99={benchmark.p99:0.2f}s"
+        )
+
+        return benchmark
@@ -22,15 +22,49 @@
 __all__ = ["MockScheduler"]
 
 import asyncio
+import random
 
 from lsst.ts import salobj
 
 
 class MockScheduler(salobj.Controller):
-    """A simple Scheduler CSC simulator."""
+    """A simple Scheduler CSC simulator.
+
+    Parameters
+    ----------
+    index : `int`
+        Scheduler index.
+    initial_state : `salobj.State`, optional
+        Initial summary state.
+    publish_initial_state : `bool`, optional
+        Publish the initial summary state and a snapshot on start?
+    command_latency : `dict` [`str`, `float` or `tuple`], optional
+        Time to execute each command (sec), by command name. Either a
+        fixed value or a (min, max) tuple to draw it from a uniform
+        distribution. Commands not listed execute instantly.
+    error_probability : `float` or `dict` [`str`, `float`], optional
+        Probability that a command fails, either for all commands or by
+        command name.
+    drop_ack_probability : `float` or `dict` [`str`, `float`], optional
+        Probability that a command is never acknowledged, so the sender
+        times out, either for all commands or by command name.
+    heartbeat_delay : `float`, optional
+        Extra delay before each heartbeat (sec), including the first one.
+    seed : `int`, optional
+        Seed for the random number generator used for latencies and
+        errors.
+    """
 
     def __init__(
-        self, index, initial_state=salobj.State.STANDBY, publish_initial_state=True
+        self,
+        index,
+        initial_state=salobj.State.STANDBY,
+        publish_initial_state=True,
+        command_latency=None,
+        error_probability=0.0,
+        drop_ack_probability=0.0,
+        heartbeat_delay=0.0,
+        seed=None,
     ):
         super().__init__(name="Scheduler", index=index, do_callbacks=False)
 
@@ -41,6 +75,8 @@ class MockScheduler(salobj.Controller):
             standby=0,
             start=0,
         )
+        # State transition commands executed, in order.
+        self.state_commands = []
 
         self.running = False
 
@@ -50,6 +86,20 @@ class MockScheduler(salobj.Controller):
 
         self.publish_initial_state = publish_initial_state
 
+        self.command_latency = command_latency if command_latency is not None else {}
+        self.error_probability = error_probability
+        self.drop_ack_probability = drop_ack_probability
+        self.heartbeat_delay = heartbeat_delay
+        self.rng = random.Random(seed)
+
+        # Number of commands that failed because of error_probability.
+        self.n_injected_errors = 0
+        # Number of commands not acknowledged because of
+        # drop_ack_probability.
+        self.n_dropped_acks = 0
+        # Futures the commands that are never acknowledged wait on.
+        self._dropped_acks = []
+
         self.valid_configuration_overrides = ["valid_test_config.yaml", ""]
         self.valid_snapshot = (
             "https://s3.cp.lsst.org/rubinobs-lfa-cp/Scheduler:2/"
@@ -79,10 +129,71 @@ class MockScheduler(salobj.Controller):
 
     async def publish_heartbeat(self):
         while self.isopen:
+            await asyncio.sleep(self.heartbeat_delay)
             await self.evt_heartbeat.write()
             await asyncio.sleep(1.0)
 
+    async def simulate_command(self, cmd_name):
+        """Simulate command latency, failures and dropped acks.
+
+        Parameters
+        ----------
+        cmd_name : `str`
+            Command name.
+
+        Raises
+        ------
+        salobj.ExpectedError
+            If the command fails, according to ``error_probability``.
+        """
+        latency = self.command_latency.get(cmd_name, 0.0)
+        if isinstance(latency, (tuple, list)):
+            latency = self.rng.uniform(*latency)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        drop_ack_probability = self.get_probability(self.drop_ack_probability, cmd_name)
+        if drop_ack_probability > 0 and self.rng.random() < drop_ack_probability:
+            self.n_dropped_acks += 1
+            # Never finish the command, so it is never acknowledged.
+            dropped_ack = asyncio.Future()
+            self._dropped_acks.append(dropped_ack)
+            await dropped_ack
+
+        if self.rng.random() < self.get_probability(self.error_probability, cmd_name):
+            self.n_injected_errors += 1
+            raise salobj.ExpectedError(f"Injected failure in {cmd_name}.")
+
+    @staticmethod
+    def get_probability(probability, cmd_name):
+        """Get the probability of a fault for a command.
+
+        Parameters
+        ----------
+        probability : `float` or `dict` [`str`, `float`]
+            Probability, either for all commands or by command name.
+        cmd_name : `str`
+            Command name.
+
+        Returns
+        -------
+        `float`
+            Probability for the command.
+        """
+        return (
+            probability.get(cmd_name, 0.0)
+            if isinstance(probability, dict)
+            else probability
+        )
+
+    async def close_tasks(self):
+        """Cancel the commands that are never acknowledged."""
+        for dropped_ack in self._dropped_acks:
+            dropped_ack.cancel()
+        await super().close_tasks()
+
     async def do_disable(self, data):
+        await self.simulate_command("disable")
         await self._do_change_state(
             cmd_name="disable",
             allowed_current_states={salobj.State.ENABLED},
@@ -90,6 +201,7 @@ class MockScheduler(salobj.Controller):
         )
 
     async def do_enable(self, data):
+        await self.simulate_command("enable")
         await self._do_change_state(
             cmd_name="enable",
             allowed_current_states={salobj.State.DISABLED},
@@ -97,6 +209,7 @@ class MockScheduler(salobj.Controller):
         )
 
     async def do_standby(self, data):
+        await self.simulate_command("standby")
         await self._do_change_state(
             cmd_name="standby",
             allowed_current_states={salobj.State.DISABLED, salobj.State.FAULT},
@@ -104,6 +217,7 @@ class MockScheduler(salobj.Controller):
         )
 
     async def do_start(self, data):
+        await self.simulate_command("start")
         if data.configurationOverride not in self.valid_configuration_overrides:
             raise salobj.base.ExpectedError(
                 f"Config file {data.configurationOverride} does not exist."
@@ -117,6 +231,7 @@ class MockScheduler(salobj.Controller):
         self.overrides.append(data.configurationOverride)
 
     async def do_load(self, data):
+        await self.simulate_command("load")
         assert self.evt_summaryState.data.summaryState == salobj.State.ENABLED
         assert not self.running
         assert data.uri == self.valid_snapshot
@@ -124,15 +239,18 @@ class MockScheduler(salobj.Controller):
         self.snapshots.append(data.uri)
 
     async def do_resume(self, data):
+        await self.simulate_command("resume")
         assert self.evt_summaryState.data.summaryState == salobj.State.ENABLED
         self.running = True
 
     async def do_stop(self, data):
+        await self.simulate_command("stop")
         assert self.evt_summaryState.data.summaryState == salobj.State.ENABLED
         self.abort_observations.append(data.abort)
         self.running = False
 
     async def do_add_block(self, data):
+        await self.simulate_command("addBlock")
         assert self.evt_summaryState.data.summaryState == salobj.State.ENABLED
         assert data.id == self.valid_observing_block_id
 
@@ -145,4 +263,5 @@ class MockScheduler(salobj.Controller):
                 f"{cmd_name} not allowed in state {current_state!r}"
             )
         self.n_commands[cmd_name] += 1
+        self.state_commands.append(cmd_name)
         await self.evt_summaryState.set_write(summaryState=new_state)
@@ -0,0 +1,49 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["assert_scheduler_queue"]
+
+import math
+
+from lsst.ts import salobj
+
+
+def assert_scheduler_queue(script_index: int, scheduler_remote: salobj.Remote) -> None:
+    """Assert that a script runs in the queue of the Scheduler it commands.
+
+    Parameters
+    ----------
+    script_index : `int`
+        Index of the Script SAL component.
+    scheduler_remote : `salobj.Remote`
+        Scheduler remote.
+
+    Raises
+    ------
+    RuntimeError
+        If the script is not in the queue of the Scheduler.
+    """
+    script_queue_index = math.floor(script_index / 100000)
+    if script_queue_index != scheduler_remote.salinfo.index.value:
+        raise RuntimeError(
+            f"Script with index {script_index} cannot run in"
+            f" {scheduler_remote.salinfo.index.name} queue."
+        )
@@ -0,0 +1,223 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "BENCHMARK_DIR_ENV_VAR",
+    "make_mock_group",
+    "get_benchmark_commit",
+    "save_benchmark_results",
+    "load_benchmark_results",
+    "compare_benchmark_results",
+]
+
+import json
+import os
+import pathlib
+import subprocess
+import time
+import typing
+import unittest.mock
+
+from lsst.ts import utils
+
+# Environment variable with the directory where benchmark results are
+# stored. If not set, results are not stored.
+BENCHMARK_DIR_ENV_VAR = "LSST_SCRIPT_BENCHMARK_DIR"
+
+
+def make_mock_group(**attributes: typing.Any) -> unittest.mock.AsyncMock:
+    """Make a mock observatory control group, e.g. a TCS or a camera, that
+    answers every command instantly.
+
+    Parameters
+    ----------
+    **attributes : `dict`
+        Attributes to set on the mock, e.g. the return value of a method.
+        They override the defaults, which have no read out or shutter time.
+
+    Returns
+    -------
+    group : `unittest.mock.AsyncMock`
+        Mock group.
+    """
+    group = unittest.mock.AsyncMock()
+    group.start_task = utils.make_done_future()
+    group.disable_checks_for_components = unittest.mock.Mock()
+    group.read_out_time = 0.0
+    group.shutter_time = 0.0
+    group.fast_timeout = 1.0
+    group.long_timeout = 1.0
+    group.long_long_timeout = 1.0
+    for name, value in attributes.items():
+        setattr(group, name, value)
+    return group
+
+
+def get_benchmark_commit() -> str:
+    """Get the commit of the code being benchmarked.
+
+    Returns
+    -------
+    commit : `str`
+        Short git hash, with a "-dirty" suffix if there are uncommitted
+        changes, or the package version if git is not available.
+    """
+    package_dir = pathlib.Path(__file__).parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=package_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        changes = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=package_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        from . import __version__
+
+        return __version__
+    return f"{commit}-dirty" if changes else commit
+
+
+def _get_results_dir(
+    results_dir: typing.Union[str, pathlib.Path, None],
+) -> typing.Optional[pathlib.Path]:
+    """Get the directory where benchmark results are stored, or `None`."""
+    if results_dir is None:
+        results_dir = os.environ.get(BENCHMARK_DIR_ENV_VAR)
+    return pathlib.Path(results_dir).expanduser() if results_dir else None
+
+
+def save_benchmark_results(
+    suite: str,
+    results: typing.Dict[str, typing.Dict[str, float]],
+    results_dir: typing.Union[str, pathlib.Path, None] = None,
+) -> typing.Optional[pathlib.Path]:
+    """Save benchmark results of the current commit.
+
+    Results are stored in ``{results_dir}/{suite}/{commit}.json`` and
+    merged with the results already saved for the same commit.
+
+    Parameters
+    ----------
+    suite : `str`
+        Name of the benchmark suite.
+    results : `dict` [`str`, `dict` [`str`, `float`]]
+        Durations (sec) of each phase of each benchmark case.
+    results_dir : `str` or `pathlib.Path`, optional
+        Directory where results are stored. If not given use the
+        ``LSST_SCRIPT_BENCHMARK_DIR`` environment variable.
+
+    Returns
+    -------
+    path : `pathlib.Path` or `None`
+        File with the results, or `None` if no results directory is
+        specified.
+    """
+    results_path = _get_results_dir(results_dir)
+    if results_path is None:
+        return None
+
+    commit = get_benchmark_commit()
+    path = results_path / suite / f"{commit}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    record = (
+        json.loads(path.read_text())
+        if path.exists()
+        else dict(commit=commit, results=dict())
+    )
+    record["time"] = time.time()
+    record["results"].update(results)
+    path.write_text(json.dumps(record, indent=2, sort_keys=True))
+    return path
+
+
+def load_benchmark_results(
+    suite: str,
+    results_dir: typing.Union[str, pathlib.Path, None] = None,
+    exclude_commit: typing.Optional[str] = None,
+) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """Load the most recently saved benchmark results.
+
+    Parameters
+    ----------
+    suite : `str`
+        Name of the benchmark suite.
+    results_dir : `str` or `pathlib.Path`, optional
+        Directory where results are stored. If not given use the
+        ``LSST_SCRIPT_BENCHMARK_DIR`` environment variable.
+    exclude_commit : `str`, optional
+        Ignore the results of this commit, e.g. the current one.
+
+    Returns
+    -------
+    record : `dict` or `None`
+        Dictionary with the ``commit``, the ``time`` the results were
+        saved and the ``results``, or `None` if there are no results.
+    """
+    results_path = _get_results_dir(results_dir)
+    if results_path is None or not (results_path / suite).is_dir():
+        return None
+
+    records = [
+        json.loads(path.read_text()) for path in (results_path / suite).glob("*.json")
+    ]
+    records = [record for record in records if record["commit"] != exclude_commit]
+    return max(records, key=lambda record: record["time"]) if records else None
+
+
+def compare_benchmark_results(
+    results: typing.Dict[str, typing.Dict[str, float]],
+    previous_results: typing.Dict[str, typing.Dict[str, float]],
+) -> typing.Dict[str, typing.Dict[str, float]]:
+    """Compare benchmark results with previous ones.
+
+    Parameters
+    ----------
+    results : `dict` [`str`, `dict` [`str`, `float`]]
+        Durations (sec) of each phase of each benchmark case.
+    previous_results : `dict` [`str`, `dict` [`str`, `float`]]
+        Previous durations, in the same format.
+
+    Returns
+    -------
+    ratios : `dict` [`str`, `dict` [`str`, `float`]]
+        Ratio of the current to the previous duration of each phase found
+        in both results. Values above 1 are slowdowns.
+    """
+    ratios: typing.Dict[str, typing.Dict[str, float]] = dict()
+    for case, phases in results.items():
+        previous_phases = previous_results.get(case, dict())
+        case_ratios = {
+            phase: duration / previous_phases[phase]
+            for phase, duration in phases.items()
+            if previous_phases.get(phase, 0) > 0
+        }
+        if case_ratios:
+            ratios[case] = case_ratios
+    return ratios
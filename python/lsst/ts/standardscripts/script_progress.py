@@ -0,0 +1,173 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["ScriptProgress"]
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import typing
+
+from lsst.ts import utils
+
+# Environment variable with the directory where progress records are stored.
+PROGRESS_DIR_ENV_VAR = "LSST_SCRIPT_PROGRESS_DIR"
+
+DEFAULT_PROGRESS_DIR = pathlib.Path("~/.lsst/script_progress")
+
+
+class ScriptProgress:
+    """Persist the progress of a script execution to a local store.
+
+    The progress record contains the list of completed steps and any
+    additional state the script needs to resume execution, e.g. the current
+    position of a hexapod. It is stored as a json file, named after ``key``,
+    in ``store_dir``.
+
+    Parameters
+    ----------
+    key : `str`
+        Key that identifies the script execution, see `make_key`.
+    store_dir : `str` or `pathlib.Path`, optional
+        Directory where the progress records are stored. If not given, use
+        the ``LSST_SCRIPT_PROGRESS_DIR`` environment variable or, if not set,
+        ``~/.lsst/script_progress``.
+    log : `logging.Logger`, optional
+        Logger.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        store_dir: str | pathlib.Path | None = None,
+        log: logging.Logger | None = None,
+    ) -> None:
+        if store_dir is None:
+            store_dir = os.environ.get(PROGRESS_DIR_ENV_VAR, DEFAULT_PROGRESS_DIR)
+
+        self.key = key
+        self.path = pathlib.Path(store_dir).expanduser() / f"{key}.json"
+        self.log = (
+            logging.getLogger(type(self).__name__)
+            if log is None
+            else log.getChild(type(self).__name__)
+        )
+
+        self.completed_steps: set[int] = set()
+        self.state: dict[str, typing.Any] = dict()
+        self.group_id: str = ""
+
+    @staticmethod
+    def make_key(
+        script_name: str, program: str | None, config: dict[str, typing.Any]
+    ) -> str:
+        """Make the key that identifies a script execution.
+
+        Parameters
+        ----------
+        script_name : `str`
+            Name of the script class.
+        program : `str` or `None`
+            Program the script execution belongs to.
+        config : `dict`
+            Script configuration. The ``resume`` entry is ignored, so a run
+            with ``resume: true`` matches a previous run with the same
+            configuration.
+
+        Returns
+        -------
+        key : `str`
+            Key made of the script name, the program and a hash of the
+            configuration.
+        """
+        config_dump = json.dumps(
+            {name: value for name, value in config.items() if name != "resume"},
+            sort_keys=True,
+            default=str,
+        )
+        config_hash = hashlib.sha256(config_dump.encode()).hexdigest()[:16]
+        return f"{script_name}_{program or 'none'}_{config_hash}"
+
+    @property
+    def exists(self) -> bool:
+        """Is there a progress record in the store?"""
+        return self.path.exists()
+
+    def load(self) -> bool:
+        """Load the progress record from the store.
+
+        Returns
+        -------
+        `bool`
+            `True` if a record was loaded, `False` otherwise.
+        """
+        if not self.exists:
+            return False
+
+        try:
+            record = json.loads(self.path.read_text())
+        except Exception:
+            self.log.exception(f"Failed to read progress record {self.path}.")
+            return False
+
+        self.completed_steps = set(record.get("completed_steps", []))
+        self.state = record.get("state", dict())
+        self.group_id = record.get("group_id", "")
+        return True
+
+    def save(self, step: int | None = None, **state: typing.Any) -> None:
+        """Mark a step as completed, update the state and write the record to
+        the store.
+
+        Parameters
+        ----------
+        step : `int`, optional
+            Step that was completed.
+        **state
+            State values to update.
+        """
+        if step is not None:
+            self.completed_steps.add(step)
+        self.state.update(state)
+
+        record = dict(
+            key=self.key,
+            group_id=self.group_id,
+            timestamp=utils.current_tai(),
+            completed_steps=sorted(self.completed_steps),
+            state=self.state,
+        )
+        # Write to a temporary file and rename it, so an interrupted write
+        # never leaves a corrupted record behind.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(record, default=str))
+        os.replace(tmp_path, self.path)
+
+    def reset(self) -> None:
+        """Reset the progress in memory and remove the record from the
+        store.
+        """
+        self.completed_steps = set()
+        self.state = dict()
+        self.path.unlink(missing_ok=True)
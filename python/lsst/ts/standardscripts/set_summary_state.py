@@ -26,13 +26,11 @@ import asyncio
 import yaml
 from lsst.ts import salobj
 
-try:
-    from lsst.ts.salobj import WildcardIndexError, name_to_name_index
-except ImportError:
-    # If not available in ts_salobj, use the local fallback from utils
-    from lsst.ts.standardscripts.utils import name_to_name_index, WildcardIndexError
-
-from lsst.ts.standardscripts.utils import find_running_instances
+from lsst.ts.standardscripts.utils import (
+    find_running_instances,
+    get_component_names,
+    parse_component_spec,
+)
 from lsst.ts.xml.enums.Watcher import AlarmSeverity
 
 
@@ -47,6 +45,10 @@ class SetSummaryState(salobj.BaseScript):
 
     **Details**
 
+    * If ``mute_alarms`` is true, the alarms of all the CSCs being sent to
+      OFFLINE are muted before commanding any CSC, combined into as few
+      Watcher mute commands as possible.
+
     * Takes the shortest path from the current state to the requested state.
       Thus if you want to configure a CSC you should specify it twice:
 
@@ -66,6 +68,9 @@ class SetSummaryState(salobj.BaseScript):
         # time limit for each state transition command (sec);
         # make it generous enough to handle any CSC
         self.cmd_timeout = 60
+        # maximum length of the alarm name pattern of a mute command;
+        # CSCs going offline are muted with as few commands as possible
+        self.max_mute_pattern_length = 1000
 
         self.watcher = None
 
@@ -83,6 +88,9 @@ class SetSummaryState(salobj.BaseScript):
                     the default index is 0;
                     the default override_to_apply is ""
                     If the index is '*', the script will discover all running instances.
+                    The index can also be a list, e.g. 'MTHexapod:1,2', or a range, e.g.
+                    'Test:1-5', and CSC_name a glob, e.g. 'MT*', which uses all running
+                    instances unless an index is given.
                 type: array
                 minItems: 1
                 items:
@@ -122,7 +130,8 @@ class SetSummaryState(salobj.BaseScript):
 
                 * CSC name and optional index as ``csc_name:index`` (a `str`).
                   For a CSC that is not indexed you may omit ``:index``
-                  or specify ``:0``, as you prefer.
+                  or specify ``:0``, as you prefer. Several CSCs can be
+                  specified at once, see `parse_component_spec`.
                 * Name of desired summary state, case blind, e.g. "enabled"
                   or "STANDBY". The "fault" state is not supported.
                 * The value of ``configurationOverride`` in the ``start``
@@ -150,15 +159,9 @@ class SetSummaryState(salobj.BaseScript):
         self.log.info("Configure started")
 
         # parse the data
-        nameind_state_override = []
+        spec_state_override = []
         for elt in config.data:
-
-            try:
-                # Try to parse the name and index
-                name, index = name_to_name_index(elt[0])
-            except WildcardIndexError as e:
-                name = e.name
-                index = "*"  # Mark as wildcard
+            component_spec = parse_component_spec(elt[0])
 
             state_name = elt[1]
             if not isinstance(state_name, str):
@@ -176,16 +179,33 @@ class SetSummaryState(salobj.BaseScript):
             else:
                 override = ""
 
-            # If wildcard index is used, enter discovery mode
-            if index == "*":
-                component, discovered_indices = await find_running_instances(
-                    self.domain, name
-                )
+            spec_state_override.append((component_spec, state, override))
+
+        # expand name globs and discover running instances, all at once
+        component_names = (
+            get_component_names()
+            if any(spec.is_glob for spec, _, _ in spec_state_override)
+            else []
+        )
+        discovery_names = sorted(
+            {
+                name
+                for spec, _, _ in spec_state_override
+                if spec.needs_discovery
+                for name in spec.match_names(component_names)
+            }
+        )
+        running_indices = dict(
+            await asyncio.gather(
+                *[find_running_instances(self.domain, name) for name in discovery_names]
+            )
+        )
 
-                for idx in discovered_indices:
-                    nameind_state_override.append(((name, idx), state, override))
-            else:
-                nameind_state_override.append(((name, index), state, override))
+        nameind_state_override = [
+            (name_index, state, override)
+            for spec, state, override in spec_state_override
+            for name_index in spec.expand(component_names, running_indices)
+        ]
 
         # construct remotes
         remotes = dict()
@@ -209,6 +229,74 @@ class SetSummaryState(salobj.BaseScript):
             self.watcher = salobj.Remote(self.domain, "Watcher")
             await self.watcher.start_task
 
+    def get_mute_patterns(self):
+        """Get the alarm name patterns to mute the CSCs going OFFLINE.
+
+        Returns
+        -------
+        patterns : `list` [`str`]
+            Alarm name patterns, e.g.
+            ``^(Enabled|Heartbeat)\\.(ATDome:0|MTHexapod:1)``, each at most
+            ``max_mute_pattern_length`` long unless a single CSC
+            does not fit.
+        """
+        name_indices = dict.fromkeys(
+            f"{name}:{index}"
+            for (name, index), state, _ in self.nameind_state_override
+            if state == salobj.State.OFFLINE
+        )
+
+        prefix = r"^(Enabled|Heartbeat)\."
+        patterns = []
+        chunk = []
+        for name_index in name_indices:
+            pattern = f"{prefix}({'|'.join(chunk + [name_index])})"
+            if chunk and len(pattern) > self.max_mute_pattern_length:
+                patterns.append(f"{prefix}({'|'.join(chunk)})")
+                chunk = []
+            chunk.append(name_index)
+        if chunk:
+            patterns.append(f"{prefix}({'|'.join(chunk)})")
+        return patterns
+
+    async def mute_offline_alarms(self):
+        """Mute the alarms of all the CSCs going OFFLINE.
+
+        The mute commands are sent concurrently. Failures are logged
+        and otherwise ignored.
+        """
+        patterns = self.get_mute_patterns()
+        if not patterns:
+            return
+
+        n_cscs = len(
+            {
+                name_index
+                for name_index, state, _ in self.nameind_state_override
+                if state == salobj.State.OFFLINE
+            }
+        )
+        self.log.info(
+            f"Muting alarms for {n_cscs} CSCs going OFFLINE with "
+            f"{len(patterns)} command(s) (saving {n_cscs - len(patterns)}); "
+            f"Severity {AlarmSeverity.CRITICAL.name} for {self.mute_duration} minutes"
+        )
+        results = await asyncio.gather(
+            *[
+                self.watcher.cmd_mute.set_start(
+                    name=pattern,
+                    duration=self.mute_duration * 60,  # Convert to seconds
+                    severity=AlarmSeverity.CRITICAL,
+                    mutedBy="set_summary_state script",
+                )
+                for pattern in patterns
+            ],
+            return_exceptions=True,
+        )
+        for pattern, result in zip(patterns, results):
+            if isinstance(result, Exception):
+                self.log.warning(f"Failed to mute alarms {pattern}: {result}")
+
     def set_metadata(self, metadata):
         """Compute estimated duration.
 
@@ -231,25 +319,12 @@ class SetSummaryState(salobj.BaseScript):
             self.log.info(f"Waiting for {len(tasks)} remotes to be ready")
             await asyncio.gather(*tasks)
 
+        if self.mute_alarms:
+            await self.mute_offline_alarms()
+
         for name_index, state, override in self.nameind_state_override:
             name, index = name_index
             remote = self.remotes[(name, index)]
-            if self.mute_alarms and state == salobj.State.OFFLINE:
-                self.log.info(
-                    f"Muting alarms for (Enabled|Heartbeat).{name}:{index} Severity "
-                    f"{AlarmSeverity.CRITICAL.name} for {self.mute_duration} minutes"
-                )
-                try:
-                    alarm_name_pattern = rf"^(Enabled|Heartbeat)\.{name}:{index}"
-                    await self.watcher.cmd_mute.set_start(
-                        name=alarm_name_pattern,
-                        duration=self.mute_duration * 60,  # Convert to seconds
-                        severity=AlarmSeverity.CRITICAL,
-                        mutedBy="set_summary_state script",
-                    )
-                except Exception as e:
-                    self.log.warning(f"Failed to mute alarms for {name}:{index}: {e}")
-
             await self.checkpoint(f"set {name}:{index}")
             await salobj.set_summary_state(
                 remote=remote, state=state, override=override, timeout=self.cmd_timeout
@@ -26,6 +26,8 @@ import abc
 import yaml
 from lsst.ts import salobj
 
+from .group_state import GroupStateTransition
+
 
 class StandbyGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
     """Put components of a group in standby.
@@ -35,6 +37,17 @@ class StandbyGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
     index : `int`
         Index of Script SAL component.
 
+    Notes
+    -----
+    **Checkpoints**
+
+    * The result of each component, e.g. "atmcs done in 3.2s (1 attempt(s))",
+      after each attempt.
+
+    **Details**
+
+    All CSCs transition concurrently. CSCs that fail are retried, up to
+    ``max_attempts`` times, see `GroupStateTransition`.
     """
 
     def __init__(self, index, descr):
@@ -42,6 +55,11 @@ class StandbyGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
 
         self.config = None
 
+        # maximum number of attempts to transition each component;
+        # only the components that failed are retried
+        self.max_attempts = 2
+        self.group_state_transition = None
+
     @property
     @abc.abstractmethod
     def group(self):
@@ -96,8 +114,15 @@ class StandbyGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
         if hasattr(config, "ignore"):
             self.group.disable_checks_for_components(components=config.ignore)
 
+        self.group_state_transition = GroupStateTransition(
+            group=self.group,
+            state=salobj.State.STANDBY,
+            max_attempts=self.max_attempts,
+            log=self.log,
+        )
+
     def set_metadata(self, metadata):
-        metadata.duration = 60.0
+        metadata.duration = self.group_state_transition.estimate_duration()
 
     async def run(self):
-        await self.group.standby()
+        await self.group_state_transition.run(checkpoint=self.checkpoint)
@@ -0,0 +1,383 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["TOPIC_METADATA_DIR_ENV_VAR", "ComponentMetadata", "get_component_metadata"]
+
+import dataclasses
+import enum
+import functools
+import importlib
+import json
+import logging
+import os
+import pathlib
+import typing
+
+from lsst.ts import salobj
+from lsst.ts.xml.component_info import ComponentInfo
+
+# Environment variable with the directory where component metadata is
+# persisted; if not set the metadata is only cached in memory.
+TOPIC_METADATA_DIR_ENV_VAR = "LSST_TOPIC_METADATA_DIR"
+
+# Python types of the SAL field types.
+SAL_PYTHON_TYPES: dict[str, tuple[type, ...]] = {
+    "boolean": (bool,),
+    "byte": (int,),
+    "short": (int,),
+    "int": (int,),
+    "long": (int,),
+    "long long": (int,),
+    "unsigned short": (int,),
+    "unsigned int": (int,),
+    "unsigned long": (int,),
+    "float": (int, float),
+    "double": (int, float),
+    "string": (str,),
+}
+
+
+def is_valid_value(value: typing.Any, sal_type: str, count: int) -> bool:
+    """Can a value be assigned to a SAL field?
+
+    Parameters
+    ----------
+    value : `typing.Any`
+        Value.
+    sal_type : `str`
+        SAL type of the field, e.g. "double".
+    count : `int`
+        Number of elements of the field; 1 for scalars.
+
+    Returns
+    -------
+    `bool`
+        `True` if the value has the right type and, for arrays, at most
+        ``count`` elements.
+    """
+    python_types = SAL_PYTHON_TYPES.get(sal_type, (object,))
+    if count > 1:
+        if not isinstance(value, list) or len(value) > count:
+            return False
+        items = value
+    else:
+        items = [value]
+    # bool is a subclass of int, but not a valid int field value.
+    return all(
+        isinstance(item, python_types)
+        and (bool in python_types or not isinstance(item, bool))
+        for item in items
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class ComponentMetadata:
+    """Command and event metadata of a SAL component.
+
+    Attributes
+    ----------
+    name : `str`
+        Name of the component.
+    commands : `dict` [`str`, `dict` [`str`, `list`]]
+        Public fields of each command, as a dict of field name:
+        [SAL type, count].
+    events : `dict` [`str`, `dict` [`str`, `list`]]
+        Public fields of each event, in the same format as ``commands``.
+    """
+
+    name: str
+    commands: dict[str, dict[str, list]]
+    events: dict[str, dict[str, list]]
+
+    @property
+    def command_names(self) -> list[str]:
+        """Names of the commands."""
+        return list(self.commands)
+
+    @property
+    def event_names(self) -> list[str]:
+        """Names of the events."""
+        return list(self.events)
+
+    @classmethod
+    def from_xml(cls, name: str) -> "ComponentMetadata":
+        """Make the metadata of a component from ts_xml.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the component.
+
+        Returns
+        -------
+        metadata : `ComponentMetadata`
+            Component metadata.
+        """
+        component_info = ComponentInfo(
+            name=name, topic_subname=os.environ.get("LSST_TOPIC_SUBNAME", "")
+        )
+        topics: dict[str, dict[str, dict[str, list]]] = dict(cmd=dict(), evt=dict())
+        for topic_info in component_info.topics.values():
+            prefix, _, topic_name = topic_info.attr_name.partition("_")
+            if prefix not in topics:
+                continue
+            topics[prefix][topic_name] = {
+                field_name: [field_info.sal_type, field_info.count]
+                for field_name, field_info in topic_info.fields.items()
+                if not field_name.startswith("private_") and field_name != "salIndex"
+            }
+        return cls(name=name, commands=topics["cmd"], events=topics["evt"])
+
+    @classmethod
+    def read(cls, path: str | pathlib.Path) -> "ComponentMetadata":
+        """Read component metadata written by `write`.
+
+        Parameters
+        ----------
+        path : `str` or `pathlib.Path`
+            Path of the file.
+
+        Returns
+        -------
+        metadata : `ComponentMetadata`
+            Component metadata.
+        """
+        return cls(**json.loads(pathlib.Path(path).read_text()))
+
+    def write(self, path: str | pathlib.Path) -> None:
+        """Write the component metadata to a json file.
+
+        Parameters
+        ----------
+        path : `str` or `pathlib.Path`
+            Path of the file.
+        """
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename it, so processes sharing
+        # the directory never read a partially written file.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(dataclasses.asdict(self)))
+        os.replace(tmp_path, path)
+
+    def validate_command(self, cmd: str, parameters: dict[str, typing.Any]) -> None:
+        """Check that a command exists and that its parameters have the
+        right names and types.
+
+        Parameters
+        ----------
+        cmd : `str`
+            Name of the command.
+        parameters : `dict` [`str`, `typing.Any`]
+            Command parameters.
+
+        Raises
+        ------
+        RuntimeError
+            If the command does not exist or a parameter is not valid.
+        """
+        if cmd not in self.commands:
+            raise RuntimeError(f"Command {cmd} not a valid command for {self.name}.")
+
+        fields = self.commands[cmd]
+        for parameter, value in parameters.items():
+            if parameter not in fields:
+                raise RuntimeError(
+                    f"Parameter {parameter} not a valid parameter for "
+                    f"{self.name} command {cmd}; valid parameters are {list(fields)}."
+                )
+            sal_type, count = fields[parameter]
+            if not is_valid_value(value, sal_type=sal_type, count=count):
+                type_name = sal_type if count == 1 else f"list of {count} {sal_type}"
+                raise RuntimeError(
+                    f"Parameter {parameter}={value!r} of {self.name} command {cmd} "
+                    f"is not a valid {type_name}."
+                )
+
+    def resolve_enum_value(
+        self, event: str, field: str, value: typing.Any
+    ) -> typing.Any:
+        """Resolve the name of an enumeration value of an integer event
+        field, e.g. "ENABLED" or "State.ENABLED" for ``summaryState``.
+
+        Parameters
+        ----------
+        event : `str`
+            Name of the event.
+        field : `str`
+            Name of the field.
+        value : `typing.Any`
+            Value of the field.
+
+        Returns
+        -------
+        value : `typing.Any`
+            The enumeration value, if ``value`` is a name and the field a
+            scalar integer; otherwise ``value`` unchanged.
+
+        Raises
+        ------
+        RuntimeError
+            If ``value`` is not the name of exactly one value of the
+            enumerations of the component.
+        """
+        fields = self.events.get(event, dict())
+        if not isinstance(value, str) or field not in fields:
+            return value
+        sal_type, count = fields[field]
+        if count != 1 or SAL_PYTHON_TYPES.get(sal_type) != (int,):
+            return value
+
+        enum_name, _, member_name = value.rpartition(".")
+        enum_values = {
+            enum_class[member_name]
+            for enum_class in get_enum_classes(self.name)
+            if enum_name in ("", enum_class.__name__)
+            and member_name in enum_class.__members__
+        }
+        if not enum_values:
+            raise RuntimeError(
+                f"{value!r} of {self.name} event {event} field {field} is not the "
+                "name of an enumeration value."
+            )
+        elif len(enum_values) > 1:
+            raise RuntimeError(
+                f"{value!r} of {self.name} event {event} field {field} is the name "
+                f"of several enumeration values: {sorted(enum_values)}; "
+                "qualify it with the name of the enumeration."
+            )
+        return enum_values.pop()
+
+    def validate_event(
+        self,
+        event: str,
+        fields: list[str] | None = None,
+        values: list[tuple[str, typing.Any]] | None = None,
+    ) -> None:
+        """Check that an event exists, and optionally that it has some
+        fields and that values can be compared to them.
+
+        Parameters
+        ----------
+        event : `str`
+            Name of the event.
+        fields : `list` [`str`], optional
+            Names of fields the event must have.
+        values : `list` [`tuple`], optional
+            Values the event fields must accept, as (field, value).
+
+        Raises
+        ------
+        RuntimeError
+            If the event does not exist, lacks one of the fields, or a value
+            does not match the type of its field.
+        """
+        if event not in self.events:
+            raise RuntimeError(f"Event {event} not a valid event for {self.name}.")
+
+        values = values or []
+        for field in (fields or []) + [field for field, _ in values]:
+            if field not in self.events[event]:
+                raise RuntimeError(
+                    f"Field {field} not a valid field of {self.name} event {event}; "
+                    f"valid fields are {list(self.events[event])}."
+                )
+
+        for field, value in values:
+            sal_type, count = self.events[event][field]
+            if not is_valid_value(value, sal_type=sal_type, count=count):
+                type_name = sal_type if count == 1 else f"list of {count} {sal_type}"
+                raise RuntimeError(
+                    f"Value {value!r} of {self.name} event {event} field {field} "
+                    f"is not a valid {type_name}."
+                )
+
+
+@functools.lru_cache(maxsize=None)
+def get_enum_classes(name: str) -> tuple[type[enum.IntEnum], ...]:
+    """Get the enumerations of the field values of a SAL component.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the component.
+
+    Returns
+    -------
+    enum_classes : `tuple` [`type`]
+        `salobj.State`, for the generic topics, and the enumerations in
+        ``lsst.ts.xml.enums.{name}``, if any.
+    """
+    enum_classes: list[type[enum.IntEnum]] = [salobj.State]
+    try:
+        enums_module = importlib.import_module(f"lsst.ts.xml.enums.{name}")
+    except ImportError:
+        return tuple(enum_classes)
+
+    enum_classes += [
+        value
+        for value in vars(enums_module).values()
+        if isinstance(value, type)
+        and issubclass(value, enum.IntEnum)
+        and value.__module__ == enums_module.__name__
+    ]
+    return tuple(enum_classes)
+
+
+@functools.lru_cache(maxsize=None)
+def get_component_metadata(name: str) -> ComponentMetadata:
+    """Get the command and event metadata of a SAL component.
+
+    The metadata is built from ts_xml once per process. If the
+    ``LSST_TOPIC_METADATA_DIR`` environment variable is set, it is also
+    persisted in that directory, per ts_xml version, and read from there
+    by other processes.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the component.
+
+    Returns
+    -------
+    metadata : `ComponentMetadata`
+        Component metadata.
+    """
+    metadata_dir = os.environ.get(TOPIC_METADATA_DIR_ENV_VAR)
+    if not metadata_dir:
+        return ComponentMetadata.from_xml(name)
+
+    from lsst.ts import xml
+
+    log = logging.getLogger(__name__)
+    path = pathlib.Path(metadata_dir).expanduser() / xml.__version__ / f"{name}.json"
+    if path.exists():
+        try:
+            return ComponentMetadata.read(path)
+        except Exception:
+            log.exception(f"Failed to read {name} metadata from {path}; rebuilding.")
+
+    metadata = ComponentMetadata.from_xml(name)
+    try:
+        metadata.write(path)
+    except Exception:
+        log.exception(f"Failed to write {name} metadata to {path}.")
+    return metadata
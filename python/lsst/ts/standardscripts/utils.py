@@ -25,21 +25,36 @@ __all__ = [
     "get_mtqueue_scripts_dir",
     "get_s3_bucket",
     "get_topic_time_utc",
+    "get_topics_time_utc",
+    "get_topics_time_utc_unix",
+    "get_recent_heartbeat",
     "format_as_list",
     "format_grid",
+    "Grid",
+    "ComponentSpec",
+    "parse_component_spec",
+    "get_component_names",
 ]
 
 import asyncio
 import collections.abc
+import dataclasses
+import fnmatch
+import functools
+import itertools
+import math
 import os
 import pathlib
 import re
+import typing
 import warnings
 
+import astropy.time
 import numpy as np
+from astropy.utils import iers
 from lsst.ts import salobj
 from lsst.ts.salobj import name_to_name_index as salobj_name_to_name_index
-from lsst.ts.utils import astropy_time_from_tai_unix
+from lsst.ts.utils import astropy_time_from_tai_unix, current_tai
 
 S3_INSTANCES = dict(
     tucson="tuc",
@@ -47,6 +62,15 @@ S3_INSTANCES = dict(
     summit="cp",
 )
 
+NAME_REGEX = re.compile(r"(?P<name>[a-zA-Z_-][a-zA-Z0-9_-]*)(:(?P<index>\d+|\*))?$")
+
+# Component specification: a name or name glob, optionally followed by a
+# wildcard index or a comma-separated list of indices and index ranges.
+COMPONENT_SPEC_REGEX = re.compile(
+    r"(?P<name>[a-zA-Z_*?\[-][a-zA-Z0-9_*?\[\]-]*)"
+    r"(:(?P<indices>\*|\d+(-\d+)?(,\d+(-\d+)?)*))?$"
+)
+
 
 def get_scripts_dir():
     """Get the absolute path to the scripts directory.
@@ -83,14 +107,27 @@ def get_mtqueue_scripts_dir():
 
 
 def get_s3_bucket() -> salobj.AsyncS3Bucket:
-    """Generate an s3 bucket object.
+    """Get the s3 bucket object for the current site.
 
     The method will try to determine the s3 instance from the LSST_SITE
     environment variable. If it can't it will use "mock" as the instance
     value and will also mock the s3 bucket. This is useful for unit testing.
+
+    The bucket is created the first time it is requested for a site and
+    shared by all callers in the process afterwards.
     """
+    return _get_site_s3_bucket(os.environ.get("LSST_SITE"))
 
-    site = os.environ.get("LSST_SITE")
+
+@functools.lru_cache(maxsize=None)
+def _get_site_s3_bucket(site: typing.Optional[str]) -> salobj.AsyncS3Bucket:
+    """Generate the s3 bucket object of a site.
+
+    Parameters
+    ----------
+    site : `str` or `None`
+        Value of the LSST_SITE environment variable.
+    """
     do_mock = site not in S3_INSTANCES
     s3instance = S3_INSTANCES.get(site, "mock")
 
@@ -209,6 +246,124 @@ def format_grid(
         return axis1, axis2
 
 
+class Grid:
+    """A lazy N-dimensional grid of points.
+
+    Each axis is given either as a scalar or as a list of values. In "zip"
+    mode, point i takes the i-th value of each axis; scalars are repeated and
+    lists must all have the same length, as in `format_grid`. In "product"
+    mode, the points are the cartesian product of the axes, with the last
+    axis varying fastest; scalars are axes with a single value.
+
+    Points are generated on demand, so large grids, e.g. engineering
+    rasters, are never expanded in memory unless `to_arrays` is called.
+
+    Parameters
+    ----------
+    axes : `dict` [`str`, `float` or `list` [`float`]]
+        Values of each axis, by axis name. The order of the axes is the
+        order of the values in each point.
+    mode : `str`, optional
+        How to combine the axes, "zip" or "product".
+
+    Raises
+    ------
+    ValueError
+        If there are no axes or ``mode`` is not valid.
+    RuntimeError
+        In "zip" mode, if the lists have different lengths.
+    """
+
+    modes = ("zip", "product")
+
+    def __init__(self, axes: dict[str, float | list[float]], mode: str = "zip") -> None:
+        if mode not in self.modes:
+            raise ValueError(
+                f"Invalid grid mode {mode!r}; must be one of {self.modes}."
+            )
+        if len(axes) == 0:
+            raise ValueError("A grid needs at least one axis.")
+
+        self.mode = mode
+        self.names = tuple(axes)
+        self._scalar = tuple(np.isscalar(value) for value in axes.values())
+        self._values = tuple(
+            [value] if scalar else list(value)
+            for value, scalar in zip(axes.values(), self._scalar)
+        )
+
+        if mode == "zip":
+            lengths = [
+                len(values)
+                for values, scalar in zip(self._values, self._scalar)
+                if not scalar
+            ]
+            if len(set(lengths)) > 1:
+                sizes = ", ".join(str(length) for length in lengths[:-1])
+                raise RuntimeError(
+                    f"Array sizes must be the same. Got {sizes} and {lengths[-1]}."
+                )
+            self.shape = (lengths[0] if lengths else 1,)
+        else:
+            self.shape = tuple(len(values) for values in self._values)
+
+    @property
+    def size(self) -> int:
+        """Number of points in the grid."""
+        return math.prod(self.shape)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> collections.abc.Iterator[tuple]:
+        if self.mode == "product":
+            return itertools.product(*self._values)
+        return zip(
+            *[
+                itertools.repeat(values[0], self.size) if scalar else values
+                for values, scalar in zip(self._values, self._scalar)
+            ]
+        )
+
+    def __getitem__(self, index: int) -> tuple:
+        """Get a point of the grid without generating the previous ones.
+
+        Parameters
+        ----------
+        index : `int`
+            Index of the point; negative values count from the end.
+
+        Returns
+        -------
+        point : `tuple`
+            Value of each axis.
+        """
+        if not -self.size <= index < self.size:
+            raise IndexError(f"Grid index {index} out of range for size {self.size}.")
+        index %= self.size
+        if self.mode == "product":
+            axis_indices = np.unravel_index(index, self.shape)
+        else:
+            axis_indices = [0 if scalar else index for scalar in self._scalar]
+        return tuple(
+            values[axis_index] for values, axis_index in zip(self._values, axis_indices)
+        )
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Expand the grid.
+
+        Returns
+        -------
+        arrays : `dict` [`str`, `numpy.ndarray`]
+            Value of each axis for all the points, by axis name.
+        """
+        if self.mode == "product":
+            arrays = np.meshgrid(*self._values, indexing="ij")
+        else:
+            arrays = [np.broadcast_to(values, self.shape) for values in self._values]
+        return {name: np.ravel(array) for name, array in zip(self.names, arrays)}
+
+
 def get_topic_time_utc(topic):
     """Reformat a topic command time from TAI unix to UTC.
 
@@ -229,6 +384,168 @@ def get_topic_time_utc(topic):
     return topic_time_utc
 
 
+def get_topics_time_utc(topics) -> astropy.time.Time:
+    """Reformat the command times of many topics from TAI unix to UTC.
+
+    Vectorized version of `get_topic_time_utc`, which converts all times in
+    a single astropy call.
+
+    Parameters
+    ----------
+    topics : `list` [`salobj.BaseMsgType` or `float`]
+        Event messages, or their ``private_sndStamp`` values.
+
+    Returns
+    -------
+    topics_time_utc : `astropy.time.Time`
+        Array with the time of each topic, in UTC and ISO format.
+    """
+    topics_time = astropy_time_from_tai_unix(get_tai_unix(topics))
+    topics_time.format = "iso"
+    return topics_time.utc
+
+
+def get_topics_time_utc_unix(topics) -> np.ndarray:
+    """Convert the command times of many topics from TAI unix to UTC unix.
+
+    Fast version of `get_topics_time_utc` for when floats are enough. It
+    uses a cached table of TAI-UTC offsets instead of astropy, and matches
+    ``get_topic_time_utc(topic).unix`` to float precision.
+
+    Parameters
+    ----------
+    topics : `list` [`salobj.BaseMsgType` or `float`]
+        Event messages, or their ``private_sndStamp`` values.
+
+    Returns
+    -------
+    topics_time_utc_unix : `numpy.ndarray`
+        UTC unix time of each topic (sec).
+
+    Raises
+    ------
+    ValueError
+        If any time is before 1972, when leap seconds were introduced.
+    """
+    tai_unix = get_tai_unix(topics)
+    tai_start, tai_utc = get_tai_utc_offsets()
+    interval = np.searchsorted(tai_start, tai_unix, side="right") - 1
+    if np.any(interval < 0):
+        raise ValueError(
+            "Times before 1972 are not supported; use get_topics_time_utc."
+        )
+    utc_unix = tai_unix - tai_utc[interval]
+
+    # Like astropy, spread the UTC day before a leap second uniformly over
+    # its TAI duration.
+    next_interval = np.minimum(interval + 1, len(tai_start) - 1)
+    day_utc_start = tai_start[next_interval] - tai_utc[next_interval] - 86400.0
+    day_tai_start = day_utc_start + tai_utc[interval]
+    day_tai_duration = tai_start[next_interval] - day_tai_start
+    in_leap_day = (interval + 1 < len(tai_start)) & (tai_unix >= day_tai_start)
+    return np.where(
+        in_leap_day,
+        day_utc_start + (tai_unix - day_tai_start) * 86400.0 / day_tai_duration,
+        utc_unix,
+    )
+
+
+def get_tai_unix(topics) -> np.ndarray:
+    """Get the ``private_sndStamp`` of topics as an array.
+
+    Parameters
+    ----------
+    topics : `list` [`salobj.BaseMsgType` or `float`]
+        Event messages, or their ``private_sndStamp`` values.
+
+    Returns
+    -------
+    tai_unix : `numpy.ndarray`
+        TAI unix times (sec).
+    """
+    return np.array(
+        [getattr(topic, "private_sndStamp", topic) for topic in topics],
+        dtype=float,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_tai_utc_offsets() -> tuple[np.ndarray, np.ndarray]:
+    """Get the table of TAI-UTC offsets since 1972.
+
+    The offset of each interval between leap seconds is measured with
+    `astropy_time_from_tai_unix`, one day after the interval starts, so the
+    table follows the same conventions as `get_topic_time_utc`.
+
+    Returns
+    -------
+    tai_start : `numpy.ndarray`
+        TAI unix time when each interval starts (sec).
+    tai_utc : `numpy.ndarray`
+        TAI unix minus UTC unix time in each interval (sec).
+    """
+    leap_seconds = iers.LeapSeconds.auto_open()
+    leap_seconds = leap_seconds[leap_seconds["year"] >= 1972]
+    utc_start = astropy.time.Time(
+        [
+            f"{year}-{month:02d}-01"
+            for year, month in zip(leap_seconds["year"], leap_seconds["month"])
+        ],
+        scale="utc",
+    ).unix
+    probe = utc_start + 86400.0
+    tai_utc = np.round(probe - astropy_time_from_tai_unix(probe).utc.unix, 6)
+    return utc_start + tai_utc, tai_utc
+
+
+def is_recent(topic, max_age: float) -> bool:
+    """Check whether a topic sample was sent recently.
+
+    Parameters
+    ----------
+    topic : `salobj.BaseMsgType` or `None`
+        A single event message.
+    max_age : `float`
+        Maximum age of the sample (sec).
+
+    Returns
+    -------
+    recent : `bool`
+        `True` if the sample was sent less than ``max_age`` seconds ago.
+    """
+    return topic is not None and current_tai() - topic.private_sndStamp < max_age
+
+
+async def get_recent_heartbeat(evt_heartbeat, max_age: float, timeout: float):
+    """Get a recent heartbeat, waiting for a new one only if needed.
+
+    Parameters
+    ----------
+    evt_heartbeat : `salobj.topics.ReadTopic`
+        Heartbeat event of a remote.
+    max_age : `float`
+        Maximum age of the cached heartbeat for it to be used (sec).
+    timeout : `float`
+        How long to wait for a new heartbeat if the cached one is too old
+        (sec).
+
+    Returns
+    -------
+    heartbeat : `salobj.BaseMsgType`
+        Heartbeat sample.
+
+    Raises
+    ------
+    asyncio.TimeoutError
+        If there is no recent heartbeat and no new one arrives in time.
+    """
+    heartbeat = evt_heartbeat.get()
+    if is_recent(heartbeat, max_age):
+        return heartbeat
+
+    return await evt_heartbeat.next(flush=True, timeout=timeout)
+
+
 async def find_running_instances(
     domain, component: str, min_heartbeat=3, hb_timeout=5
 ) -> tuple[str, list[int]]:
@@ -257,7 +574,8 @@ async def find_running_instances(
     async with salobj.Remote(
         domain, component, index=0, include=["heartbeat"], readonly=True
     ) as remote:
-        # Flush old heartbeats to avoid historical data.
+        # Flush old heartbeats to avoid historical data. Even a recent one
+        # may come from an instance that has just stopped.
         remote.evt_heartbeat.flush()
 
         while all([value < min_heartbeat for value in heartbeats.values()]):
@@ -304,8 +622,6 @@ def name_to_name_index(name: str) -> tuple[str, int]:
         stacklevel=2,
     )
 
-    NAME_REGEX = re.compile(r"(?P<name>[a-zA-Z_-][a-zA-Z0-9_-]*)(:(?P<index>\d+|\*))?$")
-
     try:
         return salobj_name_to_name_index(name)
     except ValueError:
@@ -314,3 +630,146 @@ def name_to_name_index(name: str) -> tuple[str, int]:
             raise WildcardIndexError(match["name"])
         else:
             raise ValueError(f"name {name!r} is not of the form 'name' or 'name:index'")
+
+
+@dataclasses.dataclass(frozen=True)
+class ComponentSpec:
+    """A parsed component specification, see `parse_component_spec`.
+
+    Attributes
+    ----------
+    name : `str`
+        Component name, or a glob pattern of component names, e.g. "MT*".
+    indices : `tuple` [`int`] or `None`
+        Component indices, or `None` to use all running instances.
+    """
+
+    name: str
+    indices: tuple[int, ...] | None
+
+    @property
+    def is_glob(self) -> bool:
+        """Is the name a glob pattern?"""
+        return any(char in self.name for char in "*?[")
+
+    @property
+    def needs_discovery(self) -> bool:
+        """Must the running instances of the components be discovered?"""
+        return self.indices is None
+
+    def match_names(self, component_names: collections.abc.Iterable[str]) -> list[str]:
+        """Get the names of the components matched by this specification.
+
+        Parameters
+        ----------
+        component_names : `list` [`str`]
+            Names of all components, used to expand name globs.
+
+        Returns
+        -------
+        names : `list` [`str`]
+            Matching component names, sorted.
+
+        Raises
+        ------
+        ValueError
+            If the name is a glob pattern that matches no component.
+        """
+        if not self.is_glob:
+            return [self.name]
+        names = sorted(
+            name for name in component_names if fnmatch.fnmatchcase(name, self.name)
+        )
+        if not names:
+            raise ValueError(f"No component matches {self.name!r}.")
+        return names
+
+    def expand(
+        self,
+        component_names: collections.abc.Iterable[str] = (),
+        running_indices: dict[str, list[int]] | None = None,
+    ) -> list[tuple[str, int]]:
+        """Expand the specification into (name, index) pairs.
+
+        Parameters
+        ----------
+        component_names : `list` [`str`], optional
+            Names of all components, used to expand name globs.
+        running_indices : `dict` [`str`, `list` [`int`]], optional
+            Indices of the running instances of each component, e.g. from
+            `find_running_instances`. Required if `needs_discovery`.
+
+        Returns
+        -------
+        name_indices : `list` [`tuple` [`str`, `int`]]
+            Component names and indices.
+        """
+        name_indices = []
+        for name in self.match_names(component_names):
+            indices = (
+                running_indices.get(name, []) if self.needs_discovery else self.indices
+            )
+            name_indices += [(name, index) for index in indices]
+        return name_indices
+
+
+@functools.lru_cache(maxsize=256)
+def parse_component_spec(spec: str) -> ComponentSpec:
+    """Parse a component specification.
+
+    Parameters
+    ----------
+    spec : `str`
+        Component specification, ``name[:indices]``, where:
+
+        * ``name`` is a component name or a glob pattern of component names,
+          e.g. "MT*".
+        * ``indices`` is "*", to use all running instances, or a
+          comma-separated list of indices and inclusive index ranges, e.g.
+          "1,2" or "1-5". If omitted the index is 0, or all running
+          instances if ``name`` is a glob pattern.
+
+    Returns
+    -------
+    component_spec : `ComponentSpec`
+        Parsed specification.
+
+    Raises
+    ------
+    ValueError
+        If ``spec`` is not valid.
+    """
+    match = COMPONENT_SPEC_REGEX.match(spec)
+    if match is None:
+        raise ValueError(
+            f"Component {spec!r} is not of the form 'name', 'name:index', "
+            "'name:index1,index2', 'name:first-last' or 'name:*'."
+        )
+
+    name = match["name"]
+    if match["indices"] == "*":
+        return ComponentSpec(name=name, indices=None)
+    elif match["indices"] is None:
+        indices = None if any(char in name for char in "*?[") else (0,)
+        return ComponentSpec(name=name, indices=indices)
+
+    indices = []
+    for index_range in match["indices"].split(","):
+        first, _, last = index_range.partition("-")
+        if last and int(last) < int(first):
+            raise ValueError(f"Invalid index range {index_range!r} in {spec!r}.")
+        indices += range(int(first), int(last or first) + 1)
+    return ComponentSpec(name=name, indices=tuple(dict.fromkeys(indices)))
+
+
+def get_component_names() -> list[str]:
+    """Get the names of all SAL components, to expand name globs.
+
+    Returns
+    -------
+    component_names : `list` [`str`]
+        Component names.
+    """
+    from lsst.ts.xml import subsystems
+
+    return list(subsystems)
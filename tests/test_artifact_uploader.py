@@ -0,0 +1,115 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import asyncio
+import unittest
+
+from lsst.ts import standardscripts
+
+
+class FlakyBucket:
+    """Stand-in for `salobj.AsyncS3Bucket` whose uploads fail a given number
+    of times before succeeding.
+    """
+
+    def __init__(self, n_failures=0, upload_time=0.0):
+        self.n_failures = n_failures
+        self.upload_time = upload_time
+        self.n_attempts = 0
+        self.objects = dict()
+
+    async def upload(self, fileobj, key):
+        self.n_attempts += 1
+        await asyncio.sleep(self.upload_time)
+        if self.n_failures > 0:
+            self.n_failures -= 1
+            raise RuntimeError("Simulated upload failure.")
+        self.objects[key] = fileobj.read()
+
+
+class TestArtifactUploader(unittest.IsolatedAsyncioTestCase):
+    async def test_upload(self):
+        s3bucket = FlakyBucket()
+        uploader = standardscripts.ArtifactUploader(s3bucket=s3bucket)
+
+        assert uploader.upload("report.json", '{"duration": 1.0}')
+        assert uploader.upload("visits.json", b"[1, 2, 3]")
+        await uploader.drain(timeout=1.0)
+
+        assert s3bucket.objects == {
+            "report.json": b'{"duration": 1.0}',
+            "visits.json": b"[1, 2, 3]",
+        }
+        assert uploader.uploaded == ["report.json", "visits.json"]
+        assert uploader.failed == []
+
+    async def test_upload_does_not_wait(self):
+        s3bucket = FlakyBucket(upload_time=10.0)
+        uploader = standardscripts.ArtifactUploader(s3bucket=s3bucket)
+
+        uploader.upload("report.json", "slow")
+        await asyncio.sleep(0)
+
+        assert uploader.uploaded == []
+        await uploader.drain(timeout=0.1)
+        assert uploader.uploaded == []
+        assert uploader.n_pending == 0
+
+    async def test_retry(self):
+        s3bucket = FlakyBucket(n_failures=2)
+        uploader = standardscripts.ArtifactUploader(
+            s3bucket=s3bucket, max_attempts=3, backoff=0.01
+        )
+
+        uploader.upload("report.json", "data")
+        await uploader.drain(timeout=1.0)
+
+        assert s3bucket.n_attempts == 3
+        assert uploader.uploaded == ["report.json"]
+
+    async def test_give_up(self):
+        s3bucket = FlakyBucket(n_failures=3)
+        uploader = standardscripts.ArtifactUploader(
+            s3bucket=s3bucket, max_attempts=2, backoff=0.01
+        )
+
+        uploader.upload("report.json", "data")
+        uploader.upload("visits.json", "data")
+        await uploader.drain(timeout=1.0)
+
+        assert uploader.failed == ["report.json"]
+        assert uploader.uploaded == ["visits.json"]
+
+    async def test_queue_full(self):
+        s3bucket = FlakyBucket(upload_time=0.1)
+        uploader = standardscripts.ArtifactUploader(s3bucket=s3bucket, max_queue_size=1)
+
+        assert uploader.upload("first.json", "data")
+        assert not uploader.upload("second.json", "data")
+        assert uploader.n_dropped == 1
+
+        await uploader.drain(timeout=1.0)
+        assert uploader.uploaded == ["first.json"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -153,6 +153,10 @@ class TestExecutables(
         script_path = self.scripts_dir / "scheduler" / "add_block.py"
         await self.check_executable(script_path)
 
+    async def test_scheduler_bring_up(self):
+        script_path = self.scripts_dir / "scheduler" / "bring_up.py"
+        await self.check_executable(script_path)
+
     async def test_scheduler_enable(self):
         script_path = self.scripts_dir / "scheduler" / "enable.py"
         await self.check_executable(script_path)
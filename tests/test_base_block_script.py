@@ -20,11 +20,14 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import contextlib
+import os
 import unittest
+import unittest.mock
 import warnings
 
 from lsst.ts import standardscripts
 from lsst.ts.standardscripts.dummy_block_script import DummyBlockScript
+from lsst.ts.standardscripts.script_progress import PROGRESS_DIR_ENV_VAR
 
 
 class TestBaseBlockScript(
@@ -32,6 +35,9 @@ class TestBaseBlockScript(
 ):
     """Test BaseBlockScript using the DummyBlockScript script."""
 
+    def setUp(self) -> None:
+        self.use_temporary_progress_dir()
+
     async def basic_make_script(self, index):
         self.script = DummyBlockScript(index=index)
 
@@ -161,3 +167,53 @@ class TestBaseBlockScript(
             self.script.mtcs.dummy_move_radec.assert_has_awaits(expected_calls)
 
             assert not self.script.evt_largeFileObjectAvailable.has_data
+
+    async def test_resume(self):
+        async with self.make_dry_script():
+            config = dict(ra=[0.0, 10.0], dec=[80.0, 70.0], program="BLOCK-T123")
+
+            await self.configure_script(**config)
+
+            assert not self.script.resume_from_progress
+            assert not self.script.is_step_completed(0)
+
+            # Emulate an execution interrupted after the first step.
+            self.script.save_progress(0, position=1)
+
+            # Configuring a script that does not resume keeps the record.
+            await self.configure_script(**config)
+
+            assert self.script.progress.exists
+
+            await self.configure_script(resume=True, **config)
+
+            assert self.script.resume_from_progress
+            assert self.script.is_step_completed(0)
+            assert not self.script.is_step_completed(1)
+            assert self.script.get_progress_state("position") == 1
+
+            # A different configuration does not resume.
+            await self.configure_script(
+                resume=True, ra=[0.0], dec=[80.0], program="BLOCK-T123"
+            )
+
+            assert not self.script.is_step_completed(0)
+
+            # Completing the execution removes the progress record.
+            await self.configure_script(resume=True, **config)
+            await self.run_script()
+
+            assert not self.script.progress.exists
+
+    async def test_progress_not_persisted(self):
+        async with self.make_dry_script():
+            with unittest.mock.patch.dict(os.environ):
+                os.environ.pop(PROGRESS_DIR_ENV_VAR)
+
+                await self.configure_script(
+                    ra=[0.0, 10.0], dec=[80.0, 70.0], program="BLOCK-T123"
+                )
+
+            assert self.script.progress is None
+
+            await self.run_script()
@@ -0,0 +1,186 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import math
+import unittest
+import unittest.mock
+
+import pytest
+from lsst.ts.standardscripts import BaseScriptTestCase
+from lsst.ts.standardscripts.base_offset_tcs import BaseOffsetTCS
+from lsst.ts.xml.enums.Script import ScriptState
+
+
+class OffsetSequenceScript(BaseOffsetTCS):
+    """BaseOffsetTCS with a mock TCS that records the positions visited."""
+
+    def __init__(self, index):
+        super().__init__(index=index, descr="Test offset sequence.")
+        self._tcs = unittest.mock.AsyncMock()
+        self.visited = []
+        # Stop waiting at this position, if set.
+        self.block_at = None
+        self.blocked = asyncio.Event()
+
+    @property
+    def tcs(self):
+        return self._tcs
+
+    async def execute_at_offset(self, index, position):
+        self.visited.append((index, position))
+        if index == self.block_at:
+            self.blocked.set()
+            await asyncio.Future()
+
+
+class TestBaseOffsetTCSPatterns(unittest.TestCase):
+    def test_grid_pattern(self):
+        positions = BaseOffsetTCS.make_offset_pattern(
+            pattern_type="grid", n_points=9, step=10.0
+        )
+
+        assert len(positions) == 9
+        assert (0.0, 0.0) in positions
+        for position in positions:
+            assert abs(position[0]) <= 10.0
+            assert abs(position[1]) <= 10.0
+        # Serpentine ordering, consecutive positions are one step apart.
+        for p1, p2 in zip(positions[:-1], positions[1:]):
+            assert math.dist(p1, p2) == pytest.approx(10.0)
+
+    def test_grid_pattern_truncated(self):
+        positions = BaseOffsetTCS.make_offset_pattern(
+            pattern_type="grid", n_points=5, step=1.0
+        )
+
+        assert len(positions) == 5
+
+    def test_spiral_pattern(self):
+        positions = BaseOffsetTCS.make_offset_pattern(
+            pattern_type="spiral", n_points=9, step=2.0
+        )
+
+        assert positions[0] == (0.0, 0.0)
+        assert len(set(positions)) == 9
+        for p1, p2 in zip(positions[:-1], positions[1:]):
+            assert math.dist(p1, p2) == pytest.approx(2.0)
+
+    def test_random_pattern(self):
+        positions = BaseOffsetTCS.make_offset_pattern(
+            pattern_type="random", n_points=20, step=5.0, seed=7
+        )
+
+        assert len(positions) == 20
+        for position in positions:
+            assert math.hypot(*position) <= 5.0
+
+        # Same seed, same pattern.
+        assert positions == BaseOffsetTCS.make_offset_pattern(
+            pattern_type="random", n_points=20, step=5.0, seed=7
+        )
+        assert positions != BaseOffsetTCS.make_offset_pattern(
+            pattern_type="random", n_points=20, step=5.0, seed=8
+        )
+
+    def test_invalid_pattern(self):
+        with pytest.raises(RuntimeError):
+            BaseOffsetTCS.make_offset_pattern(
+                pattern_type="hexagon", n_points=3, step=1.0
+            )
+
+
+class TestBaseOffsetTCSSequence(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase):
+    async def basic_make_script(self, index):
+        self.script = OffsetSequenceScript(index=index)
+        return (self.script,)
+
+    async def test_run_offset_sequence(self):
+        offsets = [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [-5.0, 2.0]]
+        async with self.make_script():
+            await self.configure_script(offset_sequence=dict(offsets=offsets))
+
+            await self.run_script()
+
+            assert self.script.visited == [
+                (index, tuple(offset)) for index, offset in enumerate(offsets)
+            ]
+            # Each offset is relative to the previous position, and cleanup
+            # returns to the origin with a single offset.
+            self.script.tcs.offset_xy.assert_has_awaits(
+                [
+                    unittest.mock.call(x=x, y=y, relative=True, absorb=False)
+                    for x, y in [
+                        (0.0, 0.0),
+                        (10.0, 0.0),
+                        (0.0, 10.0),
+                        (-15.0, -8.0),
+                        (5.0, -2.0),
+                    ]
+                ]
+            )
+            assert self.script.tcs.offset_xy.await_count == 5
+            assert self.script.cumulative_offset == [0.0, 0.0]
+
+    async def test_run_offset_sequence_azel_no_return(self):
+        async with self.make_script():
+            await self.configure_script(
+                offset_sequence=dict(
+                    frame="azel",
+                    pattern=dict(type="grid", n_points=4, step=2.0),
+                    return_to_origin=False,
+                )
+            )
+
+            await self.run_script()
+
+            assert len(self.script.visited) == 4
+            assert self.script.tcs.offset_azel.await_count == 4
+            self.script.tcs.offset_xy.assert_not_awaited()
+            final_position = self.script.visited[-1][1]
+            assert self.script.cumulative_offset == pytest.approx(list(final_position))
+
+    async def test_stop_mid_sequence(self):
+        async with self.make_script():
+            await self.configure_script(
+                offset_sequence=dict(offsets=[[1.0, 0.0], [1.0, 2.0], [3.0, 3.0]])
+            )
+            self.script.block_at = 1
+
+            run_task = asyncio.create_task(
+                self.script.do_run(self.script.cmd_run.DataType())
+            )
+            await asyncio.wait_for(self.script.blocked.wait(), timeout=10)
+            await self.script.do_stop(self.script.cmd_stop.DataType())
+            await run_task
+            await asyncio.wait_for(self.script.done_task, timeout=10)
+
+            assert self.script.state.state == ScriptState.STOPPED
+            assert len(self.script.visited) == 2
+            # Cleanup undid the two offsets applied before the stop.
+            assert self.script.tcs.offset_xy.await_args == unittest.mock.call(
+                x=-1.0, y=-2.0, relative=True, absorb=False
+            )
+            assert self.script.cumulative_offset == [0.0, 0.0]
+
+
+if __name__ == "__main__":
+    unittest.main()
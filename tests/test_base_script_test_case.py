@@ -0,0 +1,78 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import unittest
+from unittest import mock
+
+from lsst.ts.standardscripts.base_script_test_case import (
+    MAX_TEST_INDEX,
+    get_test_worker,
+    make_test_index_generator,
+    set_worker_topic_subname,
+)
+
+
+class TestWorkerAllocation(unittest.TestCase):
+    def test_single_worker(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop("PYTEST_XDIST_WORKER", None)
+            os.environ.pop("PYTEST_XDIST_WORKER_COUNT", None)
+            os.environ["LSST_TOPIC_SUBNAME"] = "test"
+
+            assert get_test_worker() == (0, 1)
+            assert next(make_test_index_generator()) == 1
+            set_worker_topic_subname()
+            assert os.environ["LSST_TOPIC_SUBNAME"] == "test"
+
+    def test_disjoint_workers(self):
+        n_workers = 12
+        indices = []
+        topic_subnames = []
+        for worker in range(n_workers):
+            with mock.patch.dict(
+                os.environ,
+                PYTEST_XDIST_WORKER=f"gw{worker}",
+                PYTEST_XDIST_WORKER_COUNT=str(n_workers),
+                LSST_TOPIC_SUBNAME="test",
+            ):
+                index_generator = make_test_index_generator()
+                range_size = MAX_TEST_INDEX // n_workers
+                indices.append({next(index_generator) for _ in range(range_size)})
+                assert next(index_generator) == min(indices[-1])
+
+                set_worker_topic_subname()
+                set_worker_topic_subname()
+                topic_subnames.append(os.environ["LSST_TOPIC_SUBNAME"])
+
+        all_indices = set.union(*indices)
+        assert len(all_indices) == sum([len(worker) for worker in indices])
+        assert max(all_indices) <= MAX_TEST_INDEX
+
+        for topic_subname in topic_subnames:
+            assert [other for other in topic_subnames if topic_subname in other] == [
+                topic_subname
+            ]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import types
+import unittest
+import unittest.mock
+
+import pytest
+from lsst.ts.standardscripts import BaseScriptTestCase, TimingModelGroup, dry_run
+from lsst.ts.standardscripts.base_take_stuttered import BaseTakeStuttered
+from lsst.ts.xml.enums.Script import ScriptState
+
+
+class TakeStuttered(BaseTakeStuttered):
+    """Minimal concrete stuttered script; the camera is replaced by a
+    stand-in in the tests.
+    """
+
+    def __init__(self, index):
+        super().__init__(index=index, descr="Test take stuttered.")
+
+    @property
+    def camera(self):
+        raise NotImplementedError()
+
+    def get_instrument_configuration(self):
+        return dict()
+
+
+class TestBaseTakeStuttered(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase):
+    async def basic_make_script(self, index):
+        self.script = TakeStuttered(index=index)
+        return (self.script,)
+
+    async def test_chunks(self):
+        async with self.make_script():
+            camera = TimingModelGroup("camera", read_out_time=2.0, shutter_time=1.0)
+
+            result = await dry_run(
+                self.script,
+                config=dict(exp_time=0.5, n_images=5, n_shift=10, chunk_size=2),
+                stand_ins=dict(camera=camera),
+            )
+
+            assert self.script.chunks == [2, 2, 1]
+            take_stuttered_calls = [
+                call for call in camera.calls if call[0] == "take_stuttered"
+            ]
+            assert len(take_stuttered_calls) == 3
+            chunk_phases = [
+                phase
+                for phase in result.timeline
+                if phase["name"].startswith("Take stuttered chunk")
+            ]
+            assert [phase["name"] for phase in chunk_phases] == [
+                "Take stuttered chunk 1 of 3: images 1-2 of 5",
+                "Take stuttered chunk 2 of 3: images 3-4 of 5",
+                "Take stuttered chunk 3 of 3: images 5-5 of 5",
+            ]
+
+    async def test_single_chunk_by_default(self):
+        async with self.make_script():
+            await self.configure_script(exp_time=0.5, n_images=5)
+
+            assert self.script.chunks == [5]
+
+    async def test_stop_finishes_chunk(self):
+        async with self.make_script():
+            chunk_started = asyncio.Event()
+            finish_chunk = asyncio.Event()
+            chunks_taken = []
+
+            async def take_stuttered(n, **kwargs):
+                chunk_started.set()
+                await finish_chunk.wait()
+                chunks_taken.append(n)
+
+            camera = unittest.mock.AsyncMock()
+            camera.take_stuttered.side_effect = take_stuttered
+
+            with unittest.mock.patch.object(
+                TakeStuttered, "camera", property(lambda self: camera)
+            ):
+                await self.configure_script(exp_time=0.5, n_images=5, chunk_size=2)
+
+                run_task = asyncio.create_task(
+                    self.script.do_run(self.script.cmd_run.DataType())
+                )
+                await asyncio.wait_for(chunk_started.wait(), timeout=10)
+                await self.script.do_stop(self.script.cmd_stop.DataType())
+
+                # The script waits for the chunk being taken to finish.
+                await asyncio.sleep(0.1)
+                assert not self.script.done_task.done()
+
+                finish_chunk.set()
+                await run_task
+                await asyncio.wait_for(self.script.done_task, timeout=10)
+
+            assert self.script.state.state == ScriptState.STOPPED
+            assert chunks_taken == [2]
+            camera.take_stuttered.assert_awaited_once()
+
+    async def test_duration(self):
+        async with self.make_script():
+            self.script.config = types.SimpleNamespace(
+                exp_time=0.5, n_images=5, n_shift=20, row_shift=100
+            )
+            camera = TimingModelGroup("camera", read_out_time=2.0, shutter_time=1.0)
+
+            with unittest.mock.patch.object(
+                TakeStuttered, "camera", property(lambda self: camera)
+            ):
+                image_duration = self.script.get_stuttered_image_duration()
+                metadata = types.SimpleNamespace(duration=0.0)
+                self.script.set_metadata(metadata)
+
+            expected_image_duration = (
+                20 * (0.5 + 100 * self.script.row_transfer_time) + 2.0 * 1.0 + 2.0
+            )
+            assert image_duration == pytest.approx(expected_image_duration)
+            assert metadata.duration == pytest.approx(5 * expected_image_duration)
+
+    async def test_duration_no_shutter_time(self):
+        async with self.make_script():
+            self.script.config = types.SimpleNamespace(
+                exp_time=0.5, n_images=5, n_shift=20, row_shift=100
+            )
+            camera = types.SimpleNamespace(read_out_time=2.0, shutter_time=None)
+
+            with unittest.mock.patch.object(
+                TakeStuttered, "camera", property(lambda self: camera)
+            ):
+                image_duration = self.script.get_stuttered_image_duration()
+
+            expected_image_duration = (
+                20 * (0.5 + 100 * self.script.row_transfer_time) + 2.0
+            )
+            assert image_duration == pytest.approx(expected_image_duration)
+
+
+if __name__ == "__main__":
+    unittest.main()
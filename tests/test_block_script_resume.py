@@ -0,0 +1,203 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import types
+import unittest
+import unittest.mock
+
+from lsst.ts import standardscripts
+from lsst.ts.standardscripts.base_focus_sweep import BaseFocusSweep
+from lsst.ts.standardscripts.base_take_aos_sequence import BaseTakeAOSSequence
+from lsst.ts.xml.enums.Script import ScriptState
+
+
+class GenericFocusSweep(BaseFocusSweep):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Generic focus sweep")
+        self.mock_tcs = standardscripts.make_mock_group()
+        self.mock_camera = standardscripts.make_mock_group()
+        self.ocps = standardscripts.make_mock_group()
+
+    @property
+    def tcs(self):
+        return self.mock_tcs
+
+    async def configure_tcs(self):
+        pass
+
+    @property
+    def camera(self):
+        return self.mock_camera
+
+    async def configure_camera(self):
+        pass
+
+    async def move_hexapod(self, axis, value):
+        await self.tcs.move_camera_hexapod(**{axis: value})
+
+    def get_instrument_configuration(self):
+        return dict()
+
+    def get_instrument_filter(self):
+        return "r"
+
+    def get_instrument_name(self):
+        return "GenericCam"
+
+
+class GenericTakeAOSSequence(BaseTakeAOSSequence):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Generic take AOS sequence")
+        self.mock_camera = standardscripts.make_mock_group()
+        self.mock_oods = unittest.mock.MagicMock()
+        self.mock_oods.evt_imageInOODS.next = unittest.mock.AsyncMock(
+            return_value=types.SimpleNamespace(
+                obsid="MC_O_20261018_000001", raft="R22", sensor="S11"
+            )
+        )
+        self.mtcs = standardscripts.make_mock_group()
+        self.ocps = standardscripts.make_mock_group()
+
+    @property
+    def camera(self):
+        return self.mock_camera
+
+    async def configure_camera(self):
+        pass
+
+    @property
+    def oods(self):
+        return self.mock_oods
+
+    def get_instrument_name(self):
+        return "GenericCam"
+
+
+class TestFocusSweepResume(
+    standardscripts.BaseScriptTestCase, unittest.IsolatedAsyncioTestCase
+):
+    def setUp(self) -> None:
+        self.use_temporary_progress_dir()
+
+    async def basic_make_script(self, index):
+        self.script = GenericFocusSweep(index=index)
+        return [self.script]
+
+    async def test_resume(self):
+        config = dict(
+            axis="z", focus_window=100.0, n_steps=3, exp_time=0.0, resume=True
+        )
+
+        # First execution fails taking the images of the second step, at the
+        # original position of the hexapod.
+        async with self.make_script():
+            self.script.camera.take_focus.side_effect = [[1], RuntimeError("Fail")]
+            await self.configure_script(**config)
+            await self.run_script(expected_final_state=ScriptState.FAILED)
+
+            assert self.script.is_step_completed(0)
+            assert not self.script.is_step_completed(1)
+            # Cleanup left the hexapod at the original position.
+            self.script.tcs.move_camera_hexapod.assert_has_awaits(
+                [
+                    unittest.mock.call(z=-50.0),
+                    unittest.mock.call(z=50.0),
+                    unittest.mock.call(z=0.0),
+                ]
+            )
+
+        async with self.make_script():
+            self.script.camera.take_focus.side_effect = [[2], [3]]
+            await self.configure_script(**config)
+
+            assert self.script.is_step_completed(0)
+
+            await self.run_script()
+
+            # Move from the original position to the second step, then to
+            # the third one and back.
+            self.script.tcs.move_camera_hexapod.assert_has_awaits(
+                [
+                    unittest.mock.call(z=0.0),
+                    unittest.mock.call(z=50.0),
+                    unittest.mock.call(z=-50.0),
+                ]
+            )
+            assert self.script.camera.take_focus.await_count == 2
+            assert self.script.focus_visit_ids == [1, 2, 3]
+            assert not self.script.progress.exists
+
+
+class TestTakeAOSSequenceResume(
+    standardscripts.BaseScriptTestCase, unittest.IsolatedAsyncioTestCase
+):
+    def setUp(self) -> None:
+        self.use_temporary_progress_dir()
+
+    async def basic_make_script(self, index):
+        self.script = GenericTakeAOSSequence(index=index)
+        return [self.script]
+
+    async def test_resume(self):
+        config = dict(n_sequences=2, exposure_time=0.0, dz=1500.0, resume=True)
+        visit_id = [2026101800001]
+
+        # First execution fails taking the extra-focal image of the second
+        # sequence, leaving the hexapod at the extra-focal position.
+        async with self.make_script():
+            self.script.camera.take_cwfs.side_effect = [
+                visit_id,
+                visit_id,
+                visit_id,
+                RuntimeError("Fail"),
+            ]
+            await self.configure_script(**config)
+            await self.run_script(expected_final_state=ScriptState.FAILED)
+
+            assert self.script.current_z_position == 1500.0
+
+        async with self.make_script():
+            self.script.camera.take_cwfs.return_value = visit_id
+            await self.configure_script(**config)
+
+            assert self.script.is_step_completed(0)
+            assert self.script.get_progress_state("current_z_position") == 1500.0
+
+            await self.run_script()
+
+            # Only the second sequence is taken, starting by moving the
+            # hexapod from the extra-focal to the intra-focal position.
+            self.script.mtcs.offset_camera_hexapod.assert_has_awaits(
+                [
+                    unittest.mock.call(x=0, y=0, z=-3000.0, u=0, v=0),
+                    unittest.mock.call(x=0, y=0, z=3000.0, u=0, v=0),
+                    unittest.mock.call(x=0, y=0, z=-1500.0, u=0, v=0),
+                ]
+            )
+            assert self.script.mtcs.offset_camera_hexapod.await_count == 3
+            assert self.script.camera.take_acq.await_count == 1
+            assert self.script.current_z_position == 0
+            assert not self.script.progress.exists
+
+
+if __name__ == "__main__":
+    unittest.main()
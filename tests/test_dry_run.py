@@ -0,0 +1,178 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import time
+import unittest
+import unittest.mock
+
+import pytest
+from lsst.ts.standardscripts import (
+    ArtifactUploader,
+    BaseScriptTestCase,
+    TimingModelGroup,
+    VirtualClock,
+    dry_run,
+)
+from lsst.ts.standardscripts.dummy_block_script import DummyBlockScript
+from lsst.ts.standardscripts.sleep import Sleep
+
+
+class TestVirtualClock(unittest.IsolatedAsyncioTestCase):
+    async def test_sleeps_finish_instantly(self):
+        clock = VirtualClock()
+        finished = []
+
+        async def sleep(name, duration):
+            await asyncio.sleep(duration)
+            finished.append((name, clock.elapsed))
+
+        t0 = time.monotonic()
+        with clock.patch_loop():
+            await asyncio.gather(sleep("long", 3600.0), sleep("short", 10.0))
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.sleep(100.0), timeout=5.0)
+            elapsed = clock.elapsed
+
+        assert time.monotonic() - t0 < 1.0
+        assert [name for name, _ in finished] == ["short", "long"]
+        assert finished[0][1] == pytest.approx(10.0)
+        assert finished[1][1] == pytest.approx(3600.0)
+        assert elapsed == pytest.approx(3605.0)
+
+    async def test_unpatch_rebases_timers(self):
+        clock = VirtualClock()
+        loop = asyncio.get_running_loop()
+
+        with clock.patch_loop():
+            await asyncio.sleep(3600.0)
+            short_sleep_task = asyncio.create_task(asyncio.sleep(0.1))
+            # Let the task schedule its timer before unpatching.
+            await asyncio.sleep(0)
+
+        # The timer keeps the time left in virtual time, instead of waiting
+        # for the real time to catch up with the virtual time.
+        t0 = loop.time()
+        await asyncio.wait_for(short_sleep_task, timeout=5.0)
+        assert loop.time() - t0 < 1.0
+
+    async def test_timing_model_group(self):
+        camera = TimingModelGroup("camera", read_out_time=2.0, shutter_time=1.0)
+        clock = VirtualClock()
+
+        with clock.patch_loop():
+            visit_ids = await camera.take_imgtype("OBJECT", 30.0, 2)
+            more_visit_ids = await camera.take_focus(exptime=10.0, n=1)
+            camera.disable_checks_for_components(components=["atdome"])
+
+        assert visit_ids == [1, 2]
+        assert more_visit_ids == [3]
+        assert camera.calls == [("take_imgtype", 66.0), ("take_focus", 13.0)]
+        assert clock.elapsed == pytest.approx(79.0)
+
+
+class TestDryRunSleep(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase):
+    async def basic_make_script(self, index):
+        self.script = Sleep(index=index)
+        return (self.script,)
+
+    async def test_dry_run(self):
+        async with self.make_script():
+            t0 = time.monotonic()
+            result = await dry_run(self.script, config=dict(sleep_for=3600.0))
+
+            assert time.monotonic() - t0 < 1.0
+            assert result.duration == pytest.approx(3600.0)
+            assert result.estimated_duration == pytest.approx(3600.0)
+            assert [phase["name"] for phase in result.timeline] == [
+                "start",
+                "Sleep for 3600.0 seconds...",
+                "cleanup",
+            ]
+            assert result.timeline[1]["duration"] == pytest.approx(3600.0)
+
+
+class TestDryRunBlockScript(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase):
+    async def basic_make_script(self, index):
+        self.script = DummyBlockScript(index=index)
+        return (self.script,)
+
+    async def test_dry_run(self):
+        async with self.make_script():
+            mtcs = TimingModelGroup("mtcs", default_time=30.0)
+
+            result = await dry_run(
+                self.script,
+                config=dict(
+                    ra=[0.0, 1.0, 2.0], dec=[-30.0, -30.0, -30.0], pause_for=5.0
+                ),
+                stand_ins=dict(mtcs=mtcs),
+            )
+
+            assert len(mtcs.calls) == 3
+            assert result.duration == pytest.approx(3 * (30.0 + 5.0))
+            grid_phases = [
+                phase for phase in result.timeline if "radec grid" in phase["name"]
+            ]
+            assert len(grid_phases) == 3
+            for phase in grid_phases:
+                assert phase["duration"] == pytest.approx(35.0)
+
+    async def test_dry_run_program(self):
+        async with self.make_script():
+            mtcs = TimingModelGroup("mtcs", default_time=30.0)
+
+            with unittest.mock.patch.object(
+                self.script, "get_obs_id", side_effect=RuntimeError("Network")
+            ):
+                result = await dry_run(
+                    self.script,
+                    config=dict(ra=[0.0], dec=[-30.0], program="BLOCK-T123"),
+                    stand_ins=dict(mtcs=mtcs),
+                )
+
+            assert result.duration == pytest.approx(30.0)
+            assert self.script.obs_id is None
+
+    async def test_dry_run_artifacts(self):
+        async with self.make_script():
+            mtcs = TimingModelGroup("mtcs", default_time=30.0)
+
+            async def run_block():
+                self.script.publish_artifact("dry_run_test", payload="{}")
+
+            with unittest.mock.patch.object(
+                self.script, "run_block", side_effect=run_block
+            ), unittest.mock.patch.object(ArtifactUploader, "upload") as upload:
+                result = await dry_run(
+                    self.script,
+                    config=dict(ra=[0.0], dec=[-30.0]),
+                    stand_ins=dict(mtcs=mtcs),
+                )
+
+            upload.assert_not_called()
+            assert len(result.artifacts) == 1
+            assert "dry_run_test" in result.artifacts[0]
+            assert self.script.artifact_uploader.uploaded == []
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,277 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+import pytest
+import yaml
+from lsst.ts import salobj
+from lsst.ts.standardscripts import BaseScriptTestCase, GroupStateTransition
+from lsst.ts.standardscripts.enable_group import EnableGroup
+from lsst.ts.standardscripts.group_state import TIMINGS_DIR_ENV_VAR
+from lsst.ts.standardscripts.offline_group import OfflineGroup
+from lsst.ts.standardscripts.standby_group import StandbyGroup
+
+COMPONENTS = ["atmcs", "atptg", "atdome"]
+
+
+def make_group():
+    """Make a mock group whose components can be ignored."""
+    group = mock.AsyncMock()
+    group.components_attr = list(COMPONENTS)
+    group.check = types.SimpleNamespace(**{component: True for component in COMPONENTS})
+
+    def disable_checks_for_components(components):
+        for component in components:
+            setattr(group.check, component, False)
+
+    group.disable_checks_for_components = mock.Mock(
+        side_effect=disable_checks_for_components
+    )
+    return group
+
+
+class EnableTestGroup(EnableGroup):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Enable test group")
+        self.mock_group = make_group()
+
+    @property
+    def group(self):
+        return self.mock_group
+
+    @staticmethod
+    def components():
+        return list(COMPONENTS)
+
+    @classmethod
+    def get_schema(cls):
+        schema_yaml = """
+            $schema: http://json-schema.org/draft-07/schema#
+            $id: https://github.com/lsst-ts/ts_standardscripts/test_group_state.yaml
+            title: EnableTestGroup v1
+            description: Configuration for EnableTestGroup.
+            type: object
+            properties:
+                atmcs:
+                    type: string
+                atptg:
+                    type: string
+                atdome:
+                    type: string
+                ignore:
+                    type: array
+                    items:
+                        type: string
+            additionalProperties: false
+        """
+        return yaml.safe_load(schema_yaml)
+
+
+class StandbyTestGroup(StandbyGroup):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Standby test group")
+        self.mock_group = make_group()
+
+    @property
+    def group(self):
+        return self.mock_group
+
+    @staticmethod
+    def components():
+        return list(COMPONENTS)
+
+
+class OfflineTestGroup(OfflineGroup):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Offline test group")
+        self.mock_group = make_group()
+
+    @property
+    def group(self):
+        return self.mock_group
+
+    @staticmethod
+    def components():
+        return list(COMPONENTS)
+
+
+class TestGroupStateTransition(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        self.group = mock.AsyncMock()
+        self.group.components_attr = ["atmcs", "atptg", "atdome"]
+        self.group.check = types.SimpleNamespace(atmcs=True, atptg=True, atdome=False)
+        self.n_failures = dict(atmcs=0, atptg=0)
+
+        async def set_state(state, overrides=None, components=None):
+            (component,) = components
+            if self.n_failures[component] > 0:
+                self.n_failures[component] -= 1
+                raise RuntimeError(f"{component} failed")
+
+        self.group.set_state.side_effect = set_state
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def make_transition(self, **kwargs):
+        return GroupStateTransition(
+            group=self.group,
+            state=salobj.State.ENABLED,
+            timings_dir=self.tmp_dir.name,
+            **kwargs,
+        )
+
+    async def test_run(self):
+        transition = self.make_transition(default_duration=45.0)
+        checkpoint = mock.AsyncMock()
+
+        # Ignored components are not used.
+        assert transition.components == ["atmcs", "atptg"]
+        assert transition.estimate_duration() == 45.0
+
+        results = await transition.run(
+            overrides=dict(atmcs="", atptg="special"), checkpoint=checkpoint
+        )
+
+        assert all(result.succeeded for result in results.values())
+        assert [result.attempts for result in results.values()] == [1, 1]
+        self.group.set_state.assert_has_awaits(
+            [
+                mock.call(
+                    salobj.State.ENABLED,
+                    overrides=dict(atmcs="", atptg="special"),
+                    components=[component],
+                )
+                for component in ("atmcs", "atptg")
+            ],
+            any_order=True,
+        )
+        assert checkpoint.await_count == 2
+
+        # The measured durations feed the next estimate.
+        assert self.make_transition().estimate_duration() < 45.0
+
+    async def test_run_retry_failed(self):
+        self.n_failures["atptg"] = 1
+        transition = self.make_transition(max_attempts=2)
+
+        results = await transition.run()
+
+        assert results["atmcs"].attempts == 1
+        assert results["atptg"].attempts == 2
+        assert results["atptg"].succeeded
+        assert self.group.set_state.await_count == 3
+
+    async def test_run_failed(self):
+        self.n_failures["atptg"] = 2
+        transition = self.make_transition(max_attempts=2)
+
+        with pytest.raises(RuntimeError, match="atptg"):
+            await transition.run()
+
+        assert transition.results["atmcs"].succeeded
+        assert transition.results["atptg"].error == "atptg failed"
+
+        # Only successful transitions are timed.
+        assert list(transition.load_timings()) == ["atmcs"]
+
+    def test_invalid_max_attempts(self):
+        with pytest.raises(ValueError):
+            self.make_transition(max_attempts=0)
+
+    async def test_run_timings_not_stored(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop(TIMINGS_DIR_ENV_VAR, None)
+            transition = GroupStateTransition(
+                group=self.group, state=salobj.State.ENABLED
+            )
+
+        assert transition.path is None
+
+        await transition.run()
+
+        assert transition.load_timings() == dict()
+        assert transition.estimate_duration() == transition.default_duration
+
+
+class TestGroupStateScripts(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase):
+    """Test that EnableGroup, StandbyGroup and OfflineGroup pass their
+    configuration to GroupStateTransition.
+    """
+
+    async def basic_make_script(self, index):
+        self.script = self.script_class(index=index)
+        return [self.script]
+
+    async def test_enable_group(self):
+        self.script_class = EnableTestGroup
+        async with self.make_script():
+            await self.configure_script(atptg="special", ignore=["atdome"])
+            await self.run_script()
+
+            self.assert_transitions(
+                state=salobj.State.ENABLED,
+                overrides=dict(atmcs="", atptg="special", atdome=""),
+            )
+
+    async def test_standby_group(self):
+        self.script_class = StandbyTestGroup
+        async with self.make_script():
+            await self.configure_script(ignore=["atdome"])
+            await self.run_script()
+
+            self.assert_transitions(state=salobj.State.STANDBY, overrides=None)
+
+    async def test_offline_group(self):
+        self.script_class = OfflineTestGroup
+        async with self.make_script():
+            await self.configure_script(ignore=["atdome"])
+            await self.run_script()
+
+            self.assert_transitions(state=salobj.State.OFFLINE, overrides=None)
+
+    def assert_transitions(self, state, overrides):
+        """Assert that the components that are not ignored, and only those,
+        were sent to ``state`` with ``overrides``.
+        """
+        transition = self.script.group_state_transition
+        assert transition.state == state
+        assert transition.max_attempts == self.script.max_attempts
+        assert transition.components == ["atmcs", "atptg"]
+        self.script.group.set_state.assert_has_awaits(
+            [
+                mock.call(state, overrides=overrides, components=[component])
+                for component in ("atmcs", "atptg")
+            ],
+            any_order=True,
+        )
+        assert self.script.group.set_state.await_count == 2
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,6 +24,7 @@ import unittest
 
 from lsst.ts.standardscripts import BaseScriptTestCase, get_scripts_dir
 from lsst.ts.standardscripts.mute_alarms import MuteAlarms
+from lsst.ts.xml.enums.Script import ScriptState
 from lsst.ts.xml.enums.Watcher import AlarmSeverity
 
 
@@ -76,6 +77,57 @@ class TestMuteAlarms(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase):
                 timeout=self.script.std_timeout,
             )
 
+    async def test_run_batch(self):
+        async with self.make_script():
+            await self.configure_script(
+                name="Enabled.ATDome",
+                alarms=[
+                    dict(name="Enabled.ATMCS"),
+                    dict(name="Heartbeat.*", duration=30, severity="CRITICAL"),
+                ],
+                mutedBy="test",
+                duration=10,
+                severity="WARNING",
+            )
+
+            await self.run_script()
+
+            self.script.watcher.cmd_mute.set_start.assert_has_awaits(
+                [
+                    unittest.mock.call(
+                        name=name,
+                        duration=duration,
+                        severity=severity,
+                        mutedBy="test",
+                        timeout=self.script.std_timeout,
+                    )
+                    for name, duration, severity in (
+                        ("Enabled.ATDome", 10, AlarmSeverity.WARNING),
+                        ("Enabled.ATMCS", 10, AlarmSeverity.WARNING),
+                        ("Heartbeat.*", 30, AlarmSeverity.CRITICAL),
+                    )
+                ],
+                any_order=True,
+            )
+
+    async def test_run_batch_failed(self):
+        async with self.make_script():
+            await self.configure_script(
+                alarms=[dict(name="Enabled.ATDome"), dict(name="Enabled.ATMCS")],
+                mutedBy="test",
+                duration=10,
+                severity="WARNING",
+            )
+            self.script.watcher.cmd_mute.set_start.side_effect = [
+                RuntimeError("Mute failed"),
+                None,
+            ]
+
+            await self.run_script(expected_final_state=ScriptState.FAILED)
+
+            # The other mute command is still sent.
+            assert self.script.watcher.cmd_mute.set_start.await_count == 2
+
     async def test_executable(self):
         scripts_dir = get_scripts_dir()
         script_path = scripts_dir / "pause_queue.py"
@@ -24,6 +24,7 @@ import unittest
 
 import pytest
 from lsst.ts import salobj, standardscripts
+from lsst.ts.xml.enums.Script import ScriptState
 
 random.seed(47)  # for set_random_lsst_dds_partition_prefix
 
@@ -44,12 +45,61 @@ class TestRunCommand(
             float0=data.float0, string0=data.string0
         )
 
+    async def set_arrays_callback(self, data):
+        await self.controller.evt_arrays.set_write(int0=data.int0)
+
+    async def ignore_callback(self, data):
+        pass
+
+    async def set_scalars_ramp_callback(self, data):
+        """Output one scalars event for each value from 1 to int0."""
+        for value in range(1, data.int0 + 1):
+            await self.controller.evt_scalars.set_write(int0=value)
+
     async def test_configure_errors(self):
         """Test error handling in the do_configure method."""
         for bad_config in (
             {},  # need component name and command name
             {"component": "Test:1"},  # need command name
             {"cmd": "setScalars"},  # need component name
+            {"component": "Test:1", "cmd": "noSuchCommand"},
+            {"component": "Test:1", "cmd": "setScalars", "event": "noSuchEvent"},
+            # invalid parameter name and type
+            {"component": "Test:1", "cmd": "setScalars", "parameters": {"bad": 1}},
+            {"component": "Test:1", "cmd": "setScalars", "parameters": {"int0": "1"}},
+            # event condition without event or with an invalid field
+            {
+                "component": "Test:1",
+                "cmd": "setScalars",
+                "event_condition": [{"field": "int0", "value": 1}],
+            },
+            {
+                "component": "Test:1",
+                "cmd": "setScalars",
+                "event": "scalars",
+                "event_condition": [{"field": "noSuchField", "value": 1}],
+            },
+            # event condition with a name that is not an enumeration value
+            {
+                "component": "Test:1",
+                "cmd": "setScalars",
+                "event": "summaryState",
+                "event_condition": [{"field": "summaryState", "value": "BAD"}],
+            },
+            # event condition value with the wrong type for the field
+            {
+                "component": "Test:1",
+                "cmd": "setScalars",
+                "event": "scalars",
+                "event_condition": [{"field": "int0", "value": "3"}],
+            },
+            # two commands of the same stage waiting for the same event
+            {
+                "commands": [
+                    {"component": "Test:1", "cmd": "setScalars", "event": "scalars"},
+                    {"component": "Test:1", "cmd": "wait", "event": "scalars"},
+                ]
+            },
         ):
             with self.subTest(bad_config=bad_config):
                 async with self.make_script():
@@ -133,6 +183,168 @@ class TestRunCommand(
             )
             assert self.controller.evt_scalars.data.string0 == "12345"
 
+    async def test_configure_commands(self):
+        async with self.make_script():
+            await self.configure_script(
+                commands=[
+                    dict(component="Test:1", cmd="setScalars", event="scalars"),
+                    dict(
+                        component="Test:1",
+                        cmd="setScalars",
+                        parameters={"float0": 1.0},
+                        stage=1,
+                    ),
+                    dict(component="Test:1", cmd="wait", event="arrays", stage=1),
+                ],
+                max_concurrency=2,
+            )
+
+            # The remote is only created once, with all the events.
+            assert list(self.script.remotes) == [("Test", 1)]
+            assert [len(stage) for stage in self.script.stages] == [1, 2]
+            assert self.script.entries[0].flush
+            assert self.script.entries[1].data.float0 == pytest.approx(1.0)
+            assert self.script.entries[0].data.float0 == pytest.approx(0.0)
+
+    async def test_run_commands(self):
+        async with self.make_script():
+            await self.configure_script(
+                commands=[
+                    dict(
+                        component="Test:1",
+                        cmd="setScalars",
+                        event="scalars",
+                        parameters={"float0": 1.0, "string0": "first"},
+                    ),
+                    dict(
+                        component="Test:1",
+                        cmd="setScalars",
+                        event="scalars",
+                        parameters={"float0": 2.0, "string0": "second"},
+                        stage=1,
+                    ),
+                ],
+            )
+
+            await self.run_script()
+
+            # Stages run in order.
+            assert self.controller.evt_scalars.data.float0 == pytest.approx(2.0)
+            assert self.controller.evt_scalars.data.string0 == "second"
+            for entry in self.script.entries:
+                assert not entry.error
+                assert entry.cmd_latency is not None
+                assert entry.event_latency is not None
+
+    async def test_run_commands_concurrent(self):
+        async with self.make_script():
+            await self.configure_script(
+                commands=[
+                    dict(
+                        component="Test:1",
+                        cmd="setScalars",
+                        event="scalars",
+                        parameters={"string0": "scalars"},
+                    ),
+                    dict(
+                        component="Test:1",
+                        cmd="setArrays",
+                        event="arrays",
+                        parameters={"int0": [1, 2, 3, 4, 5]},
+                    ),
+                ],
+                max_concurrency=2,
+            )
+            self.controller.cmd_setArrays.callback = self.set_arrays_callback
+
+            assert [len(stage) for stage in self.script.stages] == [2]
+
+            await self.run_script()
+
+            assert self.controller.evt_scalars.data.string0 == "scalars"
+            assert list(self.controller.evt_arrays.data.int0) == [1, 2, 3, 4, 5]
+            for entry in self.script.entries:
+                assert not entry.error
+                assert entry.cmd_latency is not None
+                assert entry.event_latency is not None
+
+    async def test_run_commands_failed(self):
+        async with self.make_script():
+            await self.configure_script(
+                commands=[
+                    dict(
+                        component="Test:1",
+                        cmd="setScalars",
+                        event="scalars",
+                        event_timeout=0.5,
+                        parameters={"int0": 1},
+                    ),
+                    dict(
+                        component="Test:1",
+                        cmd="setScalars",
+                        parameters={"int0": 2},
+                        stage=1,
+                    ),
+                ],
+            )
+            # The controller does not output the scalars event.
+            self.controller.cmd_setScalars.callback = self.ignore_callback
+
+            await self.run_script(expected_final_state=ScriptState.FAILED)
+
+            assert self.script.entries[0].error
+            # The following stage does not run.
+            assert self.script.entries[1].cmd_latency is None
+
+    async def test_run_event_condition(self):
+        async with self.make_script():
+            await self.configure_script(
+                component="Test:1",
+                cmd="setScalars",
+                event="scalars",
+                event_condition=[dict(field="int0", op=">=", value=3)],
+                parameters={"int0": 5},
+            )
+            self.controller.cmd_setScalars.callback = self.set_scalars_ramp_callback
+
+            await self.run_script()
+
+            entry = self.script.entries[0]
+            assert entry.event_condition == [("int0", ">=", 3)]
+            assert entry.event_latency is not None
+            # The first sample that satisfies the condition is the match.
+            assert entry.event_data.int0 == 3
+
+    async def test_configure_event_condition_enum(self):
+        async with self.make_script():
+            await self.configure_script(
+                component="Test:1",
+                cmd="setScalars",
+                event="summaryState",
+                event_condition=[dict(field="summaryState", value="ENABLED")],
+            )
+
+            entry = self.script.entries[0]
+            assert entry.event_condition == [
+                ("summaryState", "==", salobj.State.ENABLED)
+            ]
+
+    async def test_run_event_condition_timeout(self):
+        async with self.make_script():
+            await self.configure_script(
+                component="Test:1",
+                cmd="setScalars",
+                event="scalars",
+                event_timeout=1,
+                event_condition=[dict(field="int0", value=10)],
+                parameters={"int0": 5},
+            )
+            self.controller.cmd_setScalars.callback = self.set_scalars_ramp_callback
+
+            await self.run_script(expected_final_state=ScriptState.FAILED)
+
+            assert "int0 == 10" in self.script.entries[0].error
+
     async def test_executable(self):
         scripts_dir = standardscripts.get_scripts_dir()
         script_path = scripts_dir / "set_summary_state.py"
@@ -19,9 +19,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+from unittest import mock
+
+import pytest
 from lsst.ts import salobj
 from lsst.ts.standardscripts import get_scripts_dir
-from lsst.ts.standardscripts.scheduler.add_block import AddBlock
+from lsst.ts.standardscripts.scheduler.add_block import AddBlock, validate_blocks
 from lsst.ts.standardscripts.scheduler.testutils import BaseSchedulerTestCase
 from lsst.ts.xml.enums.Scheduler import SalIndex
 
@@ -56,6 +59,77 @@ class TestSchedulerAddBlock(BaseSchedulerTestCase):
 
             self.assert_loaded_observing_blocks(observing_blocks=[])
 
+    async def test_single_block_run(self) -> None:
+        async with self.make_script(), self.make_controller(
+            initial_state=salobj.State.ENABLED, publish_initial_state=True
+        ):
+            await self.configure_script(id="invalid_block")
+
+            with mock.patch.object(self.script, "checkpoint") as checkpoint:
+                with pytest.raises(salobj.AckError):
+                    await self.script.run()
+
+            checkpoint.assert_awaited_once_with("Loading invalid_block into scheduler")
+
+    async def test_valid_blocks(self) -> None:
+        async with self.make_script(), self.make_controller(
+            initial_state=salobj.State.ENABLED, publish_initial_state=True
+        ):
+            block_id = self.controller.valid_observing_block_id
+            await self.configure_script(
+                blocks=[dict(id=block_id), dict(id=block_id, override=dict(a=1))]
+            )
+            await self.run_script()
+
+            self.assert_loaded_observing_blocks(observing_blocks=[block_id, block_id])
+            assert [result.success for result in self.script.block_results] == [
+                True,
+                True,
+            ]
+
+    async def test_blocks_with_invalid_block(self) -> None:
+        async with self.make_script(), self.make_controller(
+            initial_state=salobj.State.ENABLED, publish_initial_state=True
+        ):
+            block_id = self.controller.valid_observing_block_id
+            await self.configure_script(
+                blocks=[dict(id="invalid_block"), dict(id=block_id)]
+            )
+
+            with self.assertRaises(AssertionError):
+                await self.run_script()
+
+            self.assert_loaded_observing_blocks(observing_blocks=[block_id])
+            assert [result.success for result in self.script.block_results] == [
+                False,
+                True,
+            ]
+
+    async def test_configure_errors(self) -> None:
+        for bad_config in (
+            dict(),
+            dict(id="  "),
+            dict(blocks=[]),
+            dict(id="a", blocks=[dict(id="b")]),
+            dict(id="a", override=dict(a=1), blocks=[dict(id="b")]),
+            dict(blocks=[dict(id="a")], override=dict(a=1)),
+            dict(blocks=[dict(id="a"), dict(id="")]),
+        ):
+            with self.subTest(bad_config=bad_config):
+                async with self.make_script():
+                    with pytest.raises(salobj.ExpectedError):
+                        await self.configure_script(**bad_config)
+
+    def test_validate_blocks(self) -> None:
+        assert validate_blocks([("a", None), ("b", dict(c=1))]) == [
+            ("a", "null\n...\n"),
+            ("b", "c: 1\n"),
+        ]
+
+        # A tuple is dumped as a YAML list, which loads as a list.
+        with pytest.raises(ValueError, match="2 of 3 BLOCKs"):
+            validate_blocks([("a", None), ("b", dict(c=(1, 2))), (" ", None)])
+
     async def test_correct_queue(self) -> None:
         async with self.make_script(), self.make_controller(
             initial_state=salobj.State.ENABLED, publish_initial_state=True
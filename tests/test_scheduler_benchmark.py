@@ -0,0 +1,171 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import unittest
+
+from lsst.ts import salobj
+from lsst.ts.standardscripts.scheduler import SetDesiredState
+from lsst.ts.standardscripts.scheduler.add_block import AddBlock
+from lsst.ts.standardscripts.scheduler.bring_up import BringUp
+from lsst.ts.standardscripts.scheduler.enable import Enable
+from lsst.ts.standardscripts.scheduler.load_snapshot import LoadSnapshot
+from lsst.ts.standardscripts.scheduler.resume import Resume
+from lsst.ts.standardscripts.scheduler.stop import Stop
+from lsst.ts.standardscripts.scheduler.testutils import BaseSchedulerTestCase
+from lsst.ts.xml.enums.Scheduler import SalIndex
+from lsst.ts.xml.enums.Script import ScriptState
+
+# Number of runs of each script, increase it for more stable percentiles.
+N_RUNS = int(os.environ.get("SCHEDULER_BENCHMARK_RUNS", 3))
+
+COMMANDS = (
+    "disable",
+    "enable",
+    "standby",
+    "start",
+    "load",
+    "resume",
+    "stop",
+    "addBlock",
+)
+
+
+# Command timeout of the scripts in the dropped acks benchmark (sec).
+DROPPED_ACK_TIMEOUT = 2.0
+
+
+def make_standby(index, scheduler_index):
+    return SetDesiredState(
+        index=index,
+        descr="Standby Scheduler",
+        scheduler_index=scheduler_index,
+        desired_state=salobj.State.STANDBY,
+    )
+
+
+def make_resume_short_timeout(index, scheduler_index):
+    script = Resume(index=index, scheduler_index=scheduler_index)
+    script.timeout_start = DROPPED_ACK_TIMEOUT
+    return script
+
+
+# Script class, configuration and initial Scheduler state.
+SCRIPTS = dict(
+    standby=(make_standby, dict(), salobj.State.DISABLED),
+    enable=(Enable, dict(config="valid_test_config.yaml"), salobj.State.STANDBY),
+    load_snapshot=(LoadSnapshot, dict(snapshot="latest"), salobj.State.ENABLED),
+    add_block=(AddBlock, dict(id="valid-block"), salobj.State.ENABLED),
+    resume=(Resume, dict(), salobj.State.ENABLED),
+    stop=(Stop, dict(), salobj.State.ENABLED),
+    bring_up=(
+        BringUp,
+        dict(
+            steps=[
+                dict(type="enable", config="valid_test_config.yaml"),
+                dict(type="load_snapshot", snapshot="latest"),
+                dict(type="add_block", id="valid-block"),
+                dict(type="resume"),
+            ]
+        ),
+        salobj.State.STANDBY,
+    ),
+)
+
+
+class TestSchedulerBenchmark(BaseSchedulerTestCase):
+    """Benchmark the scheduler scripts against a MockScheduler with
+    realistic command latencies and injected faults.
+    """
+
+    async def basic_make_script(self, index):
+        self.script = self.script_class(
+            index=index + 100000,
+            scheduler_index=SalIndex.MAIN_TEL,
+        )
+        return [self.script]
+
+    async def test_benchmark_scripts(self):
+        command_latency = {command: (0.05, 0.2) for command in COMMANDS}
+
+        for name, (script_class, config, initial_state) in SCRIPTS.items():
+            with self.subTest(script=name):
+                self.script_class = script_class
+                benchmark = await self.run_benchmark(
+                    n_runs=N_RUNS,
+                    config=config,
+                    initial_state=initial_state,
+                    command_latency=command_latency,
+                    seed=42,
+                )
+
+                # No command should have timed out.
+                assert benchmark.p99 < self.script.timeout_start
+
+    async def test_benchmark_command_errors(self):
+        self.script_class = AddBlock
+        benchmark = await self.run_benchmark(
+            n_runs=N_RUNS,
+            config=dict(id="valid-block"),
+            initial_state=salobj.State.ENABLED,
+            expected_script_state=ScriptState.FAILED,
+            error_probability=dict(addBlock=1.0),
+        )
+
+        # A rejected command fails the script right away.
+        assert self.controller.n_injected_errors == 1
+        assert benchmark.p99 < self.script.timeout_start
+
+    async def test_benchmark_dropped_acks(self):
+        self.script_class = make_resume_short_timeout
+        benchmark = await self.run_benchmark(
+            n_runs=1,
+            config=dict(),
+            initial_state=salobj.State.ENABLED,
+            expected_script_state=ScriptState.FAILED,
+            drop_ack_probability=dict(resume=1.0),
+        )
+
+        # A command that is never acknowledged fails the script when it
+        # times out.
+        assert self.controller.n_dropped_acks == 1
+        assert not self.controller.running
+        assert benchmark.p99 >= DROPPED_ACK_TIMEOUT
+        assert benchmark.p99 < DROPPED_ACK_TIMEOUT * 5
+
+    async def test_benchmark_delayed_heartbeat(self):
+        self.script_class = Enable
+        benchmark = await self.run_benchmark(
+            n_runs=1,
+            config=dict(config="valid_test_config.yaml"),
+            initial_state=salobj.State.STANDBY,
+            expected_script_state=ScriptState.FAILED,
+            heartbeat_delay=salobj.base_script.HEARTBEAT_INTERVAL * 2,
+        )
+
+        # The liveliness check gives up after one heartbeat interval.
+        assert benchmark.p99 < salobj.base_script.HEARTBEAT_INTERVAL * 2
+        assert self.controller.n_commands["start"] == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import pytest
+from lsst.ts import salobj
+from lsst.ts.standardscripts import get_scripts_dir
+from lsst.ts.standardscripts.scheduler.bring_up import BringUp
+from lsst.ts.standardscripts.scheduler.testutils import BaseSchedulerTestCase
+from lsst.ts.xml.enums.Scheduler import SalIndex
+from lsst.ts.xml.enums.Script import ScriptState
+
+
+class TestSchedulerBringUp(BaseSchedulerTestCase):
+    async def basic_make_script(self, index):
+        self.script = BringUp(
+            index=index + 100000,
+            scheduler_index=SalIndex.MAIN_TEL,
+        )
+        return [self.script]
+
+    async def test_configure_errors(self) -> None:
+        for bad_config in (
+            dict(),
+            dict(steps=[]),
+            dict(steps=[dict(type="enable")]),
+            dict(steps=[dict(type="resume", config="valid_test_config.yaml")]),
+            dict(steps=[dict(type="add_block")]),
+            dict(steps=[dict(type="add_block", id="a", blocks=[dict(id="b")])]),
+            dict(steps=[dict(type="unknown")]),
+        ):
+            with self.subTest(bad_config=bad_config):
+                async with self.make_script():
+                    with pytest.raises(salobj.ExpectedError):
+                        await self.configure_script(**bad_config)
+
+    async def test_bring_up(self) -> None:
+        async with self.make_script(), self.make_controller(
+            initial_state=salobj.State.STANDBY, publish_initial_state=True
+        ):
+            await self.configure_script(
+                steps=[
+                    dict(type="standby"),
+                    dict(type="enable", config="valid_test_config.yaml"),
+                    dict(type="load_snapshot", snapshot="latest"),
+                    dict(type="add_block", id=self.controller.valid_observing_block_id),
+                    dict(type="resume"),
+                ]
+            )
+            await self.run_script()
+
+            self.assert_run(
+                expected_commands=dict(
+                    standby=0,
+                    start=1,
+                    enable=1,
+                    disable=0,
+                ),
+                expected_overrides=["valid_test_config.yaml"],
+                expected_script_state=ScriptState.DONE,
+                expected_csc_state=salobj.State.ENABLED,
+            )
+            self.assert_loaded_snapshots(snapshots=[self.controller.valid_snapshot])
+            self.assert_loaded_observing_blocks(
+                observing_blocks=[self.controller.valid_observing_block_id]
+            )
+            assert self.controller.running
+            assert [
+                (timing.type, timing.skipped) for timing in self.script.step_timings
+            ] == [
+                ("standby", True),
+                ("enable", False),
+                ("load_snapshot", False),
+                ("add_block", False),
+                ("resume", False),
+            ]
+
+    async def test_skip_enabled(self) -> None:
+        async with self.make_script(), self.make_controller(
+            initial_state=salobj.State.ENABLED, publish_initial_state=True
+        ):
+            await self.configure_script(
+                steps=[dict(type="enable", config="valid_test_config.yaml")]
+            )
+            await self.run_script()
+
+            self.assert_run(
+                expected_commands=dict(
+                    standby=0,
+                    start=0,
+                    enable=0,
+                    disable=0,
+                ),
+                expected_overrides=[],
+                expected_script_state=ScriptState.DONE,
+                expected_csc_state=salobj.State.ENABLED,
+            )
+
+    async def test_wrong_queue(self) -> None:
+        async with self.make_script(), self.make_controller(
+            initial_state=salobj.State.STANDBY, publish_initial_state=True
+        ):
+            self.script.salinfo.index = 200100
+            await self.configure_script(
+                steps=[dict(type="enable", config="valid_test_config.yaml")]
+            )
+            with self.assertRaises(AssertionError):
+                await self.run_script()
+
+    async def test_ocs_executable(self):
+        scripts_dir = get_scripts_dir()
+        script_path = scripts_dir / "ocs" / "scheduler" / "bring_up.py"
+        await self.check_executable(script_path)
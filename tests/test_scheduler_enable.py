@@ -19,7 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import logging
+import time
 import unittest
 
 import pytest
@@ -30,6 +32,16 @@ from lsst.ts.standardscripts.scheduler.testutils import BaseSchedulerTestCase
 from lsst.ts.xml.enums.Scheduler import SalIndex
 from lsst.ts.xml.enums.Script import ScriptState
 
+STD_TIMEOUT = 10.0
+
+# State transition commands to enable the Scheduler from each state.
+EXPECTED_STATE_COMMANDS = {
+    salobj.State.STANDBY: ["start", "enable"],
+    salobj.State.DISABLED: ["standby", "start", "enable"],
+    salobj.State.ENABLED: ["disable", "standby", "start", "enable"],
+    salobj.State.FAULT: ["standby", "start", "enable"],
+}
+
 
 class TestSchedulerBaseEnable(BaseSchedulerTestCase):
     async def basic_make_script(self, index):
@@ -268,6 +280,91 @@ class TestSchedulerBaseEnable(BaseSchedulerTestCase):
                 expected_csc_state=salobj.State.ENABLED,
             )
 
+    async def test_run_no_historical_data_latency(self):
+        """Measure how long it takes to enable the Scheduler when there is no
+        summary state information available.
+        """
+        for initial_state in (
+            salobj.State.STANDBY,
+            salobj.State.DISABLED,
+            salobj.State.ENABLED,
+            salobj.State.FAULT,
+        ):
+            with self.subTest(initial_state=initial_state):
+                async with self.make_script(
+                    randomize_topic_subname=True
+                ), self.make_controller(
+                    initial_state=initial_state, publish_initial_state=False
+                ):
+                    await self.configure_script(config="valid_test_config.yaml")
+                    start_time = time.monotonic()
+                    await self.run_script()
+                    duration = time.monotonic() - start_time
+
+                    self.script.log.info(
+                        f"Enable from {initial_state!r} with no historical data "
+                        f"took {duration:0.2f}s."
+                    )
+                    assert (
+                        self.controller.evt_summaryState.data.summaryState
+                        == salobj.State.ENABLED
+                    )
+                    # None of the state transition commands should time out.
+                    assert duration < self.script.timeout_start
+
+    async def wait_checkpoint(self, name):
+        """Wait for the script to reach a checkpoint."""
+        while self.script.last_checkpoint != name:
+            await asyncio.sleep(0.1)
+
+    async def test_run_summary_state_published_early(self):
+        """Test the transitions when the Scheduler publishes its summary
+        state before the script starts.
+        """
+        for initial_state, expected_commands in EXPECTED_STATE_COMMANDS.items():
+            with self.subTest(initial_state=initial_state):
+                async with self.make_script(
+                    randomize_topic_subname=True
+                ), self.make_controller(
+                    initial_state=initial_state, publish_initial_state=True
+                ):
+                    await self.configure_script(config="valid_test_config.yaml")
+                    await self.run_script()
+
+                    assert self.controller.state_commands == expected_commands
+                    assert self.controller.overrides == ["valid_test_config.yaml"]
+                    # The summary state was cached, so the shortest path
+                    # for unknown states was not needed.
+                    assert self.script.state_transition_times == []
+
+    async def test_run_summary_state_published_late(self):
+        """Test the transitions when the Scheduler publishes its summary
+        state after the script starts.
+        """
+        for initial_state, expected_commands in EXPECTED_STATE_COMMANDS.items():
+            with self.subTest(initial_state=initial_state):
+                async with self.make_script(
+                    randomize_topic_subname=True
+                ), self.make_controller(
+                    initial_state=initial_state, publish_initial_state=False
+                ):
+                    await self.configure_script(config="valid_test_config.yaml")
+                    self.script.timeout_summary_state = STD_TIMEOUT
+
+                    run_task = asyncio.create_task(self.run_script())
+                    await asyncio.wait_for(
+                        self.wait_checkpoint("Handling no summary state information"),
+                        timeout=STD_TIMEOUT,
+                    )
+                    await self.controller.evt_summaryState.write()
+                    await asyncio.wait_for(run_task, timeout=STD_TIMEOUT)
+
+                    assert self.controller.state_commands == expected_commands
+                    assert self.controller.overrides == ["valid_test_config.yaml"]
+                    assert [
+                        command for command, _ in self.script.state_transition_times
+                    ] == expected_commands
+
     async def test_correct_queue(self) -> None:
         async with self.make_script(), self.make_controller(
             initial_state=salobj.State.ENABLED, publish_initial_state=True
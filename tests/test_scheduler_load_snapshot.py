@@ -19,9 +19,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import io
+import unittest
+from unittest import mock
+
 import pytest
+from astropy.time import Time
 from lsst.ts import salobj
 from lsst.ts.standardscripts import get_scripts_dir
+from lsst.ts.standardscripts.scheduler import SnapshotIndex
 from lsst.ts.standardscripts.scheduler.load_snapshot import LoadSnapshot
 from lsst.ts.standardscripts.scheduler.testutils import BaseSchedulerTestCase
 from lsst.ts.xml.enums.Scheduler import SalIndex
@@ -53,6 +59,24 @@ class TestSchedulerBaseLoadSnapshot(BaseSchedulerTestCase):
 
             self.assert_loaded_snapshots(snapshots=[self.controller.valid_snapshot])
 
+    async def test_latest_before(self) -> None:
+        async with self.make_script(), self.make_controller(
+            initial_state=salobj.State.ENABLED, publish_initial_state=True
+        ):
+            await self.configure_script(snapshot=dict(latest_before=Time.now().isot))
+            await self.run_script()
+
+            self.assert_loaded_snapshots(snapshots=[self.controller.valid_snapshot])
+
+    async def test_fail_config_latest_before(self) -> None:
+        async with self.make_script(), self.make_controller(
+            initial_state=salobj.State.ENABLED, publish_initial_state=True
+        ):
+            with pytest.raises(salobj.ExpectedError):
+                await self.configure_script(
+                    snapshot=dict(latest_before="2000-01-01T00:00:00")
+                )
+
     async def test_invalid_uri(self) -> None:
         async with self.make_script(), self.make_controller(
             initial_state=salobj.State.ENABLED, publish_initial_state=True
@@ -93,3 +117,87 @@ class TestSchedulerBaseLoadSnapshot(BaseSchedulerTestCase):
         scripts_dir = get_scripts_dir()
         script_path = scripts_dir / "ocs" / "scheduler" / "load_snapshot.py"
         await self.check_executable(script_path)
+
+
+class TestSnapshotIndex(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.s3bucket = salobj.AsyncS3Bucket(
+            name=salobj.AsyncS3Bucket.make_bucket_name(s3instance="mock"),
+            create=True,
+            domock=True,
+        )
+        self.snapshot_index = SnapshotIndex(
+            scheduler_index=SalIndex.MAIN_TEL, s3bucket=self.s3bucket
+        )
+
+    def tearDown(self) -> None:
+        self.s3bucket.stop_mock()
+
+    def make_snapshot_key(self, date: Time) -> str:
+        return self.s3bucket.make_key(
+            salname="Scheduler",
+            salindexname=int(SalIndex.MAIN_TEL),
+            generator="Scheduler:1",
+            date=date,
+            suffix=".p",
+        )
+
+    async def test_select(self) -> None:
+        assert self.snapshot_index.latest() is None
+
+        for time, url in ((3.0, "file:///c.p"), (1.0, "file:///a.p")):
+            self.snapshot_index.add(url=url, time=time)
+        self.snapshot_index.add(url="file:///a.p", time=1.0)
+
+        assert len(self.snapshot_index) == 2
+        assert self.snapshot_index.latest().url == "file:///c.p"
+        assert self.snapshot_index.latest_before(3.0).url == "file:///a.p"
+        assert self.snapshot_index.latest_before(3.5).url == "file:///c.p"
+        assert self.snapshot_index.latest_before(1.0) is None
+
+    async def test_refresh_and_exists(self) -> None:
+        key = self.make_snapshot_key(Time("2024-03-01T12:00:00", scale="tai"))
+        await self.s3bucket.upload(fileobj=io.BytesIO(b"snapshot"), key=key)
+
+        await self.snapshot_index.refresh()
+
+        latest_snapshot = self.snapshot_index.latest()
+        assert latest_snapshot.size == len(b"snapshot")
+        assert self.snapshot_index.get_key(latest_snapshot.url) == key
+        assert await self.snapshot_index.exists(latest_snapshot.url)
+
+        missing_url = latest_snapshot.url.replace(".p", "_missing.p")
+        assert not await self.snapshot_index.exists(missing_url)
+        assert await self.snapshot_index.exists("https://example.com/a.p") is None
+        with pytest.raises(ValueError):
+            await self.snapshot_index.exists("invalid")
+
+    async def test_refresh_persisted(self) -> None:
+        old_key = self.make_snapshot_key(Time("2024-03-01T12:00:00", scale="tai"))
+        await self.s3bucket.upload(fileobj=io.BytesIO(b"old"), key=old_key)
+        await self.snapshot_index.refresh()
+
+        assert len(self.snapshot_index) == 1
+        assert await self.s3bucket.exists(self.snapshot_index.index_key)
+
+        new_key = self.make_snapshot_key(Time.now())
+        await self.s3bucket.upload(fileobj=io.BytesIO(b"new"), key=new_key)
+
+        # The index of the next script reads the persisted index and only
+        # lists the observing days since the last refresh.
+        snapshot_index = SnapshotIndex(
+            scheduler_index=SalIndex.MAIN_TEL, s3bucket=self.s3bucket
+        )
+        with mock.patch.object(
+            snapshot_index, "_list_objects", wraps=snapshot_index._list_objects
+        ) as list_objects:
+            await snapshot_index.refresh()
+            snapshot_url = snapshot_index.resolve("latest")
+
+        assert len(snapshot_index) == 2
+        assert snapshot_index.get_key(snapshot_url) == new_key
+        assert list_objects.await_count > 0
+        for call in list_objects.await_args_list:
+            (prefix,) = call.args
+            assert prefix.startswith(f"{snapshot_index.key_prefix}Scheduler:1/")
+            assert not old_key.startswith(prefix)
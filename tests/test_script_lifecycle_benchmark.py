@@ -0,0 +1,300 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import logging
+import os
+import types
+import unittest
+import unittest.mock
+
+from lsst.ts import salobj, standardscripts
+from lsst.ts.standardscripts.base_focus_sweep import BaseFocusSweep
+from lsst.ts.standardscripts.base_take_aos_sequence import BaseTakeAOSSequence
+from lsst.ts.standardscripts.base_take_image import BaseTakeImage
+from lsst.ts.standardscripts.base_track_target import BaseTrackTarget
+
+# Number of runs of each case, increase it for more stable results.
+N_RUNS = int(os.environ.get("SCRIPT_BENCHMARK_RUNS", 1))
+
+# Number of exposures, steps or sequences of each case.
+SIZES = (2, 10, 100)
+
+# Number of CSCs commanded by each case.
+N_CSCS = (1, 4)
+
+SUITE = "script_lifecycle"
+
+PHASES = ("configure", "set_metadata", "checkpoint", "run")
+
+
+class GenericTakeImage(BaseTakeImage):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Generic take image")
+        self.mock_tcs = standardscripts.make_mock_group()
+        self.mock_camera = standardscripts.make_mock_group()
+
+    @property
+    def tcs(self):
+        return self.mock_tcs
+
+    @property
+    def camera(self):
+        return self.mock_camera
+
+    @staticmethod
+    def get_available_imgtypes():
+        return ["OBJECT"]
+
+    def get_instrument_configuration(self):
+        return dict()
+
+    def get_instrument_name(self):
+        return "GenericCam"
+
+
+class GenericTrackTarget(BaseTrackTarget):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Generic track target")
+        self.mock_tcs = standardscripts.make_mock_group()
+
+    @property
+    def tcs(self):
+        return self.mock_tcs
+
+
+class GenericFocusSweep(BaseFocusSweep):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Generic focus sweep")
+        self.mock_tcs = standardscripts.make_mock_group()
+        self.mock_camera = standardscripts.make_mock_group(
+            take_focus=unittest.mock.AsyncMock(return_value=[1])
+        )
+        self.ocps = standardscripts.make_mock_group()
+
+    @property
+    def tcs(self):
+        return self.mock_tcs
+
+    async def configure_tcs(self):
+        pass
+
+    @property
+    def camera(self):
+        return self.mock_camera
+
+    async def configure_camera(self):
+        pass
+
+    async def move_hexapod(self, axis, value):
+        await self.tcs.move_camera_hexapod(**{axis: value})
+
+    def get_instrument_configuration(self):
+        return dict()
+
+    def get_instrument_filter(self):
+        return "r"
+
+    def get_instrument_name(self):
+        return "GenericCam"
+
+
+class GenericTakeAOSSequence(BaseTakeAOSSequence):
+    def __init__(self, index):
+        super().__init__(index=index, descr="Generic take AOS sequence")
+        visit_id = 2026101800001
+        self.mock_camera = standardscripts.make_mock_group(
+            take_cwfs=unittest.mock.AsyncMock(return_value=[visit_id])
+        )
+        self.mock_oods = unittest.mock.MagicMock()
+        self.mock_oods.evt_imageInOODS.next = unittest.mock.AsyncMock(
+            return_value=types.SimpleNamespace(
+                obsid="MC_O_20261018_000001", raft="R22", sensor="S11"
+            )
+        )
+        self.mtcs = standardscripts.make_mock_group()
+        self.ocps = standardscripts.make_mock_group()
+
+    @property
+    def camera(self):
+        return self.mock_camera
+
+    async def configure_camera(self):
+        pass
+
+    @property
+    def oods(self):
+        return self.mock_oods
+
+    def get_instrument_name(self):
+        return "GenericCam"
+
+
+class BaseLifecycleBenchmark(standardscripts.BaseScriptTestCase):
+    """Benchmark the overhead of the script lifecycle with mock
+    observatory groups that answer instantly.
+
+    Set the ``LSST_SCRIPT_BENCHMARK_DIR`` environment variable to store
+    the results and compare them with the ones of the previous commit.
+    """
+
+    script_class = None
+
+    def setUp(self) -> None:
+        self.use_temporary_progress_dir()
+
+    async def basic_make_script(self, index):
+        self.script = self.script_class(index=index)
+        return [self.script]
+
+    async def run_case(self, case, config):
+        """Benchmark a configuration, then log and save the results."""
+        benchmark = await self.run_lifecycle_benchmark(config=config, n_runs=N_RUNS)
+
+        log = logging.getLogger(type(self).__name__)
+        phases = {phase: getattr(benchmark, phase) for phase in PHASES}
+        log.info(
+            f"{case:>24s}: "
+            + " ".join(
+                f"{phase}={duration * 1000:0.1f}ms"
+                for phase, duration in phases.items()
+            )
+            + f" n_checkpoints={benchmark.n_checkpoints}"
+        )
+
+        previous_record = standardscripts.load_benchmark_results(
+            SUITE, exclude_commit=standardscripts.get_benchmark_commit()
+        )
+        if standardscripts.save_benchmark_results(SUITE, {case: phases}) is None:
+            return benchmark
+
+        if previous_record is not None:
+            ratios = standardscripts.compare_benchmark_results(
+                {case: phases}, previous_record["results"]
+            )
+            for phase, ratio in ratios.get(case, dict()).items():
+                log.info(
+                    f"{case:>24s}: {phase} x{ratio:0.2f} "
+                    f"vs {previous_record['commit']}"
+                )
+
+        return benchmark
+
+
+class TestTakeImageBenchmark(BaseLifecycleBenchmark, unittest.IsolatedAsyncioTestCase):
+    script_class = GenericTakeImage
+
+    async def test_benchmark(self):
+        for nimages in SIZES:
+            with self.subTest(nimages=nimages):
+                benchmark = await self.run_case(
+                    f"take_image[{nimages}]",
+                    dict(exp_times=0, image_type="OBJECT", nimages=nimages),
+                )
+                assert benchmark.n_checkpoints == nimages + 1
+
+
+class TestTrackTargetBenchmark(
+    BaseLifecycleBenchmark, unittest.IsolatedAsyncioTestCase
+):
+    script_class = GenericTrackTarget
+
+    async def test_benchmark(self):
+        await self.run_case(
+            "track_target",
+            dict(slew_icrs=dict(ra=1.0, dec=-30.0), target_name="benchmark"),
+        )
+        self.script.tcs.slew_icrs.assert_awaited_once()
+
+
+class TestFocusSweepBenchmark(BaseLifecycleBenchmark, unittest.IsolatedAsyncioTestCase):
+    script_class = GenericFocusSweep
+
+    async def test_benchmark(self):
+        for n_steps in SIZES:
+            with self.subTest(n_steps=n_steps):
+                benchmark = await self.run_case(
+                    f"focus_sweep[{n_steps}]",
+                    dict(axis="z", focus_window=100.0, n_steps=n_steps, exp_time=0.0),
+                )
+                # Plus the start and end of the block.
+                assert benchmark.n_checkpoints == n_steps + 2
+
+
+class TestTakeAOSSequenceBenchmark(
+    BaseLifecycleBenchmark, unittest.IsolatedAsyncioTestCase
+):
+    script_class = GenericTakeAOSSequence
+
+    async def test_benchmark(self):
+        for n_sequences in SIZES:
+            with self.subTest(n_sequences=n_sequences):
+                benchmark = await self.run_case(
+                    f"take_aos_sequence[{n_sequences}]",
+                    dict(n_sequences=n_sequences, exposure_time=0.0),
+                )
+                assert benchmark.n_checkpoints == n_sequences
+
+
+class TestSetSummaryStateBenchmark(
+    BaseLifecycleBenchmark, unittest.IsolatedAsyncioTestCase
+):
+    async def basic_make_script(self, index):
+        self.script = standardscripts.SetSummaryState(index=index)
+        self.controllers = [
+            salobj.TestCsc(index=csc_index, initial_state=salobj.State.STANDBY)
+            for csc_index in range(1, self.n_cscs + 1)
+        ]
+        return [self.script, *self.controllers]
+
+    async def test_benchmark(self):
+        for n_cscs in N_CSCS:
+            with self.subTest(n_cscs=n_cscs):
+                self.n_cscs = n_cscs
+                await self.run_case(
+                    f"set_summary_state[{n_cscs}]",
+                    dict(
+                        data=[
+                            (f"Test:{csc_index}", "ENABLED")
+                            for csc_index in range(1, n_cscs + 1)
+                        ]
+                    ),
+                )
+                for controller in self.controllers:
+                    assert controller.summary_state == salobj.State.ENABLED
+
+
+class TestRunCommandBenchmark(BaseLifecycleBenchmark, unittest.IsolatedAsyncioTestCase):
+    async def basic_make_script(self, index):
+        self.script = standardscripts.RunCommand(index=index)
+        self.controller = salobj.TestCsc(index=1)
+        return [self.script, self.controller]
+
+    async def test_benchmark(self):
+        await self.run_case(
+            "run_command",
+            dict(component="Test:1", cmd="setScalars", parameters=dict(int0=1)),
+        )
+        assert self.controller.evt_scalars.data.int0 == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
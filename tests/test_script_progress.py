@@ -0,0 +1,88 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+import unittest
+
+from lsst.ts.standardscripts import ScriptProgress
+
+
+class TestScriptProgress(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_make_key(self):
+        config = dict(axis="z", n_steps=5, resume=False)
+
+        key = ScriptProgress.make_key(
+            script_name="FocusSweep", program="BLOCK-T1", config=config
+        )
+
+        assert key.startswith("FocusSweep_BLOCK-T1_")
+        # The resume flag does not change the key.
+        assert key == ScriptProgress.make_key(
+            script_name="FocusSweep",
+            program="BLOCK-T1",
+            config=dict(axis="z", n_steps=5, resume=True),
+        )
+        # Any other change in the configuration does.
+        assert key != ScriptProgress.make_key(
+            script_name="FocusSweep",
+            program="BLOCK-T1",
+            config=dict(axis="z", n_steps=6),
+        )
+        assert key != ScriptProgress.make_key(
+            script_name="FocusSweep", program="BLOCK-T2", config=config
+        )
+
+    def test_save_load_reset(self):
+        progress = ScriptProgress(key="test", store_dir=self.tmp_dir.name)
+
+        assert not progress.exists
+        assert not progress.load()
+
+        progress.group_id = "2026-10-18T00:00:00.000"
+        progress.save(0, total_focus_offset=-100.0, focus_visit_ids=[1])
+        progress.save(1, total_focus_offset=0.0, focus_visit_ids=[1, 2])
+
+        assert progress.exists
+
+        resumed_progress = ScriptProgress(key="test", store_dir=self.tmp_dir.name)
+
+        assert resumed_progress.load()
+        assert resumed_progress.completed_steps == {0, 1}
+        assert resumed_progress.group_id == progress.group_id
+        assert resumed_progress.state == dict(
+            total_focus_offset=0.0, focus_visit_ids=[1, 2]
+        )
+
+        resumed_progress.reset()
+
+        assert not resumed_progress.exists
+        assert resumed_progress.completed_steps == set()
+        assert resumed_progress.state == dict()
+
+
+if __name__ == "__main__":
+    unittest.main()
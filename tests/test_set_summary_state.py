@@ -266,42 +266,35 @@ class TestSetSummaryState(
                         f"{controller.evt_summaryState.data.summaryState}"
                     )
 
-    async def test_configure_wildcard_index_local_fallback(self):
-        """Test the configure method with a wildcard (*) index
-        using the local fallback for wildcard handling.
-        """
-        from lsst.ts.standardscripts.utils import (
-            WildcardIndexError as LocalWildcardIndexError,
-        )
-        from lsst.ts.standardscripts.utils import (
-            name_to_name_index as local_name_to_name_index,
-        )
-
-        with mock.patch(
-            "lsst.ts.standardscripts.set_summary_state.name_to_name_index",
-            local_name_to_name_index,
-        ), mock.patch(
-            "lsst.ts.standardscripts.set_summary_state.WildcardIndexError",
-            LocalWildcardIndexError,
-        ):
-            await self.run_configure_wildcard_index_test()
+    async def test_configure_wildcard_index(self):
+        await self.run_configure_wildcard_index_test()
 
-    async def test_configure_wildcard_index_salobj(self):
-        """Test the configure method with ts_salobj's native wildcard
-        handling."""
-        try:
-            # Check if WildcardIndexError exists in ts_salobj
-            from lsst.ts.salobj import WildcardIndexError  # noqa: F401
-        except ImportError:
-            pytest.skip("ts_salobj does not yet support WildcardIndexError")
+    async def test_configure_index_list_and_range(self):
+        """Test the configure method with a list and a range of indices."""
+        async with self.make_script():
+            for _ in range(3):
+                await self.add_controller()
+            indices = [controller.salinfo.index for controller in self.controllers]
 
-        await self.run_configure_wildcard_index_test()
+            data = [
+                (f"Test:{indices[0]}-{indices[1]}", "enabled"),
+                (f"Test:{indices[2]},{indices[0]}", "standby", "foo"),
+            ]
+            await self.configure_script(data=data)
+
+            assert self.script.nameind_state_override == [
+                (("Test", indices[0]), salobj.State.ENABLED, ""),
+                (("Test", indices[1]), salobj.State.ENABLED, ""),
+                (("Test", indices[2]), salobj.State.STANDBY, "foo"),
+                (("Test", indices[0]), salobj.State.STANDBY, "foo"),
+            ]
+            assert len(self.script.remotes) == 3
 
     async def test_mute_alarms_when_offline(self):
         """Test that alarms are muted when CSCs are set to OFFLINE with
         mute_alarms=True."""
         async with self.make_script():
-            self.script.watcher = unittest.mock.AsyncMock()
+            self.script.watcher = mock.AsyncMock()
 
             await self.add_test_cscs(initial_state=salobj.State.ENABLED)
             await self.add_test_cscs(initial_state=salobj.State.ENABLED)
@@ -331,27 +324,17 @@ class TestSetSummaryState(
 
             await self.run_script()
 
-            expected_mute_calls = [
-                mock.call(
-                    name=rf"^(Enabled|Heartbeat)\.{name}:{index}",
-                    duration=1860.0,  # mute_duration * 60 secs`
-                    severity=AlarmSeverity.CRITICAL,
-                    mutedBy="set_summary_state script",
-                )
+            offline_name_indices = "|".join(
+                name_ind
                 for controller, name, index, name_ind in csc_info
                 if controller in offline_cscs
-            ]
-
-            self.script.watcher.cmd_mute.set_start.assert_has_awaits(
-                expected_mute_calls, any_order=True
             )
-
-            expected_mute_calls_count = len(offline_cscs)
-            actual_mute_calls_count = self.script.watcher.cmd_mute.set_start.await_count
-            self.assertEqual(
-                actual_mute_calls_count,
-                expected_mute_calls_count,
-                f"Expected {expected_mute_calls_count} mute command(s), but got {actual_mute_calls_count}",
+            # All the CSCs going OFFLINE are muted with a single command.
+            self.script.watcher.cmd_mute.set_start.assert_awaited_once_with(
+                name=rf"^(Enabled|Heartbeat)\.({offline_name_indices})",
+                duration=1860.0,  # mute_duration * 60 secs`
+                severity=AlarmSeverity.CRITICAL,
+                mutedBy="set_summary_state script",
             )
 
             # Verify that CSCs have transitioned to the correct states
@@ -369,6 +352,28 @@ class TestSetSummaryState(
                     f"{actual_state.name}",
                 )
 
+    async def test_get_mute_patterns(self):
+        async with self.make_script():
+            data = [(f"Test:{index}", "OFFLINE") for index in range(1, 13)]
+            data += [("Test:1", "OFFLINE"), ("Test:13", "STANDBY")]
+            await self.configure_script(data=data, mute_alarms=False)
+
+            prefix = r"^(Enabled|Heartbeat)\."
+            all_name_indices = [f"Test:{index}" for index in range(1, 13)]
+            assert self.script.get_mute_patterns() == [
+                f"{prefix}({'|'.join(all_name_indices)})"
+            ]
+
+            self.script.max_mute_pattern_length = 80
+            patterns = self.script.get_mute_patterns()
+            assert len(patterns) > 1
+            assert all(len(pattern) <= 80 for pattern in patterns)
+            assert [
+                name_index
+                for pattern in patterns
+                for name_index in pattern[len(prefix) + 1 : -1].split("|")
+            ] == all_name_indices
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -19,7 +19,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import time
 import unittest
+import unittest.mock
 
 from lsst.ts.standardscripts import BaseScriptTestCase, get_scripts_dir
 from lsst.ts.standardscripts.sleep import Sleep
@@ -50,6 +53,42 @@ class TestSleep(BaseScriptTestCase, unittest.IsolatedAsyncioTestCase):
             # Run the script
             await self.run_script()
 
+    async def test_run_virtual_time(self):
+        async with self.make_script():
+            sleep_for = 3600
+            await self.configure_script(sleep_for=sleep_for)
+
+            t0 = time.monotonic()
+            await self.run_script(virtual_time=True)
+            duration = time.monotonic() - t0
+
+            assert self.virtual_clock.elapsed >= sleep_for
+            assert self.virtual_clock.elapsed < sleep_for + 1
+            assert duration < sleep_for / 10
+
+    async def test_run_virtual_time_timers_after(self):
+        """Test that timers scheduled while running in virtual time are not
+        delayed once the script is done.
+        """
+        async with self.make_script():
+            await self.configure_script(sleep_for=3600)
+
+            run = self.script.run
+            sleep_tasks = []
+
+            async def run_and_schedule_sleep():
+                await run()
+                sleep_tasks.append(asyncio.create_task(asyncio.sleep(0.1)))
+                # Let the task schedule its timer.
+                await asyncio.sleep(0)
+
+            with unittest.mock.patch.object(self.script, "run", run_and_schedule_sleep):
+                await self.run_script(virtual_time=True)
+
+            t0 = time.monotonic()
+            await asyncio.wait_for(sleep_tasks[0], timeout=5)
+            assert time.monotonic() - t0 < 1
+
     async def test_executable(self):
         scripts_dir = get_scripts_dir()
         script_path = scripts_dir / "sleep.py"
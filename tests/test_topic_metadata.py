@@ -0,0 +1,133 @@
+# This file is part of ts_standardscripts
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pytest
+from lsst.ts import salobj, standardscripts
+from lsst.ts.standardscripts import ComponentMetadata, get_component_metadata
+
+
+class TestTopicMetadata(unittest.TestCase):
+    def setUp(self) -> None:
+        get_component_metadata.cache_clear()
+
+    def tearDown(self) -> None:
+        get_component_metadata.cache_clear()
+
+    def test_from_xml(self):
+        metadata = ComponentMetadata.from_xml("Test")
+
+        assert "setScalars" in metadata.command_names
+        assert "scalars" in metadata.event_names
+        assert "heartbeat" in metadata.event_names
+        assert metadata.commands["setScalars"]["float0"] == ["float", 1]
+        assert metadata.commands["setArrays"]["int0"] == ["int", 5]
+        assert not any(
+            field.startswith("private_") or field == "salIndex"
+            for field in metadata.commands["setScalars"]
+        )
+
+    def test_validate(self):
+        metadata = get_component_metadata("Test")
+
+        metadata.validate_command("setScalars", dict(float0=1, string0="a"))
+        metadata.validate_command("setArrays", dict(int0=[1, 2, 3]))
+        metadata.validate_event("scalars")
+
+        for cmd, parameters in (
+            ("noSuchCommand", dict()),
+            ("setScalars", dict(noSuchField=1)),
+            ("setScalars", dict(string0=1)),
+            ("setScalars", dict(int0=1.5)),
+            ("setScalars", dict(int0=True)),
+            ("setScalars", dict(boolean0="true")),
+            ("setScalars", dict(float0=[1.0])),
+            ("setArrays", dict(int0=1)),
+            ("setArrays", dict(int0=[1] * 6)),
+        ):
+            with self.subTest(cmd=cmd, parameters=parameters):
+                with pytest.raises(RuntimeError):
+                    metadata.validate_command(cmd, parameters)
+
+        metadata.validate_event("scalars", fields=["int0", "string0"])
+        with pytest.raises(RuntimeError):
+            metadata.validate_event("noSuchEvent")
+        with pytest.raises(RuntimeError):
+            metadata.validate_event("scalars", fields=["noSuchField"])
+
+        metadata.validate_event(
+            "scalars", values=[("int0", 3), ("float0", 1), ("string0", "a")]
+        )
+        for values in (
+            [("noSuchField", 1)],
+            [("int0", "3")],
+            [("int0", 1.5)],
+            [("string0", 1)],
+        ):
+            with self.subTest(values=values):
+                with pytest.raises(RuntimeError):
+                    metadata.validate_event("scalars", values=values)
+
+    def test_resolve_enum_value(self):
+        metadata = get_component_metadata("Test")
+
+        for value in ("ENABLED", "State.ENABLED", salobj.State.ENABLED):
+            with self.subTest(value=value):
+                resolved_value = metadata.resolve_enum_value(
+                    "summaryState", "summaryState", value
+                )
+                assert resolved_value == salobj.State.ENABLED
+                metadata.validate_event(
+                    "summaryState", values=[("summaryState", resolved_value)]
+                )
+
+        # Only names of integer fields are resolved.
+        assert metadata.resolve_enum_value("scalars", "string0", "ENABLED") == "ENABLED"
+        assert metadata.resolve_enum_value("scalars", "noSuchField", "A") == "A"
+
+        for value in ("NO_SUCH_STATE", "NoSuchEnum.ENABLED"):
+            with self.subTest(value=value):
+                with pytest.raises(RuntimeError):
+                    metadata.resolve_enum_value("summaryState", "summaryState", value)
+
+    def test_get_component_metadata_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(
+            os.environ, {standardscripts.TOPIC_METADATA_DIR_ENV_VAR: tmp_dir}
+        ):
+            metadata = get_component_metadata("Test")
+
+            # Cached in memory...
+            assert get_component_metadata("Test") is metadata
+
+            # ...and persisted for other processes.
+            get_component_metadata.cache_clear()
+            with mock.patch.object(
+                ComponentMetadata, "from_xml", side_effect=RuntimeError
+            ):
+                assert get_component_metadata("Test") == metadata
+
+
+if __name__ == "__main__":
+    unittest.main()
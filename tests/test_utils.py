@@ -19,13 +19,18 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import os
 import pathlib
+import types
 import unittest
 
 import pytest
 from lsst.ts import salobj, standardscripts
-from lsst.ts.standardscripts.utils import find_running_instances
+from lsst.ts.standardscripts.utils import (
+    find_running_instances,
+    get_recent_heartbeat,
+)
 
 
 # class TestUtils(unittest.TestCase):
@@ -59,6 +64,13 @@ class TestUtils(
         print(f"*** predicted path: {predicted_path}")
         assert scripts_dir.samefile(predicted_path)
 
+    def test_get_s3_bucket(self):
+        s3bucket = standardscripts.get_s3_bucket()
+
+        # The bucket is shared by all callers.
+        assert standardscripts.get_s3_bucket() is s3bucket
+        assert s3bucket.name == salobj.AsyncS3Bucket.make_bucket_name(s3instance="mock")
+
     def test_format_as_list(self):
         recurrences = 4
         # Check case of single values sent
@@ -80,6 +92,113 @@ class TestUtils(
             recurrences = 3
             new_list = standardscripts.utils.format_as_list(test_case, recurrences)
 
+    def test_get_topics_time_utc(self):
+        # Include the day of the 2016-12-31 leap second.
+        tai_unix = [1483142400.0, 1483228836.5, 1483228837.0, 1700000000.25]
+        topics = [types.SimpleNamespace(private_sndStamp=value) for value in tai_unix]
+
+        for values in (topics, tai_unix):
+            topics_time = standardscripts.get_topics_time_utc(values)
+            assert list(topics_time.iso) == [
+                standardscripts.get_topic_time_utc(topic).iso for topic in topics
+            ]
+
+            topics_time_unix = standardscripts.get_topics_time_utc_unix(values)
+            assert topics_time_unix.tolist() == pytest.approx(
+                [standardscripts.get_topic_time_utc(topic).unix for topic in topics],
+                abs=1e-6,
+            )
+
+        with pytest.raises(ValueError):
+            standardscripts.get_topics_time_utc_unix([0.0])
+
+    def test_grid_zip(self):
+        grid = standardscripts.Grid(dict(az=[0.0, 90.0, 180.0], el=45.0))
+
+        assert len(grid) == 3
+        assert grid.shape == (3,)
+        assert list(grid) == [(0.0, 45.0), (90.0, 45.0), (180.0, 45.0)]
+        assert grid[1] == (90.0, 45.0)
+        assert grid[-1] == (180.0, 45.0)
+
+        arrays = grid.to_arrays()
+        assert arrays["az"].tolist() == [0.0, 90.0, 180.0]
+        assert arrays["el"].tolist() == [45.0, 45.0, 45.0]
+
+        scalar_grid = standardscripts.Grid(dict(ra=1.0, dec=-30.0))
+        assert list(scalar_grid) == [(1.0, -30.0)]
+
+        with pytest.raises(RuntimeError, match="Got 2 and 3"):
+            standardscripts.Grid(dict(az=[0.0, 90.0], el=[30.0, 45.0, 60.0]))
+
+        with pytest.raises(IndexError):
+            grid[3]
+
+    def test_grid_product(self):
+        grid = standardscripts.Grid(
+            dict(az=[0.0, 90.0], el=[30.0, 60.0], rot=0.0), mode="product"
+        )
+
+        assert len(grid) == 4
+        assert grid.shape == (2, 2, 1)
+        assert list(grid) == [
+            (0.0, 30.0, 0.0),
+            (0.0, 60.0, 0.0),
+            (90.0, 30.0, 0.0),
+            (90.0, 60.0, 0.0),
+        ]
+        assert [grid[i] for i in range(len(grid))] == list(grid)
+
+        arrays = grid.to_arrays()
+        assert arrays["az"].tolist() == [0.0, 0.0, 90.0, 90.0]
+        assert arrays["el"].tolist() == [30.0, 60.0, 30.0, 60.0]
+
+        # Large rasters are not expanded.
+        raster = standardscripts.Grid(
+            dict(ra=list(range(100)), dec=list(range(100))), mode="product"
+        )
+        assert raster.size == 10000
+        assert raster[-1] == (99, 99)
+
+        with pytest.raises(ValueError):
+            standardscripts.Grid(dict(az=[0.0]), mode="bad")
+
+    def test_parse_component_spec(self):
+        parse = standardscripts.parse_component_spec
+
+        assert parse("MTHexapod:1,2") == standardscripts.ComponentSpec(
+            name="MTHexapod", indices=(1, 2)
+        )
+        assert parse("Test:1-3,5,2").indices == (1, 2, 3, 5)
+        assert parse("ATDome").indices == (0,)
+        assert parse("Test:*").needs_discovery
+        assert parse("MT*").needs_discovery
+        assert parse("MT*:1").indices == (1,)
+        assert parse("Test:1-5") is parse("Test:1-5")
+
+        for bad_spec in ("invalid name:5", "Test:", "Test:1-", "Test:a", "Test:5-1"):
+            with self.subTest(bad_spec=bad_spec):
+                with pytest.raises(ValueError):
+                    parse(bad_spec)
+
+    def test_component_spec_expand(self):
+        component_names = ["ATDome", "MTDome", "MTHexapod", "MTMount"]
+        parse = standardscripts.parse_component_spec
+
+        assert parse("MTHexapod:1,2").expand() == [("MTHexapod", 1), ("MTHexapod", 2)]
+        assert parse("MT*D*:0").expand(component_names) == [("MTDome", 0)]
+        assert parse("MT*").match_names(component_names) == [
+            "MTDome",
+            "MTHexapod",
+            "MTMount",
+        ]
+        assert parse("MT*").expand(
+            component_names, running_indices=dict(MTHexapod=[1, 2], MTMount=[0])
+        ) == [("MTHexapod", 1), ("MTHexapod", 2), ("MTMount", 0)]
+
+        with pytest.raises(ValueError):
+            parse("No*Such*").expand(component_names)
+
     async def test_find_running_instances(self):
         """Test find_running_instances utility function."""
         # Create multiple CSCs with same name but different states
@@ -101,6 +220,46 @@ class TestUtils(
             len(component_indices) == 4
         )  # Note: An OFFLINE CSC doesn't have a remote, hence is not discoverable
 
+    async def test_find_running_instances_recently_stopped(self):
+        await self.add_test_cscs(initial_state=salobj.State.STANDBY)
+        await self.add_test_cscs(initial_state=salobj.State.STANDBY)
+
+        # The heartbeat of the stopped CSC is recent, but it is no longer
+        # running.
+        await self.mock_cscs[1].close()
+
+        component, component_indices = await find_running_instances(
+            self.mock_cscs[0].domain, "Test"
+        )
+
+        assert component == "Test"
+        assert component_indices == [1]
+
+    async def test_get_recent_heartbeat(self):
+        await self.add_test_cscs(initial_state=salobj.State.STANDBY)
+        csc = self.mock_cscs[-1]
+
+        async with salobj.Remote(
+            csc.domain, "Test", index=csc.salinfo.index, include=["heartbeat"]
+        ) as remote:
+            heartbeat = await remote.evt_heartbeat.next(flush=True, timeout=5)
+
+            # The cached heartbeat is recent and is returned without waiting.
+            recent_heartbeat = await get_recent_heartbeat(
+                remote.evt_heartbeat, max_age=5, timeout=0.001
+            )
+            assert recent_heartbeat.private_seqNum >= heartbeat.private_seqNum
+
+            # The cached heartbeat is too old, wait for a new one.
+            new_heartbeat = await get_recent_heartbeat(
+                remote.evt_heartbeat, max_age=0, timeout=5
+            )
+            assert new_heartbeat.private_seqNum > heartbeat.private_seqNum
+
+            await csc.close()
+            with pytest.raises(asyncio.TimeoutError):
+                await get_recent_heartbeat(remote.evt_heartbeat, max_age=0, timeout=2)
+
 
 if __name__ == "__main__":
     unittest.main()